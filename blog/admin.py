@@ -1,5 +1,14 @@
 from django.contrib import admin
-from .models import Post, Comment, Category, Tag
+from django.db.models.functions import TruncMonth
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html_join
+from . import archive, surrogate
+from .cache import blog_cache
+from .models import Post, Comment, Category, Tag, OutboxMessage, RequestProfile, Task
+from .paginators import EstimatedCountPaginator
 
 # 관리자 페이지 커스터마이징
 admin.site.site_header = '블로그 관리'
@@ -24,12 +33,19 @@ class TagAdmin(admin.ModelAdmin):
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display = ['title', 'category', 'author', 'views', 'is_public', 'created_at']
-    list_filter = ['is_public', 'category', 'tags', 'created_at']
+    list_display = ['title', 'category', 'author', 'status', 'views', 'is_public', 'created_at']
+    list_filter = ['status', 'is_public', 'category', 'created_at']
+    list_select_related = ['author', 'category']
     search_fields = ['title', 'content']
     prepopulated_fields = {'slug': ('title',)}
-    filter_horizontal = ['tags']
+    autocomplete_fields = ['author', 'category', 'tags']
     readonly_fields = ['views', 'created_at', 'updated_at']
+    actions = ['make_published', 'make_draft', 'make_private']
+    
+    # 큰 테이블: 추정 개수 사용, 전체 개수 쿼리 생략, PK 인덱스 순 정렬
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ordering = ['-pk']
     
     fieldsets = (
         ('기본 정보', {
@@ -39,21 +55,198 @@ class PostAdmin(admin.ModelAdmin):
             'fields': ('content', 'tags')
         }),
         ('설정', {
-            'fields': ('is_public', 'views')
+            'fields': ('status', 'published_at', 'is_public', 'views')
         }),
         ('타임스탬프', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
+    
+    def get_queryset(self, request):
+        # 목록에는 본문이 필요 없음
+        queryset = super().get_queryset(request)
+        if request.resolver_match and request.resolver_match.url_name.endswith('_changelist'):
+            queryset = queryset.defer('content')
+        return queryset
+    
+    # 일괄 변경한 글이 이보다 많으면 글마다 퍼지하지 않고 모든 페이지(taxonomy 키)를 퍼지
+    PURGE_POST_KEYS_LIMIT = 1000
+
+    def _bulk_update(self, request, queryset, message, **values):
+        # update() 는 post_save 시그널을 보내지 않으므로 캐시/월별 보관함/자동완성 색인/앞단 캐시를 직접 갱신
+        # 전체 선택이어도 행을 다 읽지 않도록 달/카테고리는 DISTINCT 로만 읽음 (update 뒤에는 필터 결과가 바뀔 수 있어 먼저)
+        queryset = queryset.order_by()
+        months = list(queryset.annotate(month=TruncMonth('created_at')).values_list('month', flat=True).distinct())
+        category_ids = list(queryset.values_list('category_id', flat=True).distinct())
+        pks = list(queryset.values_list('pk', flat=True)[:self.PURGE_POST_KEYS_LIMIT + 1])
+        updated = queryset.update(**values)
+        blog_cache.invalidate('posts')
+        blog_cache.invalidate('suggest')
+        archive.refresh_months(months)
+        if len(pks) > self.PURGE_POST_KEYS_LIMIT:
+            surrogate.purge(surrogate.TAXONOMY)
+            pks = []
+        surrogate.purge_posts(pks, category_ids)
+        self.message_user(request, message.format(count=updated))
+    
+    @admin.action(description='선택한 게시글 발행')
+    def make_published(self, request, queryset):
+        self._bulk_update(request, queryset, '게시글 {count}개를 발행했습니다.', status='published')
+    
+    @admin.action(description='선택한 게시글 임시저장으로 전환')
+    def make_draft(self, request, queryset):
+        self._bulk_update(request, queryset, '게시글 {count}개를 임시저장으로 바꿨습니다.', status='draft')
+    
+    @admin.action(description='선택한 게시글 비공개')
+    def make_private(self, request, queryset):
+        self._bulk_update(request, queryset, '게시글 {count}개를 비공개로 바꿨습니다.', is_public=False)
 
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
-    list_display = ['author', 'post', 'content_preview', 'created_at']
-    list_filter = ['created_at']
+    list_display = ['author', 'post', 'content_preview', 'is_hidden', 'report_count', 'created_at']
+    list_filter = ['is_hidden', 'created_at']
+    list_select_related = ['author', 'post']
     search_fields = ['content', 'author__username']
+    autocomplete_fields = ['post', 'author']
+    actions = ['hide_comments', 'unhide_comments']
+    
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ordering = ['-pk']
+    
+    def get_queryset(self, request):
+        # 목록에서 게시글은 제목만 표시하므로 게시글 본문은 읽지 않음
+        return super().get_queryset(request).defer('post__content')
     
     def content_preview(self, obj):
         return obj.content[:50] + '...' if len(obj.content) > 50 else obj.content
     content_preview.short_description = '내용 미리보기'
+    
+    def _set_hidden(self, queryset, is_hidden):
+        # update() 는 시그널을 보내지 않으므로 댓글이 달린 게시글 페이지를 앞단 캐시에서 직접 퍼지
+        post_ids = set(queryset.order_by().values_list('post_id', flat=True).distinct())
+        updated = queryset.update(is_hidden=is_hidden, updated_at=timezone.now())
+        surrogate.purge(*map(surrogate.post_key, post_ids))
+        return updated
+    
+    @admin.action(description='선택한 댓글 숨김')
+    def hide_comments(self, request, queryset):
+        updated = self._set_hidden(queryset, True)
+        self.message_user(request, f'댓글 {updated}개를 숨겼습니다.')
+    
+    @admin.action(description='선택한 댓글 숨김 해제')
+    def unhide_comments(self, request, queryset):
+        updated = self._set_hidden(queryset, False)
+        self.message_user(request, f'댓글 {updated}개의 숨김을 해제했습니다.')
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display = ['created_at', 'method', 'path', 'view_name', 'status_code', 'duration_ms',
+                    'query_count', 'mode', 'trigger', 'user']
+    list_filter = ['mode', 'trigger', 'view_name']
+    search_fields = ['path']
+    list_select_related = ['user']
+    date_hierarchy = 'created_at'
+    exclude = ['pstats_data', 'collapsed']
+    readonly_fields = ['method', 'path', 'view_name', 'user', 'status_code', 'duration_ms',
+                       'query_count', 'sql_ms', 'mode', 'trigger', 'created_at', 'downloads', 'summary']
+    
+    def get_queryset(self, request):
+        # 목록에서는 큰 프로파일 데이터를 읽지 않음
+        return super().get_queryset(request).defer('summary', 'collapsed', 'pstats_data')
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def get_urls(self):
+        return [
+            path('<int:pk>/download/<str:kind>/', self.admin_site.admin_view(self.download),
+                 name='blog_requestprofile_download'),
+        ] + super().get_urls()
+    
+    def download(self, request, pk, kind):
+        """pstats 덤프(.prof) 또는 flamegraph collapsed 스택(.txt) 내려받기"""
+        if not self.has_view_permission(request):
+            raise Http404
+        profile = get_object_or_404(RequestProfile, pk=pk)
+        if kind == 'pstats' and profile.pstats_data:
+            response = HttpResponse(bytes(profile.pstats_data), content_type='application/octet-stream')
+            response['Content-Disposition'] = f'attachment; filename="profile-{pk}.prof"'
+        elif kind == 'collapsed' and profile.collapsed:
+            response = HttpResponse(profile.collapsed, content_type='text/plain; charset=utf-8')
+            response['Content-Disposition'] = f'attachment; filename="profile-{pk}.collapsed.txt"'
+        else:
+            raise Http404
+        return response
+    
+    def downloads(self, obj):
+        links = []
+        if obj.pstats_data:
+            links.append(('pstats', 'pstats (.prof)'))
+        if obj.collapsed:
+            links.append(('collapsed', 'flamegraph collapsed (.txt)'))
+        if not links:
+            return '-'
+        return format_html_join(' | ', '<a href="{}">{}</a>', (
+            (reverse('admin:blog_requestprofile_download', args=[obj.pk, kind]), label)
+            for kind, label in links
+        ))
+    downloads.short_description = '내려받기'
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ['name', 'status', 'priority', 'attempts', 'max_attempts', 'run_at', 'created_at', 'finished_at']
+    list_filter = ['status']
+    search_fields = ['name', 'idempotency_key']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    readonly_fields = ['name', 'args', 'kwargs', 'attempts', 'idempotency_key', 'last_error',
+                       'locked_by', 'locked_at', 'created_at', 'finished_at']
+    actions = ['retry_tasks']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('last_error')
+    
+    def has_add_permission(self, request):
+        return False
+    
+    @admin.action(description='선택한 작업 다시 실행')
+    def retry_tasks(self, request, queryset):
+        updated = queryset.exclude(status='running').update(
+            status='queued', run_at=timezone.now(), attempts=0, finished_at=None,
+        )
+        self.message_user(request, f'{updated}개 작업을 대기열에 다시 넣었습니다.')
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'domain', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at']
+    list_filter = ['status']
+    search_fields = ['subject', 'domain']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    exclude = ['mime']
+    readonly_fields = ['from_email', 'recipients', 'domain', 'subject', 'attempts', 'last_error',
+                       'locked_by', 'locked_at', 'created_at', 'sent_at']
+    actions = ['resend_messages']
+    
+    def get_queryset(self, request):
+        # 목록에서는 메일 본문(MIME)을 읽지 않음
+        return super().get_queryset(request).defer('mime', 'last_error')
+    
+    def has_add_permission(self, request):
+        return False
+    
+    @admin.action(description='선택한 메일 다시 발송')
+    def resend_messages(self, request, queryset):
+        updated = queryset.filter(status='dead').update(
+            status='pending', next_attempt_at=timezone.now(), attempts=0,
+        )
+        self.message_user(request, f'발송 포기한 메일 {updated}개를 다시 대기열에 넣었습니다.')
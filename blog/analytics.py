@@ -0,0 +1,358 @@
+"""
+조회 분석 파이프라인
+
+게시글 조회마다 DB 에 쓰지 않고 프로세스 안 버퍼(HitBuffer)에 (시각, 게시글, 유입 호스트)를 모았다가
+BATCH_SIZE 개가 차거나 FLUSH_INTERVAL 초가 지나면 한 번에 내보낸다.
+    - SPOOL_DIR 이 있으면: 배치를 스풀 파일 하나로 원자적으로 기록 (요청 경로에서 DB 를 쓰지 않음)
+      ingest_analytics 명령이 파일을 가져가 적재한다.
+    - 없으면(개발): 버퍼를 내보내는 요청이 바로 적재
+적재(ingest)는 한 트랜잭션에서
+    - 원본 이벤트를 HitEvent 에 일괄 기록 (PostgreSQL: COPY, 그 외: bulk_create)
+    - 시간대별(PostViewBucket), 일별(PostDailyStats), 유입 호스트별(ReferrerDailyStats) 집계에 증가분을 더함
+    - 게시글 누적 조회수(Post.views)에도 같은 증가분끼리 묶어 더함 (조회 요청은 DB 에 쓰지 않음)
+따라서 화면의 조회수는 적재될 때까지(FLUSH_INTERVAL, 스풀을 쓰면 ingest_analytics 실행 주기) 늦게 반영된다.
+대시보드는 집계 테이블만 읽고, 원본과 집계는 prune() 이 보존 기간에 따라 지운다.
+
+버퍼는 프로세스 메모리에 있으므로 워커가 강제 종료되면 마지막 FLUSH_INTERVAL 초 정도의 조회를 잃을 수 있고,
+적재 직후 스풀 파일을 지우기 전에 적재 프로세스가 죽으면 그 파일이 다시 적재(중복 집계)될 수 있다.
+"""
+import atexit
+import io
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import F, Sum
+from django.http.request import split_domain_port
+from django.utils import timezone
+
+from . import metrics, trending
+from .models import HitEvent, Post, PostDailyStats, PostViewBucket, ReferrerDailyStats
+
+logger = logging.getLogger(__name__)
+
+SPOOL_SUFFIX = '.json'
+CLAIMED_SUFFIX = '.ingesting'
+CLAIM_LEASE_SECONDS = 300  # 선점한 스풀 파일이 이보다 오래되면 적재 프로세스가 죽은 것으로 봄
+
+
+def referrer_host(request):
+    """유입 호스트 (직접 방문이나 같은 사이트 안 이동은 빈 값)"""
+    host = urlsplit(request.META.get('HTTP_REFERER', '')).hostname or ''
+    if host == split_domain_port(request.get_host())[0]:
+        return ''
+    return host[:255]
+
+
+class HitBuffer:
+    """프로세스 안 조회 이벤트 버퍼 (스레드 안전)"""
+
+    def __init__(self):
+        self.hits = []
+        self.lock = threading.Lock()
+        self.flushed_at = time.monotonic()
+
+    def add(self, post_id, referrer='', when=None):
+        config = settings.BLOG_ANALYTICS
+        hit = ((when or timezone.now()).timestamp(), post_id, referrer)
+        with self.lock:
+            self.hits.append(hit)
+            due = (
+                len(self.hits) >= config['BATCH_SIZE']
+                or time.monotonic() - self.flushed_at >= config['FLUSH_INTERVAL']
+            )
+        if due:
+            self.flush()
+
+    def flush(self):
+        """모은 이벤트를 스풀 파일 또는 DB 로 내보내고 내보낸 수 반환"""
+        with self.lock:
+            hits, self.hits = self.hits, []
+            self.flushed_at = time.monotonic()
+        if not hits:
+            return 0
+        directory = settings.BLOG_ANALYTICS['SPOOL_DIR']
+        try:
+            if directory:
+                write_spool(directory, hits)
+            else:
+                ingest(hits)
+        except Exception:
+            logger.exception('조회 이벤트 %s건을 내보내지 못했습니다.', len(hits))
+            self._restore(hits)
+            return 0
+        metrics.analytics_events.inc(len(hits), result='spooled' if directory else 'ingested')
+        return len(hits)
+
+    def _restore(self, hits):
+        """내보내지 못한 이벤트를 다음 번에 다시 보내도록 되돌림 (MAX_BUFFER 초과분은 버림)"""
+        with self.lock:
+            room = max(settings.BLOG_ANALYTICS['MAX_BUFFER'] - len(self.hits), 0)
+            self.hits[:0] = hits[-room:] if room else []
+        dropped = len(hits) - min(room, len(hits))
+        if dropped:
+            metrics.analytics_events.inc(dropped, result='dropped')
+
+
+hit_buffer = HitBuffer()
+# 워커 종료 시 남은 이벤트 내보내기
+atexit.register(hit_buffer.flush)
+
+
+def record_hit(request, post):
+    """게시글 조회 1건을 버퍼에 추가"""
+    hit_buffer.add(post.pk, referrer_host(request))
+
+
+# ----- 스풀 파일 -----
+
+def write_spool(directory, hits):
+    """배치 하나를 '{나노초}-{pid}.json' 파일로 원자적으로 기록"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'{time.time_ns()}-{os.getpid()}{SPOOL_SUFFIX}')
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(hits, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def claim_spool_files(directory):
+    """적재할 스풀 파일을 오래된 순으로 하나씩 선점 (이름을 바꿔 다른 적재 프로세스와 겹치지 않게)"""
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(SPOOL_SUFFIX))
+    except FileNotFoundError:
+        return
+    for name in names:
+        path = os.path.join(directory, name)
+        claimed = path + CLAIMED_SUFFIX
+        try:
+            os.rename(path, claimed)
+        except FileNotFoundError:
+            continue  # 다른 프로세스가 먼저 가져감
+        # 선점 시각을 수정 시각으로 남겨 requeue_stale_spool 이 판단하도록
+        os.utime(claimed)
+        yield claimed
+
+
+def _ingest_files(hits, paths):
+    ingest(hits)
+    for path in paths:
+        os.remove(path)
+    metrics.analytics_events.inc(len(hits), result='ingested')
+    return len(hits)
+
+
+def ingest_spool(directory):
+    """스풀 파일을 INGEST_BATCH 개 이벤트 단위로 적재하고 적재한 이벤트 수 반환"""
+    batch_size = settings.BLOG_ANALYTICS['INGEST_BATCH']
+    total = 0
+    hits, paths = [], []
+    for path in claim_spool_files(directory):
+        try:
+            with open(path) as f:
+                hits.extend(json.load(f))
+        except ValueError:
+            logger.error('읽을 수 없는 스풀 파일을 건너뜁니다: %s', path)
+            os.replace(path, path + '.bad')
+            continue
+        paths.append(path)
+        if len(hits) >= batch_size:
+            total += _ingest_files(hits, paths)
+            hits, paths = [], []
+    if paths:
+        total += _ingest_files(hits, paths)
+    return total
+
+
+def requeue_stale_spool(directory):
+    """선점한 채 CLAIM_LEASE_SECONDS 가 지난 스풀 파일(적재 프로세스 비정상 종료)을 다시 적재 대상으로"""
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(CLAIMED_SUFFIX)]
+    except FileNotFoundError:
+        return 0
+    count = 0
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            if time.time() - os.path.getmtime(path) >= CLAIM_LEASE_SECONDS:
+                os.rename(path, path[:-len(CLAIMED_SUFFIX)])
+                count += 1
+        except FileNotFoundError:
+            continue
+    return count
+
+
+# ----- 적재 -----
+
+def ingest(hits):
+    """조회 이벤트 [(유닉스 시각, 게시글 번호, 유입 호스트)] 를 원본/집계 테이블에 한 트랜잭션으로 기록"""
+    if not hits:
+        return
+    using = router.db_for_write(HitEvent)
+    events = [
+        (datetime.fromtimestamp(timestamp, tz=dt_timezone.utc), post_id, referrer)
+        for timestamp, post_id, referrer in hits
+    ]
+    # 그사이 삭제된 게시글은 원본에만 남기고 집계하지 않음
+    existing = set(Post.objects.using(using).filter(
+        pk__in={post_id for _, post_id, _ in events}
+    ).values_list('pk', flat=True))
+
+    totals, hourly, daily, referrers = Counter(), Counter(), Counter(), Counter()
+    for created_at, post_id, referrer in events:
+        if post_id not in existing:
+            continue
+        day = timezone.localdate(created_at)
+        totals[post_id] += 1
+        hourly[post_id, trending.truncate_hour(created_at)] += 1
+        daily[post_id, day] += 1
+        referrers[post_id, day, referrer] += 1
+
+    with transaction.atomic(using=using):
+        insert_events(using, events)
+        add_counts(PostViewBucket, ('post_id', 'hour'), hourly, using)
+        add_counts(PostDailyStats, ('post_id', 'day'), daily, using)
+        add_counts(ReferrerDailyStats, ('post_id', 'day', 'referrer'), referrers, using)
+        add_post_views(totals, using)
+
+
+def _copy_escape(value):
+    return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def insert_events(using, events):
+    """원본 이벤트 일괄 기록 (psycopg2 면 COPY 한 번)"""
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            copy_expert = getattr(cursor, 'copy_expert', None)
+            if copy_expert:
+                data = io.StringIO(''.join(
+                    f'{created_at.isoformat()}\t{post_id}\t{_copy_escape(referrer)}\n'
+                    for created_at, post_id, referrer in events
+                ))
+                table = connection.ops.quote_name(HitEvent._meta.db_table)
+                copy_expert(f'COPY {table} (created_at, post_id, referrer) FROM STDIN', data)
+                return
+    HitEvent.objects.using(using).bulk_create(
+        [HitEvent(created_at=created_at, post_id=post_id, referrer=referrer)
+         for created_at, post_id, referrer in events],
+        batch_size=1000,
+    )
+
+
+def add_counts(model, key_fields, counts, using):
+    """{키 튜플: 증가분} 을 집계 테이블 views 에 더함 - 없는 행은 0으로 만든 뒤 같은 증가분끼리 묶어 UPDATE"""
+    if not counts:
+        return
+    manager = model.objects.using(using)
+    # 동시에 적재하는 프로세스가 있어도 안전하도록 덮어쓰지 않고 더함
+    manager.bulk_create(
+        [model(**dict(zip(key_fields, key))) for key in counts], batch_size=500, ignore_conflicts=True
+    )
+    lookups = {
+        f'{field}__in': {key[index] for key in counts} for index, field in enumerate(key_fields)
+    }
+    by_delta = defaultdict(list)
+    for pk, *key in manager.filter(**lookups).values_list('pk', *key_fields):
+        delta = counts.get(tuple(key))
+        if delta:
+            by_delta[delta].append(pk)
+    for delta, ids in by_delta.items():
+        for start in range(0, len(ids), 500):
+            manager.filter(pk__in=ids[start:start + 500]).update(views=F('views') + delta)
+
+
+def add_post_views(totals, using):
+    """{게시글 번호: 증가분} 을 Post.views 에 더함 - 같은 증가분끼리 묶어 UPDATE (시그널/updated_at 은 건드리지 않음)"""
+    by_delta = defaultdict(list)
+    for post_id, delta in totals.items():
+        by_delta[delta].append(post_id)
+    manager = Post.objects.using(using)
+    for delta, ids in by_delta.items():
+        for start in range(0, len(ids), 500):
+            manager.filter(pk__in=ids[start:start + 500]).update(views=F('views') + delta)
+
+
+# ----- 정리 -----
+
+def _delete_in_chunks(queryset, chunk_size=10000):
+    """큰 범위 삭제를 짧은 트랜잭션 여러 개로 나눠 실행"""
+    deleted = 0
+    while True:
+        ids = list(queryset.values_list('pk', flat=True)[:chunk_size])
+        if not ids:
+            return deleted
+        count, _ = queryset.model.objects.filter(pk__in=ids).delete()
+        deleted += count
+
+
+def prune(now=None):
+    """보존 기간이 지난 원본 이벤트/일별 집계 삭제 - {'events', 'daily', 'referrers'} 삭제 수 반환"""
+    config = settings.BLOG_ANALYTICS
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    return {
+        'events': _delete_in_chunks(
+            HitEvent.objects.filter(created_at__lt=now - timedelta(days=config['EVENT_RETENTION_DAYS']))
+        ),
+        'daily': _delete_in_chunks(
+            PostDailyStats.objects.filter(day__lt=today - timedelta(days=config['DAILY_RETENTION_DAYS']))
+        ),
+        'referrers': _delete_in_chunks(
+            ReferrerDailyStats.objects.filter(day__lt=today - timedelta(days=config['REFERRER_RETENTION_DAYS']))
+        ),
+    }
+
+
+# ----- 대시보드 -----
+
+def _with_percent(rows):
+    """막대 그래프용으로 최댓값 대비 비율(percent) 추가"""
+    peak = max((row['views'] for row in rows), default=0) or 1
+    for row in rows:
+        row['percent'] = round(row['views'] * 100 / peak)
+    return rows
+
+
+def query_author_stats(author_id, days):
+    """작성자 글의 최근 days 일 조회 통계 (집계 테이블만 사용)"""
+    now = timezone.now()
+    today = timezone.localdate(now)
+    start = today - timedelta(days=days - 1)
+    daily_stats = PostDailyStats.objects.filter(post__author_id=author_id, day__gte=start)
+
+    by_day = dict(daily_stats.values_list('day').annotate(total=Sum('views')).order_by())
+    daily = [
+        {'day': start + timedelta(days=offset), 'views': by_day.get(start + timedelta(days=offset), 0)}
+        for offset in range(days)
+    ]
+    hour_start = trending.truncate_hour(now) - timedelta(hours=47)
+    by_hour = dict(PostViewBucket.objects.filter(
+        post__author_id=author_id, hour__gte=hour_start
+    ).values_list('hour').annotate(total=Sum('views')).order_by())
+    hourly = [
+        {'hour': hour_start + timedelta(hours=offset), 'views': by_hour.get(hour_start + timedelta(hours=offset), 0)}
+        for offset in range(48)
+    ]
+    return {
+        'total_views': sum(by_day.values()),
+        'daily': _with_percent(daily),
+        'hourly': _with_percent(hourly),
+        'top_posts': list(daily_stats.values('post_id', 'post__title').annotate(
+            total=Sum('views')
+        ).order_by('-total')[:10]),
+        'categories': list(daily_stats.values('post__category__name').annotate(
+            total=Sum('views')
+        ).order_by('-total')),
+        'referrers': list(ReferrerDailyStats.objects.filter(
+            post__author_id=author_id, day__gte=start
+        ).values('referrer').annotate(total=Sum('views')).order_by('-total')[:10]),
+    }
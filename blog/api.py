@@ -0,0 +1,245 @@
+"""
+읽기 전용 JSON API (v1)
+
+모바일 앱/정적 프런트엔드용. 모델 인스턴스를 만들지 않고 values_list() 로 필요한 컬럼만 읽어 직렬화한다.
+    - fields=id,title,...  필요한 필드만 (게시글 목록은 기본으로 content 를 읽지 않음)
+    - cursor=...           (작성일, id) 키셋 페이지네이션 - 응답의 next 값을 그대로 전달
+    - limit=20             페이지 크기 (최대 MAX_LIMIT)
+모든 응답에 ETag 를 붙이고 If-None-Match 가 같으면 304 를 돌려준다.
+게시글 목록 응답은 blog_cache 'posts' 네임스페이스에 잠시 보관한다 (게시글이 바뀌면 무효화).
+"""
+import binascii
+import hashlib
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from functools import wraps
+
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views.decorators.http import require_safe
+
+from .cache import blog_cache
+from .models import Comment, Post
+from .taxonomy import get_category_or_404, get_tag_or_404, get_taxonomy
+from .views import get_published_posts
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+POST_LIST_CACHE_TIMEOUT = 30
+
+# API 필드 이름 -> values_list() 조회 경로 (None 은 별도 쿼리로 채움)
+POST_FIELDS = {
+    'id': 'id',
+    'title': 'title',
+    'slug': 'slug',
+    'author': 'author__username',
+    'category': 'category__slug',
+    'tags': None,
+    'meta_description': 'meta_description',
+    'views': 'views',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+    'published_at': 'published_at',
+    'content': 'content',
+}
+POST_LIST_FIELDS = [name for name in POST_FIELDS if name != 'content']
+COMMENT_FIELDS = {
+    'id': 'id',
+    'author': 'author__username',
+    'content': 'content',
+    'created_at': 'created_at',
+}
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def dumps(data):
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def api_view(func):
+    """GET/HEAD 전용, 오류는 JSON 으로, 응답 본문(dict 또는 직렬화된 bytes)에 ETag 를 붙여 304 처리"""
+    @require_safe
+    @wraps(func)
+    def wrapper(request, *args, **kwargs):
+        try:
+            body = func(request, *args, **kwargs)
+        except ApiError as error:
+            return JsonResponse({'error': str(error)}, status=error.status, json_dumps_params={'ensure_ascii': False})
+        except Http404 as error:
+            return JsonResponse({'error': str(error) or '찾을 수 없습니다.'}, status=404,
+                                json_dumps_params={'ensure_ascii': False})
+        if not isinstance(body, bytes):
+            body = dumps(body)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        # 캐시는 하되 매번 ETag 로 재검증 (바뀌지 않았으면 304, 본문 없음)
+        patch_cache_control(response, no_cache=True)
+        return get_conditional_response(request, etag=etag, response=response)
+    return wrapper
+
+
+# ----- 요청 인자 -----
+
+def parse_fields(request, available, default):
+    """fields= 인자 (순서 유지, 중복 제거)"""
+    value = request.GET.get('fields')
+    if not value:
+        return list(default)
+    fields = list(dict.fromkeys(name for name in value.split(',') if name))
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise ApiError(f'알 수 없는 필드: {", ".join(unknown)} (사용 가능: {", ".join(available)})')
+    return fields
+
+
+def parse_limit(request):
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError('limit 은 정수여야 합니다.')
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ApiError(f'limit 은 1 ~ {MAX_LIMIT} 사이여야 합니다.')
+    return limit
+
+
+def encode_cursor(created_at, pk):
+    return urlsafe_b64encode(f'{created_at.isoformat()}|{pk}'.encode()).decode().rstrip('=')
+
+
+def decode_cursor(value):
+    try:
+        created_at, pk = urlsafe_b64decode(value + '=' * (-len(value) % 4)).decode().split('|')
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise ApiError('잘못된 cursor 입니다.')
+
+
+# ----- 조회 -----
+
+def fetch_page(queryset, available, fields, limit, cursor=None, descending=True):
+    """(작성일, id) 키셋으로 한 페이지 조회 - ([(id, {필드: 값})], 다음 cursor) 반환"""
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        if descending:
+            queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+        else:
+            queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk))
+    order = ('-created_at', '-pk') if descending else ('created_at', 'pk')
+    names = [name for name in fields if available[name]]
+    rows = list(
+        queryset.order_by(*order).values_list('created_at', 'pk', *(available[name] for name in names))[:limit + 1]
+    )
+    next_cursor = encode_cursor(*rows[limit - 1][:2]) if len(rows) > limit else None
+    return [(row[1], dict(zip(names, row[2:]))) for row in rows[:limit]], next_cursor
+
+
+def serialize_posts(rows, fields):
+    """게시글 행에 태그를 채우고 요청한 필드 순서로 정리"""
+    if 'tags' in fields:
+        tags = {pk: [] for pk, _ in rows}
+        for post_id, slug in Post.tags.through.objects.filter(
+            post_id__in=list(tags)
+        ).values_list('post_id', 'tag__slug').order_by('tag__slug'):
+            tags[post_id].append(slug)
+        for pk, item in rows:
+            item['tags'] = tags[pk]
+    return [{name: item[name] for name in fields} for _, item in rows]
+
+
+# ----- 엔드포인트 -----
+
+@api_view
+def post_list(request):
+    """발행된 게시글 목록 (최신순) - category=, tag=, author= 로 거르기"""
+    fields = parse_fields(request, POST_FIELDS, POST_LIST_FIELDS)
+    limit = parse_limit(request)
+    params = {name: request.GET.get(name, '') for name in ('cursor', 'category', 'tag', 'author')}
+    key = hashlib.md5(f'{",".join(fields)}|{limit}|{sorted(params.items())}'.encode()).hexdigest()
+
+    def build():
+        posts = get_published_posts()
+        if params['category']:
+            posts = posts.filter(category_id=get_category_or_404(params['category']).pk)
+        if params['tag']:
+            posts = posts.filter(tags=get_tag_or_404(params['tag']).pk)
+        if params['author']:
+            posts = posts.filter(author__username=params['author'])
+        rows, next_cursor = fetch_page(posts, POST_FIELDS, fields, limit, params['cursor'])
+        return dumps({'results': serialize_posts(rows, fields), 'next': next_cursor})
+
+    return blog_cache.get_or_set('posts', f'api:{key}', build, POST_LIST_CACHE_TIMEOUT)
+
+
+@api_view
+def post_detail(request, pk):
+    """발행된 게시글 하나 (기본으로 content 포함)"""
+    fields = parse_fields(request, POST_FIELDS, POST_FIELDS)
+    names = [name for name in fields if POST_FIELDS[name]]
+    row = get_published_posts().filter(pk=pk).values_list(*(POST_FIELDS[name] for name in names)).first()
+    if row is None:
+        raise Http404('게시글을 찾을 수 없습니다.')
+    return serialize_posts([(pk, dict(zip(names, row)))], fields)[0]
+
+
+@api_view
+def comment_list(request, pk):
+    """게시글의 댓글 목록 (작성순, 숨김 댓글 제외)"""
+    fields = parse_fields(request, COMMENT_FIELDS, COMMENT_FIELDS)
+    limit = parse_limit(request)
+    if not get_published_posts().filter(pk=pk).exists():
+        raise Http404('게시글을 찾을 수 없습니다.')
+    rows, next_cursor = fetch_page(
+        Comment.objects.filter(post_id=pk, is_hidden=False), COMMENT_FIELDS, fields, limit,
+        request.GET.get('cursor'), descending=False,
+    )
+    return {'results': [item for _, item in rows], 'next': next_cursor}
+
+
+@api_view
+def category_list(request):
+    """카테고리 목록 (태그 포함, 택소노미 캐시 사용)"""
+    return {'results': get_taxonomy()['categories']}
+
+
+@api_view
+def tag_list(request):
+    """태그 목록 (택소노미 캐시 사용)"""
+    return {'results': [
+        {'id': tag['id'], 'name': tag['name'], 'slug': slug, 'category_id': tag['category_id']}
+        for slug, tag in get_taxonomy()['tag_slugs'].items()
+    ]}
+
+
+@api_view
+def author_detail(request, username):
+    """작성자 프로필"""
+    row = User.objects.filter(username=username, is_active=True).values(
+        'id', 'username', 'date_joined', 'profile__bio', 'profile__website', 'profile__github',
+        'profile__location', 'profile__skills', 'profile__avatar',
+    ).first()
+    if row is None:
+        raise Http404('사용자를 찾을 수 없습니다.')
+    avatar = row['profile__avatar']
+    return {
+        'id': row['id'],
+        'username': row['username'],
+        'date_joined': row['date_joined'],
+        'bio': row['profile__bio'] or '',
+        'website': row['profile__website'] or '',
+        'github': row['profile__github'] or '',
+        'location': row['profile__location'] or '',
+        'skills': [skill.strip() for skill in (row['profile__skills'] or '').split(',') if skill.strip()],
+        'avatar': default_storage.url(avatar) if avatar else None,
+        'post_count': Post.objects.filter(author_id=row['id'], status='published', is_public=True).count(),
+    }
@@ -0,0 +1,102 @@
+"""
+날짜별 보관함
+
+월별 발행 게시글 수를 MonthlyArchive 요약 테이블에 두고, 게시글이 저장/삭제될 때
+(blog/signals.py, 관리자 일괄 변경) 해당 월만 작성일 범위로 다시 센다. 사이드바 위젯과 보관함 페이지는
+요약 테이블(blog_cache 'archive' 네임스페이스)만 읽으므로 요청마다 GROUP BY 하지 않는다.
+월은 TIME_ZONE 기준이며, 사이트 전체와 같이 작성일(created_at)로 나눈다.
+예약 글은 publish_scheduled 가 발행 상태로 저장할 때 세어진다.
+"""
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .cache import blog_cache
+from .models import MonthlyArchive, Post
+
+ARCHIVE_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def published_posts():
+    """지금 공개 상태인 게시글 (views.get_published_posts 와 같은 조건)"""
+    return Post.objects.filter(
+        Q(status='published') | Q(status='scheduled', published_at__lte=timezone.now()), is_public=True
+    )
+
+
+def month_range(year, month):
+    """해당 월의 [시작, 다음 달 시작) 시각 (TIME_ZONE 기준)"""
+    tz = timezone.get_current_timezone()
+    start = datetime(year, month, 1, tzinfo=tz)
+    end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=tz)
+    return start, end
+
+
+def year_range(year):
+    tz = timezone.get_current_timezone()
+    return datetime(year, 1, 1, tzinfo=tz), datetime(year + 1, 1, 1, tzinfo=tz)
+
+
+def refresh_month(year, month):
+    """한 달의 발행 게시글 수를 작성일 범위(인덱스)로 다시 세어 요약 테이블에 반영"""
+    start, end = month_range(year, month)
+    count = published_posts().filter(created_at__gte=start, created_at__lt=end).count()
+    if count:
+        MonthlyArchive.objects.bulk_create(
+            [MonthlyArchive(year=year, month=month, post_count=count)],
+            update_conflicts=True, unique_fields=['year', 'month'], update_fields=['post_count'],
+        )
+    else:
+        MonthlyArchive.objects.filter(year=year, month=month).delete()
+
+
+def refresh_months(created_ats):
+    """작성일 목록이 속한 달들을 트랜잭션 커밋 후 다시 셈"""
+    months = {(value.year, value.month) for value in map(timezone.localtime, created_ats)}
+    if not months:
+        return
+
+    def refresh():
+        for year, month in months:
+            refresh_month(year, month)
+        blog_cache.invalidate('archive')
+
+    transaction.on_commit(refresh)
+
+
+def rebuild():
+    """요약 테이블 전체 다시 만들기 (seed_data 등 일괄 변경 후) - 월 수 반환"""
+    rows = published_posts().order_by().annotate(
+        month=TruncMonth('created_at')
+    ).values('month').annotate(count=Count('pk'))
+    entries = [
+        MonthlyArchive(year=row['month'].year, month=row['month'].month, post_count=row['count'])
+        for row in rows
+    ]
+    with transaction.atomic():
+        MonthlyArchive.objects.all().delete()
+        MonthlyArchive.objects.bulk_create(entries)
+    blog_cache.invalidate('archive')
+    return len(entries)
+
+
+def get_archive_months():
+    """[{'year', 'month', 'post_count'}] 최신 달부터 (캐시)"""
+    return blog_cache.get_or_set(
+        'archive', 'months',
+        lambda: list(MonthlyArchive.objects.filter(post_count__gt=0).values('year', 'month', 'post_count')),
+        ARCHIVE_CACHE_TIMEOUT,
+    )
+
+
+def get_archive_years():
+    """[{'year', 'post_count', 'months': [...]}] 최신 연도부터"""
+    years = {}
+    for entry in get_archive_months():
+        year = years.setdefault(entry['year'], {'year': entry['year'], 'post_count': 0, 'months': []})
+        year['post_count'] += entry['post_count']
+        year['months'].append(entry)
+    return list(years.values())
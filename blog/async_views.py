@@ -0,0 +1,146 @@
+"""
+ASGI 환경용 비동기 읽기 뷰
+서로 의존하지 않는 쿼리를 동시에 실행해 응답 지연을 '쿼리 지연의 합'이 아닌
+'가장 느린 쿼리' 수준으로 줄인다.
+
+Django 의 비동기 ORM(aget 등)은 하나의 스레드에서 순서대로 실행되므로,
+동시 실행이 필요한 쿼리는 thread_sensitive=False 로 별도 스레드(= 별도 DB 커넥션)에서 돌린다.
+settings.BLOG_ASYNC_VIEWS 가 True 일 때 blog/urls.py 에서 동기 뷰 대신 연결된다.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db import close_old_connections
+from django.http import Http404
+from django.shortcuts import render, redirect
+
+from . import surrogate, trending
+from .cache import blog_cache
+from .forms import CommentForm
+from .models import Post
+from .views import (
+    POPULAR_POSTS_CACHE_TIMEOUT,
+    count_post_view, filter_post_list, get_post_visibility, get_published_posts,
+    merge_related_posts, query_popular_posts,
+)
+
+
+def _fetch(queryset):
+    """쿼리셋을 평가해 결과 캐시를 채운 뒤 그대로 반환 (템플릿의 .count 등이 재조회하지 않음)"""
+    len(queryset)
+    return queryset
+
+
+def run_query(func, *args):
+    """동기 ORM 코드를 독립 스레드(독립 DB 커넥션)에서 실행"""
+    def run():
+        try:
+            return func(*args)
+        finally:
+            # CONN_MAX_AGE 설정에 따라 스레드 커넥션 정리
+            close_old_connections()
+    return sync_to_async(run, thread_sensitive=False)()
+
+
+async def _empty():
+    return []
+
+
+async def aget_popular_posts():
+    """인기글 - 트렌딩 순위, 없으면 전체 조회수 Top 5 (비동기 캐시 조회)"""
+    posts = await blog_cache.aget_or_set(
+        'trending', f'{trending.GLOBAL_SCOPE}:5', lambda: run_query(trending.query_trending_posts),
+        trending.TRENDING_CACHE_TIMEOUT,
+    )
+    return posts or await blog_cache.aget_or_set(
+        'posts', 'popular', lambda: run_query(query_popular_posts), POPULAR_POSTS_CACHE_TIMEOUT
+    )
+
+
+def _parse_page_number(value):
+    """선조회용 페이지 번호 (잘못된 값은 Paginator.get_page 가 최종 판단)"""
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+async def post_list(request):
+    """게시글 목록 (비동기)"""
+    posts, query, sort = filter_post_list(request)
+
+    # 전체 개수, 요청 페이지, 인기글을 동시에 조회
+    paginator = Paginator(posts, 10)
+    page = request.GET.get('page')
+    number = _parse_page_number(page)
+    bottom = (number - 1) * paginator.per_page
+
+    total, page_posts, popular_posts = await asyncio.gather(
+        run_query(posts.count),
+        run_query(list, posts[bottom:bottom + paginator.per_page]),
+        aget_popular_posts(),
+    )
+    paginator.count = total
+    posts = paginator.get_page(page)
+    if posts.number == number:
+        # 범위를 벗어난 페이지가 아니면 선조회 결과를 그대로 사용
+        posts.object_list = page_posts
+
+    surrogate.add_keys(request, surrogate.POST_LIST)
+    surrogate.add_posts(request, [*posts, *popular_posts])
+
+    return await sync_to_async(render)(request, 'blog/post_list.html', {
+        'posts': posts,
+        'query': query,
+        'sort': sort,
+        'popular_posts': popular_posts,
+    })
+
+
+async def post_detail(request, pk):
+    """게시글 상세 (비동기)"""
+    try:
+        post = await Post.objects.select_related(
+            'author', 'category'
+        ).prefetch_related('tags').aget(pk=pk)
+    except Post.DoesNotExist:
+        raise Http404('게시글을 찾을 수 없습니다.')
+
+    # request.user 평가에 세션 조회가 필요하므로 동기 스레드에서 판단
+    is_author, is_published = await sync_to_async(get_post_visibility)(post, request.user)
+
+    if not is_author and not is_published:
+        messages.error(request, '이 글을 볼 권한이 없습니다.')
+        return redirect('post_list')
+
+    viewed = await sync_to_async(count_post_view)(request, post) if is_published else None
+
+    # 댓글, 인기글, 관련 글(카테고리/태그)을 동시에 조회
+    tag_ids = [tag.pk for tag in post.tags.all()]
+    related_query = get_published_posts().exclude(pk=post.pk).select_related('category', 'author')
+
+    comments, popular_posts, category_posts, tag_posts = await asyncio.gather(
+        run_query(_fetch, post.comments.select_related('author')),
+        aget_popular_posts(),
+        run_query(list, related_query.filter(category_id=post.category_id)[:3])
+        if post.category_id else _empty(),
+        run_query(list, related_query.filter(tags__in=tag_ids).distinct()[:8])
+        if tag_ids else _empty(),
+    )
+
+    related_posts = merge_related_posts(category_posts, tag_posts)
+    surrogate.add_posts(request, [post, *related_posts, *popular_posts])
+
+    response = await sync_to_async(render)(request, 'blog/post_detail.html', {
+        'post': post,
+        'comments': comments,
+        'comment_form': CommentForm(),
+        'popular_posts': popular_posts,
+        'can_comment': is_published,
+        'related_posts': related_posts,
+    })
+    if viewed is not None:
+        viewed.save(response)
+    return response
@@ -0,0 +1,196 @@
+"""
+2단계 캐시 (프로세스 내 L1 LRU + 워커 공유 L2)
+
+L1: 워커 프로세스마다 두는 작은 LRU. 인기글/택소노미 같은 핫 키를 메모리에서 바로 응답한다.
+L2: settings.CACHES['default'] (파일/DB 캐시 또는 Redis). 모든 워커가 공유한다.
+
+무효화는 네임스페이스 버전 스탬프로 한다. invalidate(namespace) 가 L2 의 버전을 올리면
+각 워커는 최대 VERSION_CHECK_INTERVAL 초 안에 새 버전을 읽고, 예전 버전 키는 더 이상 조회하지 않는다.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .instrumentation import record_cache
+
+_MISSING = object()
+
+
+class TieredCache:
+    """L1(프로세스 LRU) + L2(공유 캐시) 2단계 캐시"""
+
+    def __init__(self, alias='default', max_entries=512, l1_timeout=30, version_check_interval=1.0):
+        self.alias = alias
+        self.max_entries = max_entries
+        self.l1_timeout = l1_timeout
+        self.version_check_interval = version_check_interval
+        self._l1 = OrderedDict()  # key -> (value, 만료 시각)
+        self._versions = {}  # namespace -> (version, 확인 시각)
+        self._lock = threading.Lock()
+        self._stats = {'l1_hits': 0, 'l2_hits': 0, 'misses': 0, 'invalidations': 0}
+
+    @property
+    def l2(self):
+        return caches[self.alias]
+
+    # ----- 조회 -----
+
+    def get_or_set(self, namespace, key, default, timeout=60):
+        """캐시 값 반환, 없으면 default() 결과를 L1/L2 에 저장 후 반환"""
+        full_key = self._make_key(namespace, key, self._get_version(namespace))
+        value = self._l1_get(full_key)
+        if value is not _MISSING:
+            return value
+        value = self.l2.get(full_key, _MISSING)
+        if value is not _MISSING:
+            self._record('l2_hits')
+        else:
+            self._record('misses')
+            value = default()
+            self.l2.set(full_key, value, timeout)
+        self._l1_set(full_key, value, timeout)
+        return value
+
+    async def aget_or_set(self, namespace, key, default, timeout=60):
+        """get_or_set 의 비동기 버전 (default 는 코루틴 함수)"""
+        full_key = self._make_key(namespace, key, await self._aget_version(namespace))
+        value = self._l1_get(full_key)
+        if value is not _MISSING:
+            return value
+        value = await self.l2.aget(full_key, _MISSING)
+        if value is not _MISSING:
+            self._record('l2_hits')
+        else:
+            self._record('misses')
+            value = await default()
+            await self.l2.aset(full_key, value, timeout)
+        self._l1_set(full_key, value, timeout)
+        return value
+
+    def get_many(self, namespace, keys):
+        """여러 키를 L2 에서 한 번에 조회 - {키: 값} (L1 은 거치지 않음, 항목이 많은 조각 캐시용)"""
+        version = self._get_version(namespace)
+        full_keys = {self._make_key(namespace, key, version): key for key in keys}
+        found = self.l2.get_many(list(full_keys))
+        for _ in range(len(found)):
+            self._record('l2_hits')
+        for _ in range(len(full_keys) - len(found)):
+            self._record('misses')
+        return {full_keys[full_key]: value for full_key, value in found.items()}
+
+    def set_many(self, namespace, values, timeout=60):
+        """{키: 값} 을 L2 에 한 번에 저장"""
+        version = self._get_version(namespace)
+        self.l2.set_many({self._make_key(namespace, key, version): value for key, value in values.items()}, timeout)
+
+    # ----- 무효화 -----
+
+    def invalidate(self, namespace):
+        """네임스페이스 버전을 올려 모든 워커의 해당 항목을 무효화"""
+        version_key = self._version_key(namespace)
+        try:
+            version = self.l2.incr(version_key)
+        except ValueError:
+            version = self._initial_version()
+            self.l2.set(version_key, version, None)
+        with self._lock:
+            self._versions[namespace] = (version, time.monotonic())
+            self._stats['invalidations'] += 1
+
+    def clear_local(self):
+        """현재 프로세스의 L1 비우기"""
+        with self._lock:
+            self._l1.clear()
+            self._versions.clear()
+
+    def stats(self):
+        """적중/실패 통계"""
+        with self._lock:
+            stats = dict(self._stats, l1_size=len(self._l1))
+        lookups = stats['l1_hits'] + stats['l2_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['l1_hits'] + stats['l2_hits']) / lookups, 4) if lookups else None
+        return stats
+
+    # ----- 내부 -----
+
+    def _make_key(self, namespace, key, version):
+        return f'blog:{namespace}:{version}:{key}'
+
+    def _version_key(self, namespace):
+        return f'blog:version:{namespace}'
+
+    def _initial_version(self):
+        # 버전 키가 L2 에서 사라져도 예전 버전 번호로 되돌아가지 않도록 시각 기반으로 시작
+        return int(time.time() * 1000)
+
+    def _cached_version(self, namespace):
+        with self._lock:
+            cached = self._versions.get(namespace)
+        if cached and time.monotonic() - cached[1] < self.version_check_interval:
+            return cached[0]
+        return None
+
+    def _store_version(self, namespace, version):
+        with self._lock:
+            self._versions[namespace] = (version, time.monotonic())
+
+    def _get_version(self, namespace):
+        version = self._cached_version(namespace)
+        if version is None:
+            version_key = self._version_key(namespace)
+            version = self.l2.get(version_key)
+            if version is None:
+                version = self._initial_version()
+                if not self.l2.add(version_key, version, None):
+                    version = self.l2.get(version_key, version)
+            self._store_version(namespace, version)
+        return version
+
+    async def _aget_version(self, namespace):
+        version = self._cached_version(namespace)
+        if version is None:
+            version_key = self._version_key(namespace)
+            version = await self.l2.aget(version_key)
+            if version is None:
+                version = self._initial_version()
+                if not await self.l2.aadd(version_key, version, None):
+                    version = await self.l2.aget(version_key, version)
+            self._store_version(namespace, version)
+        return version
+
+    def _l1_get(self, full_key):
+        with self._lock:
+            entry = self._l1.get(full_key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._l1.move_to_end(full_key)
+                self._stats['l1_hits'] += 1
+                value = entry[0]
+            else:
+                if entry is not None:
+                    del self._l1[full_key]
+                return _MISSING
+        record_cache(True)
+        return value
+
+    def _l1_set(self, full_key, value, timeout):
+        expires_at = time.monotonic() + min(timeout or self.l1_timeout, self.l1_timeout)
+        with self._lock:
+            self._l1[full_key] = (value, expires_at)
+            self._l1.move_to_end(full_key)
+            while len(self._l1) > self.max_entries:
+                self._l1.popitem(last=False)
+
+    def _record(self, name):
+        with self._lock:
+            self._stats[name] += 1
+        record_cache(name == 'l2_hits')
+
+
+blog_cache = TieredCache(
+    max_entries=settings.BLOG_L1_CACHE['MAX_ENTRIES'],
+    l1_timeout=settings.BLOG_L1_CACHE['TIMEOUT'],
+    version_check_interval=settings.BLOG_L1_CACHE['VERSION_CHECK_INTERVAL'],
+)
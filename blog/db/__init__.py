@@ -0,0 +1,3 @@
+"""
+데이터베이스 연결 관련 확장 (커넥션 풀 백엔드 등)
+"""
@@ -0,0 +1,210 @@
+"""
+커넥션 풀을 사용하는 PostgreSQL 백엔드
+
+DATABASES[alias]['ENGINE'] = 'blog.db.postgresql_pool' 로 지정하면
+요청이 끝날 때 커넥션을 닫지 않고 프로세스 공용 풀에 반납한다.
+(CONN_MAX_AGE 는 0 으로 두어 요청마다 풀에 반납하도록 한다)
+
+풀 옵션은 DATABASES[alias]['OPTIONS']['pool'] 에 지정:
+    max_size        프로세스당 최대 커넥션 수
+    timeout         풀이 가득 찼을 때 대기할 최대 시간(초)
+    check_interval  이 시간(초) 이상 쉬던 커넥션은 꺼낼 때 SELECT 1 로 확인
+    max_lifetime    이 시간(초)이 지난 커넥션은 반납 시 닫음
+"""
+import threading
+import time
+from collections import deque
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel, is_psycopg3
+
+if is_psycopg3:
+    raise ImproperlyConfigured('blog.db.postgresql_pool 백엔드는 psycopg2 가 필요합니다.')
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class PoolTimeout(psycopg2.OperationalError):
+    """풀에서 커넥션을 기다리다 시간 초과"""
+
+
+class ConnectionPool:
+    """스레드 안전한 단순 커넥션 풀 (DB 별칭마다 프로세스당 하나)"""
+
+    def __init__(self, connect, max_size=10, timeout=5.0, check_interval=30.0, max_lifetime=3600.0):
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self.max_lifetime = max_lifetime
+        self._idle = deque()  # (connection, 생성 시각, 반납 시각)
+        self._created_at = {}
+        self._size = 0
+        self._cond = threading.Condition()
+        self.stats = {
+            'connections_created': 0,
+            'connections_discarded': 0,
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'wait_seconds_total': 0.0,
+        }
+
+    def getconn(self):
+        while True:
+            connection, returned_at = self._checkout()
+            if connection is None:
+                return self._open()
+            idle_for = time.monotonic() - returned_at
+            if idle_for < self.check_interval or self._is_healthy(connection):
+                return connection
+            self._discard(connection)
+
+    def putconn(self, connection):
+        created_at = self._created_at.get(id(connection), 0)
+        expired = time.monotonic() - created_at > self.max_lifetime
+        if connection.closed or expired or not self._reset(connection):
+            self._discard(connection)
+            return
+        with self._cond:
+            self._idle.append((connection, time.monotonic()))
+            self._cond.notify()
+
+    def snapshot(self):
+        """풀 지표 (현재 크기, 유휴/사용 중 커넥션 수, 누적 카운터)"""
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                'max_size': self.max_size,
+                'size': self._size,
+                'idle': idle,
+                'in_use': self._size - idle,
+                **self.stats,
+            }
+
+    def _checkout(self):
+        deadline = None
+        with self._cond:
+            while True:
+                if self._idle:
+                    # LIFO - 최근에 쓰인 커넥션일수록 살아 있을 가능성이 높음
+                    self.stats['checkouts'] += 1
+                    return self._idle.pop()
+                if self._size < self.max_size:
+                    self._size += 1
+                    self.stats['checkouts'] += 1
+                    return None, 0
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + self.timeout
+                    self.stats['waits'] += 1
+                remaining = deadline - now
+                if remaining <= 0:
+                    self.stats['timeouts'] += 1
+                    raise PoolTimeout(
+                        f'커넥션 풀이 가득 찼습니다 (max_size={self.max_size}, timeout={self.timeout}s)'
+                    )
+                self._cond.wait(remaining)
+                self.stats['wait_seconds_total'] += time.monotonic() - now
+
+    def _open(self):
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        self._created_at[id(connection)] = time.monotonic()
+        self.stats['connections_created'] += 1
+        return connection
+
+    def _discard(self, connection):
+        try:
+            connection.close()
+        except psycopg2.Error:
+            pass
+        self._created_at.pop(id(connection), None)
+        with self._cond:
+            self._size -= 1
+            self.stats['connections_discarded'] += 1
+            self._cond.notify()
+
+    def _reset(self, connection):
+        """진행 중인 트랜잭션을 정리해 깨끗한 상태로 반납"""
+        status = connection.info.transaction_status
+        if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except psycopg2.Error:
+                return False
+        return True
+
+    def _is_healthy(self, connection):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+        except psycopg2.Error:
+            return False
+        return True
+
+
+def get_pool(alias, connect=None, options=None):
+    """DB 별칭의 풀 반환 (최초 호출 시 생성)"""
+    with _pools_lock:
+        pool = _pools.get(alias)
+        if pool is None and connect is not None:
+            pool = _pools[alias] = ConnectionPool(connect, **(options or {}))
+        return pool
+
+
+def pool_stats():
+    """프로세스 내 모든 풀의 지표"""
+    with _pools_lock:
+        pools = dict(_pools)
+    return {alias: pool.snapshot() for alias, pool in pools.items()}
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop('pool', None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        options = self.settings_dict['OPTIONS']
+
+        def connect():
+            connection = self.Database.connect(**conn_params)
+            # 기본 백엔드와 동일하게 jsonb 디코딩 왕복을 생략
+            psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+            return connection
+
+        pool = get_pool(self.alias, connect, options.get('pool'))
+        connection = pool.getconn()
+
+        if 'isolation_level' in options:
+            try:
+                self.isolation_level = IsolationLevel(options['isolation_level'])
+            except ValueError:
+                pool.putconn(connection)
+                raise ImproperlyConfigured(
+                    f"Invalid transaction isolation level {options['isolation_level']} specified."
+                )
+            connection.isolation_level = self.isolation_level
+        else:
+            self.isolation_level = IsolationLevel.READ_COMMITTED
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                get_pool(self.alias).putconn(self.connection)
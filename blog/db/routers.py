@@ -0,0 +1,182 @@
+"""
+읽기 전용 복제본(replica) DB 라우터
+
+ReplicaRoutingMiddleware 가 허용한 요청(GET/HEAD, primary 고정 쿠키 없음)의
+읽기 쿼리만 settings.DATABASE_REPLICAS 의 복제본으로 라운드로빈 분산한다.
+그 밖의 모든 쿼리(쓰기, 관리 명령, 쓰기 요청 중의 읽기)는 primary(default)로 간다.
+
+복제본은 REPLICA_HEALTH_CHECK_INTERVAL 초마다 연결/복제 지연을 확인하며,
+연결이 안 되거나 지연이 REPLICA_MAX_LAG 초를 넘으면 primary 로 대체한다.
+확인은 요청 경로 밖의 백그라운드 스레드에서 하므로 요청은 마지막 확인 결과만 읽는다
+(복제본 연결 시간 제한은 settings 의 DB_REPLICA_CONNECT_TIMEOUT).
+요청에서 처음 복제본을 고를 때 연결되지 않으면 그 복제본을 제외하고 다른 복제본이나 primary 를 쓴다.
+연결 뒤 복제본 쿼리가 실패하면(실행 래퍼가 실패한 별칭을 기록) ReplicaRoutingMiddleware 가 그 복제본을 제외하고
+primary 로 다시 실행한다. primary 에서 난 오류는 복제본과 상관없으므로 그대로 둔다.
+"""
+import contextvars
+import itertools
+import logging
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# 복제 중인 서버에서 WAL 재생이 밀린 경우에만 지연을 계산
+# (primary 에 쓰기가 없으면 pg_last_xact_replay_timestamp 가 계속 과거로 남으므로)
+POSTGRES_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+# 복제 지연이 있으면 로그인 상태가 흔들리므로 세션은 항상 primary 에서 읽음
+PRIMARY_ONLY_APPS = ('sessions',)
+
+_routing_state = contextvars.ContextVar('blog_replica_routing', default=None)
+_health = {}  # alias -> (정상 여부, 확인 시각)
+_health_lock = threading.Lock()
+_checking = set()  # 백그라운드에서 확인 중인 복제본
+_round_robin = itertools.count()
+
+
+class RoutingState:
+    """요청 단위 라우팅 상태"""
+
+    def __init__(self, use_replicas):
+        self.use_replicas = use_replicas
+        self.wrote = False
+        self.replica = None
+        self.failed_replica = None  # 쿼리가 실패한 복제본 별칭
+
+    def record_errors(self, execute, sql, params, many, context):
+        """복제본 커넥션의 실행 래퍼 - 실패한 쿼리의 별칭을 기록"""
+        try:
+            return execute(sql, params, many, context)
+        except DatabaseError:
+            self.failed_replica = context['connection'].alias
+            raise
+
+
+@contextmanager
+def replica_routing(use_replicas):
+    """블록 안의 읽기 쿼리를 복제본으로 보낼지 지정"""
+    state = RoutingState(use_replicas)
+    token = _routing_state.set(state)
+    try:
+        with ExitStack() as stack:
+            if use_replicas:
+                for alias in settings.DATABASE_REPLICAS:
+                    stack.enter_context(connections[alias].execute_wrapper(state.record_errors))
+            yield state
+    finally:
+        _routing_state.reset(token)
+
+
+def _check_replica(alias):
+    """복제본 연결 및 복제 지연 확인"""
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(POSTGRES_LAG_SQL)
+                lag = float(cursor.fetchone()[0] or 0)
+            else:
+                cursor.execute('SELECT 1')
+                lag = 0.0
+    except DatabaseError as e:
+        logger.warning('복제본 %s 에 연결할 수 없어 primary 를 사용합니다: %s', alias, e)
+        return False
+    if lag > settings.REPLICA_MAX_LAG:
+        logger.warning('복제본 %s 의 지연이 %.1f초라 primary 를 사용합니다.', alias, lag)
+        return False
+    return True
+
+
+def _run_checks(aliases):
+    """백그라운드 스레드에서 복제본 상태 확인 (스레드 전용 커넥션은 끝나면 닫음)"""
+    try:
+        for alias in aliases:
+            healthy = _check_replica(alias)
+            with _health_lock:
+                _health[alias] = (healthy, time.monotonic())
+    finally:
+        with _health_lock:
+            _checking.difference_update(aliases)
+        for alias in aliases:
+            connections[alias].close()
+
+
+def healthy_replicas():
+    """현재 사용 가능한 복제본 목록 - 확인 시점이 지난 복제본은 백그라운드에서 다시 확인하고
+    그동안은 마지막 결과를 사용 (아직 확인 전인 복제본은 정상으로 보고, 실패하면 미들웨어가 primary 로 재시도)"""
+    now = time.monotonic()
+    replicas = []
+    stale = []
+    with _health_lock:
+        for alias in settings.DATABASE_REPLICAS:
+            healthy, checked_at = _health.get(alias, (True, None))
+            if (checked_at is None or now - checked_at >= settings.REPLICA_HEALTH_CHECK_INTERVAL) \
+                    and alias not in _checking:
+                _checking.add(alias)
+                stale.append(alias)
+            if healthy:
+                replicas.append(alias)
+    if stale:
+        threading.Thread(target=_run_checks, args=(stale,), daemon=True).start()
+    return replicas
+
+
+def mark_unhealthy(alias):
+    """쿼리 실패 등으로 복제본을 다음 확인 시점까지 제외"""
+    with _health_lock:
+        _health[alias] = (False, time.monotonic())
+
+
+def _connect(alias):
+    """요청에서 쓸 복제본 연결 (이미 연결돼 있으면 그대로) - 실패하면 제외"""
+    try:
+        connections[alias].ensure_connection()
+    except DatabaseError as e:
+        mark_unhealthy(alias)
+        logger.warning('복제본 %s 에 연결할 수 없어 제외합니다: %s', alias, e)
+        return False
+    return True
+
+
+class ReplicaRouter:
+    """읽기는 복제본, 쓰기는 primary"""
+
+    def db_for_read(self, model, **hints):
+        state = _routing_state.get()
+        # GET 요청 중의 부수적인 쓰기(조회수 등)는 다시 읽을 필요가 없으므로 복제본 유지
+        if state is None or not state.use_replicas or model._meta.app_label in PRIMARY_ONLY_APPS:
+            return 'default'
+        if state.replica is None:
+            replicas = healthy_replicas()
+            if replicas:
+                start = next(_round_robin) % len(replicas)
+                # 연결되는 첫 복제본 - 한 요청 안에서는 같은 복제본을 사용해 일관된 스냅샷을 보장
+                state.replica = next((alias for alias in replicas[start:] + replicas[:start] if _connect(alias)), None)
+            if state.replica is None:
+                state.use_replicas = False
+                return 'default'
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # primary 와 복제본은 같은 데이터를 가짐
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
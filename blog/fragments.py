@@ -0,0 +1,87 @@
+"""
+게시글 카드/사이드바 템플릿 조각 캐시
+
+목록 페이지(홈, 카테고리, 태그, 프로필)의 게시글 카드와 인기글 사이드바 항목을 조각 단위로 렌더링해
+blog_cache 'fragments' 네임스페이스(L2)에 둔다. 한 페이지의 조각은 get_many 한 번으로 읽고,
+놓친 조각만 태그/작성자/카테고리를 한 번에 읽어(prefetch) 렌더링한 뒤 set_many 로 저장한다.
+
+키: 조각 이름, 게시글 pk, updated_at, 조회수(와 댓글 수), RENDERER_VERSION
+    - 글을 고치면 updated_at 이 바뀌어 새 키가 된다 (예전 키는 TIMEOUT 후 만료).
+    - 태그를 붙이거나 떼면 signals 가 updated_at 을 갱신한다.
+    - 작성자 이름(username), 카테고리/태그 이름이 바뀌면 signals 가 네임스페이스를 무효화한다.
+    - 조각 템플릿을 고치면 RENDERER_VERSION 을 올린다.
+BLOG_FRAGMENT_CACHE['ENABLED'] 가 False 면 같은 조각 템플릿을 캐시 없이 렌더링한다 (비교 측정용).
+"""
+from django.conf import settings
+from django.db.models import Count, prefetch_related_objects
+from django.template.loader import get_template
+
+from .cache import blog_cache
+from .models import Comment
+
+RENDERER_VERSION = 1
+
+# 이름 -> (템플릿, 놓친 조각을 렌더링할 때 미리 읽을 관계, 댓글 수 표시 여부, 추가 컨텍스트)
+FRAGMENTS = {
+    'card': ('blog/includes/post_card.html', ('author', 'category', 'tags'), True, {}),
+    'row': ('blog/includes/post_row.html', ('author', 'category', 'tags'), True, {}),
+    'summary': ('blog/includes/post_summary.html', ('author', 'tags'), False, {}),
+    'tag_summary': ('blog/includes/post_summary.html', ('author', 'category', 'tags'), False, {'show_category': True}),
+    'popular': ('blog/includes/popular_item.html', (), False, {}),
+    'profile': ('blog/includes/profile_post.html', ('category',), False, {}),
+}
+
+
+def fragment_key(name, post):
+    """조각 캐시 키 - 조각 내용이 바뀌는 값을 모두 담음"""
+    stamp = int(post.updated_at.timestamp() * 1_000_000)
+    key = f'{name}:{post.pk}:{stamp}:{post.views}'
+    if FRAGMENTS[name][2]:
+        key += f':{post.comment_count}'
+    return f'{key}:v{RENDERER_VERSION}'
+
+
+def attach_comment_counts(posts):
+    """댓글 수를 GROUP BY 한 번으로 읽어 post.comment_count 에 붙임"""
+    counts = dict(
+        Comment.objects.filter(post_id__in={post.pk for post in posts})
+        .values_list('post_id').annotate(count=Count('pk')).order_by()
+    )
+    for post in posts:
+        post.comment_count = counts.get(post.pk, 0)
+
+
+def render_fragment(name, post):
+    template, _, _, extra = FRAGMENTS[name]
+    return get_template(template).render({'post': post, **extra})
+
+
+def render_fragments(groups):
+    """{조각 이름: 게시글 목록} -> {조각 이름: 렌더링된 HTML 목록} (캐시 조회는 한 번)"""
+    groups = {name: list(posts) for name, posts in groups.items()}
+    counted = [post for name, posts in groups.items() if FRAGMENTS[name][2] for post in posts]
+    if counted:
+        attach_comment_counts(counted)
+
+    options = settings.BLOG_FRAGMENT_CACHE
+    if not options['ENABLED']:
+        return {name: [render_fragment(name, post) for post in posts] for name, posts in groups.items()}
+
+    keys = {name: [fragment_key(name, post) for post in posts] for name, posts in groups.items()}
+    found = blog_cache.get_many('fragments', {key for name_keys in keys.values() for key in name_keys})
+
+    rendered = {}
+    for name, posts in groups.items():
+        missing = [post for post, key in zip(posts, keys[name]) if key not in found]
+        if not missing:
+            continue
+        lookups = FRAGMENTS[name][1]
+        if lookups:
+            prefetch_related_objects(missing, *lookups)
+        for post in missing:
+            rendered[fragment_key(name, post)] = render_fragment(name, post)
+    if rendered:
+        blog_cache.set_many('fragments', rendered, options['TIMEOUT'])
+
+    found.update(rendered)
+    return {name: [found[key] for key in name_keys] for name, name_keys in keys.items()}
@@ -0,0 +1,181 @@
+"""
+요청 단위 성능 계측
+
+요청마다 RequestStats 를 contextvar 에 두고, 다음 지점에서 값을 모은다.
+    - DB: 커넥션마다 설치되는 execute_wrapper (query_wrapper) - 쿼리 수/시간, 반복 쿼리
+    - 템플릿: TEMPLATES 백엔드 TimedDjangoTemplates - 가장 바깥 템플릿 렌더링 시간 (중첩 렌더링은 한 번만)
+    - 캐시: blog_cache 적중/실패 (blog/cache.py 에서 record_cache 호출)
+
+계측 중이 아닐 때(관리 명령 등)는 contextvar 조회 1번으로 끝나므로 운영 환경에서 켜 둘 수 있다.
+호출 위치(스택)는 느린 쿼리와 반복 쿼리로 판정된 경우에만 구한다.
+"""
+import os
+import re
+import sys
+import sysconfig
+import threading
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+
+import django
+from django.template.backends.django import DjangoTemplates, Template
+
+_request_stats = ContextVar('blog_request_stats', default=None)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST_RE = re.compile(r'\bIN \((?:\s*(?:%s|\?)\s*,?)+\)', re.IGNORECASE)
+_SPACE_RE = re.compile(r'\s+')
+
+# 호출 위치를 찾을 때 건너뛸 경로 (표준 라이브러리/설치 패키지/계측 코드)
+_SKIP_PATHS = (
+    sysconfig.get_paths()['stdlib'],
+    os.path.dirname(os.path.dirname(django.__file__)),
+    os.path.abspath(__file__),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache.py'),
+)
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql):
+    """파라미터/리터럴/IN 목록을 ? 로 바꿔 같은 모양의 쿼리를 하나로 묶음"""
+    sql = _STRING_RE.sub('?', sql)
+    sql = _IN_LIST_RE.sub('IN (...)', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    return _SPACE_RE.sub(' ', sql.replace('%s', '?')).strip()
+
+
+def find_call_site():
+    """쿼리를 일으킨 프로젝트 코드 위치 'path:line in func'"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_SKIP_PATHS) and '<frozen' not in filename:
+            return f'{os.path.relpath(filename)}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+    return 'unknown'
+
+
+class RequestStats:
+    """요청 1건의 계측 값"""
+
+    def __init__(self, slow_query_ms, duplicate_threshold):
+        self.slow_query_ms = slow_query_ms
+        self.duplicate_threshold = duplicate_threshold
+        self.started_at = time.perf_counter()
+        self.queries = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.rendering = None  # 렌더링 중인 (가장 안쪽) 템플릿 이름
+        self.template_depth = 0  # 중첩 렌더링 깊이 - 가장 바깥 렌더링만 시간에 더함
+        self.slow_queries = []  # (ms, 정규화 SQL, 호출 위치)
+        self.duplicates = {}  # 정규화 SQL -> [횟수, 호출 위치]
+        # 비동기 뷰는 여러 스레드에서 동시에 쿼리하므로 잠금
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+
+    def record_query(self, sql, duration):
+        normalized = normalize_sql(sql)
+        with self._lock:
+            self.queries += 1
+            self.sql_time += duration
+            entry = self.duplicates.get(normalized)
+            if entry is None:
+                entry = self.duplicates[normalized] = [0, None]
+            entry[0] += 1
+            need_site = entry[0] == self.duplicate_threshold
+        if need_site:
+            entry[1] = self.call_site()
+        if duration * 1000 >= self.slow_query_ms:
+            self.slow_queries.append((duration * 1000, normalized, self.call_site()))
+
+    def call_site(self):
+        site = find_call_site()
+        if self.rendering:
+            # 템플릿에서 일어난 쿼리 (지연 로딩 등)
+            site = f'{site}, 템플릿 {self.rendering}'
+        return site
+
+    def repeated_queries(self):
+        """반복 임계값 이상 실행된 쿼리 [(횟수, 정규화 SQL, 호출 위치)] (N+1 의심)"""
+        return sorted(
+            ((count, sql, site) for sql, (count, site) in self.duplicates.items()
+             if count >= self.duplicate_threshold),
+            reverse=True,
+        )
+
+
+def start_request(slow_query_ms, duplicate_threshold):
+    stats = RequestStats(slow_query_ms, duplicate_threshold)
+    return stats, _request_stats.set(stats)
+
+
+def finish_request(token):
+    _request_stats.reset(token)
+
+
+def current_stats():
+    return _request_stats.get()
+
+
+def query_wrapper(execute, sql, params, many, context):
+    """DB execute_wrapper - 계측 중인 요청의 쿼리 시간 기록"""
+    stats = _request_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.record_query(sql, time.perf_counter() - start)
+
+
+def install_query_wrapper(connection):
+    """커넥션에 query_wrapper 설치 (connection_created 시그널에서 호출, 중복 설치 방지)"""
+    if query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_wrapper)
+
+
+def record_cache(hit):
+    stats = _request_stats.get()
+    if stats is not None:
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        stats = _request_stats.get()
+        if stats is None:
+            return super().render(context, request)
+        start = time.perf_counter()
+        previous = stats.rendering
+        stats.rendering = self.origin.template_name
+        stats.template_depth += 1
+        try:
+            return super().render(context, request)
+        finally:
+            stats.template_depth -= 1
+            stats.rendering = previous
+            # render_to_string, 조각 캐시 등 안쪽 렌더링은 바깥 렌더링 시간에 이미 포함됨
+            if stats.template_depth == 0:
+                stats.template_time += time.perf_counter() - start
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """렌더링 시간을 기록하는 Django 템플릿 백엔드"""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
@@ -0,0 +1,89 @@
+"""
+요청당 DB 커넥션 비용을 측정하는 management command
+
+요청 시작/종료 시그널과 간단한 쿼리 한 번으로 요청 생명주기를 흉내 내어,
+매 요청 새로 연결하는 경우(CONN_MAX_AGE=0)와 현재 설정(영속 커넥션 또는 풀)을 비교한다.
+풀 백엔드(blog.db.postgresql_pool)를 쓰는 설정이면 기준 측정은 같은 접속 정보로 만든 일반 PostgreSQL 커넥션으로 한다.
+
+사용법:
+    python manage.py bench_db_connections --requests 500
+    DB_POOL=True python manage.py bench_db_connections
+"""
+import copy
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.db.utils import load_backend
+
+POOL_ENGINE = 'blog.db.postgresql_pool'
+
+
+class Command(BaseCommand):
+    help = '요청당 DB 커넥션 오버헤드를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='측정할 요청 수')
+        parser.add_argument('--database', default='default', help='측정할 DB 별칭')
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        configured_max_age = connection.settings_dict['CONN_MAX_AGE']
+
+        results = [
+            (
+                f'매 요청 새 연결 ({self._plain_engine(connection)}, CONN_MAX_AGE=0)',
+                self._measure(self._plain_connection(connection), 0, options['requests']),
+            ),
+            (
+                f'현재 설정 ({connection.settings_dict["ENGINE"]}, CONN_MAX_AGE={configured_max_age})',
+                self._measure(connection, configured_max_age, options['requests']),
+            ),
+        ]
+
+        for label, timings in results:
+            timings.sort()
+            self.stdout.write(
+                f'{label}\n'
+                f'  평균 {statistics.mean(timings):.3f}ms  '
+                f'p50 {timings[len(timings) // 2]:.3f}ms  '
+                f'p95 {timings[int(len(timings) * 0.95) - 1]:.3f}ms'
+            )
+
+        baseline, current = (statistics.mean(t) for _, t in results)
+        self.stdout.write(self.style.SUCCESS(f'\n요청당 절감: {baseline - current:.3f}ms'))
+
+    def _plain_engine(self, connection):
+        engine = connection.settings_dict['ENGINE']
+        return 'django.db.backends.postgresql' if engine == POOL_ENGINE else engine
+
+    def _plain_connection(self, connection):
+        """풀을 거치지 않는 같은 DB 커넥션 (풀 백엔드가 아니면 그대로)"""
+        if connection.settings_dict['ENGINE'] != POOL_ENGINE:
+            return connection
+        settings_dict = copy.deepcopy(connection.settings_dict)
+        settings_dict['ENGINE'] = self._plain_engine(connection)
+        settings_dict['OPTIONS'].pop('pool', None)
+        return load_backend(settings_dict['ENGINE']).DatabaseWrapper(settings_dict, f'{connection.alias}-baseline')
+
+    def _measure(self, connection, max_age, count):
+        """요청 count 회를 흉내 내고 요청별 소요 시간(ms) 목록 반환"""
+        connection.close()
+        connection.settings_dict['CONN_MAX_AGE'] = max_age
+        timings = []
+        try:
+            for _ in range(count):
+                start = time.perf_counter()
+                request_started.send(sender=self.__class__)
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                    cursor.fetchone()
+                request_finished.send(sender=self.__class__)
+                # 기준 커넥션은 connections 에 등록되지 않아 시그널이 닫아 주지 않으므로 직접
+                connection.close_if_unusable_or_obsolete()
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            connection.close()
+        return timings
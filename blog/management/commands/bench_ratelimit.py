@@ -0,0 +1,45 @@
+"""
+요청 제한 검사 1회의 오버헤드를 측정하는 management command
+
+사용법:
+    python manage.py bench_ratelimit --checks 5000
+"""
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+
+from blog.ratelimit import SlidingWindowLimiter
+
+
+class Command(BaseCommand):
+    help = '요청 제한 검사 1회당 오버헤드를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--checks', type=int, default=2000, help='측정할 검사 횟수')
+
+    def handle(self, *args, **options):
+        checks = options['checks']
+        limiter = SlidingWindowLimiter()
+        scope = f'bench:{uuid.uuid4().hex}'
+
+        client, cache = limiter._get_backend()
+        if client is None:
+            # Redis 가 아니면 워커마다 따로 세는 LocMem 이라 공유 저장소 측정이 아님
+            label = f'워커별 저장소 경로 ({type(cache).__name__} 대체, 공유 안 됨)'
+        else:
+            label = f'공유 저장소 경로 ({type(client).__name__})'
+
+        # 매번 다른 클라이언트 - 항상 저장소와 동기화
+        elapsed = self._measure(lambda i: limiter.hit(scope, f'shared-{i}', 30, 3600), checks)
+        self.stdout.write(f'{label}: {elapsed:.1f}µs/검사')
+
+        # 한도에 한참 못 미치는 같은 클라이언트 - 대부분 프로세스 내 fast path
+        elapsed = self._measure(lambda i: limiter.hit(scope, 'fast', checks * 100, 3600), checks)
+        self.stdout.write(f'fast path 포함:    {elapsed:.1f}µs/검사')
+
+    def _measure(self, check, count):
+        start = time.perf_counter()
+        for i in range(count):
+            check(i)
+        return (time.perf_counter() - start) / count * 1_000_000
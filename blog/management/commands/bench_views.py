@@ -0,0 +1,271 @@
+"""
+모든 URL 의 응답 시간/쿼리 수/메모리를 측정하는 management command
+
+blog/urls.py 와 config/urls.py 의 URL 패턴을 모두 훑어, 인자는 DB 의 실제 값(인기 게시글, 댓글,
+카테고리/태그 슬러그, 작성자)으로 채운 뒤 테스트 클라이언트(또는 실행 중인 서버)로 GET 요청을 보낸다.
+결과를 JSON 으로 저장해 두면 --compare 로 커밋 간 차이를 볼 수 있다.
+상태를 바꾸는 URL(삭제/숨김/로그아웃 등)은 기본으로 제외한다.
+
+사용법:
+    python manage.py seed_data --posts 100000 --comments 5000000
+    python manage.py bench_views --iterations 30 --output before.json
+    python manage.py bench_views --user admin --memory --compare before.json --output after.json
+    python manage.py bench_views --base-url http://127.0.0.1:8000
+"""
+import json
+import math
+import platform
+import resource
+import subprocess
+import time
+import tracemalloc
+import urllib.error
+import urllib.request
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import NoReverseMatch, URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+
+from blog.models import Category, Comment, MonthlyArchive, Post, Tag
+
+# 상태를 바꾸거나 전체 데이터를 내려받는 URL
+DEFAULT_EXCLUDE = {
+    'logout', 'comment_create', 'comment_delete', 'comment_report', 'comment_hide',
+    'image_upload', 'export_data', 'password_reset_confirm', 'admin:logout',
+}
+
+
+def percentile(sorted_values, percent):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def pattern_params(pattern):
+    """URL 패턴의 인자 이름 - path() 변환기와 re_path() 의 이름 있는 그룹 모두"""
+    return list(pattern.regex.groupindex)
+
+
+def iter_patterns(patterns, namespace=''):
+    """(URL 이름, 인자 이름 목록) - 이름 없는 패턴은 제외"""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            child_namespace = namespace
+            if pattern.namespace:
+                child_namespace = f'{namespace}{pattern.namespace}:'
+            for name, params in iter_patterns(pattern.url_patterns, child_namespace):
+                yield name, pattern_params(pattern.pattern) + params
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield f'{namespace}{pattern.name}', pattern_params(pattern.pattern)
+
+
+class Command(BaseCommand):
+    help = '모든 URL 의 응답 시간(p50/p95/p99), 쿼리 수, 메모리를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='URL 당 측정 횟수')
+        parser.add_argument('--warmup', type=int, default=2, help='측정 전 예열 요청 수')
+        parser.add_argument('--user', help='이 사용자로 로그인해 측정 (기본: 비로그인)')
+        parser.add_argument('--only', nargs='*', default=[], help='측정할 URL 이름')
+        parser.add_argument('--exclude', nargs='*', default=[], help='추가로 제외할 URL 이름')
+        parser.add_argument('--include-admin', action='store_true', help='인자 없는 admin URL 도 측정')
+        parser.add_argument('--memory', action='store_true', help='tracemalloc 으로 요청당 최대 메모리 측정 (느려짐)')
+        parser.add_argument('--base-url', help='테스트 클라이언트 대신 실행 중인 서버로 요청 (쿼리 수 제외)')
+        parser.add_argument('--output', help='결과 JSON 저장 경로')
+        parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+
+    def handle(self, *args, **options):
+        targets = self.collect_targets(options)
+        if not targets:
+            raise CommandError('측정할 URL 이 없습니다. seed_data 로 데이터를 먼저 만들어 주세요.')
+
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            requester = self.make_requester(options)
+            results = {}
+            for name, path in targets:
+                results[name] = self.measure(requester, path, options)
+                self.print_result(name, results[name])
+
+        report = {'meta': self.meta(options), 'results': results}
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'결과 저장: {options["output"]}'))
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as f:
+                self.print_comparison(json.load(f), report)
+
+    # ----- 대상 URL -----
+
+    def sample_values(self):
+        """URL 인자에 채울 실제 값 (조회가 많은 공개 게시글 기준)"""
+        post = Post.objects.filter(
+            status='published', is_public=True
+        ).select_related('author', 'category').order_by('-views').first()
+        if post is None:
+            return None
+        comment = Comment.objects.filter(post=post).first()
+        category = post.category or Category.objects.first()
+        tag = post.tags.first() or Tag.objects.first()
+        # 보관함은 글이 가장 많은 달
+        month = MonthlyArchive.objects.order_by('-post_count').first()
+        return {
+            'year': month.year if month else None,
+            'month': month.month if month else None,
+            'pk': post.pk,
+            'comment_pk': comment.pk if comment else None,
+            'username': post.author.username,
+            'category_slug': category.slug if category else None,
+            'tag_slug': tag.slug if tag else None,
+            'data_type': 'all',
+        }
+
+    def collect_targets(self, options):
+        values = self.sample_values()
+        if values is None:
+            return []
+        exclude = DEFAULT_EXCLUDE | set(options['exclude'])
+        only = set(options['only'])
+        targets = []
+        seen = set()
+        for name, params in iter_patterns(get_resolver().url_patterns):
+            if name in seen or name in exclude or (only and name not in only):
+                continue
+            seen.add(name)
+            if name.startswith('admin:') and (params or not options['include_admin']):
+                continue
+            kwargs = {}
+            for param in params:
+                key = param
+                if param == 'slug':
+                    key = 'tag_slug' if name.startswith('tag') else 'category_slug'
+                kwargs[param] = values.get(key)
+            if any(value is None for value in kwargs.values()):
+                self.stdout.write(f'건너뜀: {name} (인자 {", ".join(params)} 를 채울 수 없음)')
+                continue
+            try:
+                targets.append((name, reverse(name, kwargs=kwargs)))
+            except NoReverseMatch:
+                # 이름 없는 정규식 그룹 등 인자로 채울 수 없는 패턴
+                self.stdout.write(f'건너뜀: {name} (주소를 만들 수 없음)')
+        return targets
+
+    # ----- 측정 -----
+
+    def make_requester(self, options):
+        if options['base_url']:
+            base_url = options['base_url'].rstrip('/')
+
+            def request(path):
+                try:
+                    with urllib.request.urlopen(base_url + path) as response:
+                        response.read()
+                        return response.status
+                except urllib.error.HTTPError as error:
+                    return error.code
+            return request
+
+        client = Client(raise_request_exception=False)
+        if options['user']:
+            try:
+                client.force_login(User.objects.get(username=options['user']))
+            except User.DoesNotExist:
+                raise CommandError(f'사용자 {options["user"]} 가 없습니다.')
+
+        def request(path):
+            return client.get(path).status_code
+        return request
+
+    def measure(self, request, path, options):
+        for _ in range(options['warmup']):
+            request(path)
+
+        live = bool(options['base_url'])
+        timings, queries, peaks = [], [], []
+        status = None
+        for _ in range(options['iterations']):
+            contexts = [] if live else [CaptureQueriesContext(connection) for connection in connections.all()]
+            for context in contexts:
+                context.__enter__()
+            if options['memory']:
+                tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                status = request(path)
+            finally:
+                timings.append((time.perf_counter() - start) * 1000)
+                if options['memory']:
+                    peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+                    tracemalloc.stop()
+                for context in contexts:
+                    context.__exit__(None, None, None)
+            if contexts:
+                queries.append(sum(len(context) for context in contexts))
+
+        timings.sort()
+        return {
+            'path': path,
+            'status': status,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+            'queries': round(sum(queries) / len(queries), 1) if queries else None,
+            'peak_kb': round(max(peaks), 1) if peaks else None,
+        }
+
+    # ----- 출력 -----
+
+    def meta(self, options):
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            'commit': commit,
+            'created_at': timezone.now().isoformat(),
+            'iterations': options['iterations'],
+            'user': options['user'],
+            'base_url': options['base_url'],
+            'database': connections['default'].vendor,
+            'posts': Post.objects.count(),
+            'comments': Comment.objects.count(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            # 리눅스는 KB, macOS 는 바이트 단위
+            'max_rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        }
+
+    def print_result(self, name, result):
+        extra = ''
+        if result['queries'] is not None:
+            extra += f'  쿼리 {result["queries"]:g}'
+        if result['peak_kb'] is not None:
+            extra += f'  메모리 {result["peak_kb"]:.0f}KB'
+        self.stdout.write(
+            f'{name:<28} {result["status"]}  p50 {result["p50_ms"]:8.2f}ms  '
+            f'p95 {result["p95_ms"]:8.2f}ms  p99 {result["p99_ms"]:8.2f}ms{extra}'
+        )
+
+    def print_comparison(self, before, after):
+        self.stdout.write(f'\n비교: {before["meta"].get("commit")} -> {after["meta"].get("commit")}')
+        for name, result in after['results'].items():
+            previous = before['results'].get(name)
+            if previous is None:
+                continue
+            change = (result['p50_ms'] - previous['p50_ms']) / previous['p50_ms'] * 100 if previous['p50_ms'] else 0
+            line = f'{name:<28} p50 {previous["p50_ms"]:8.2f} -> {result["p50_ms"]:8.2f}ms ({change:+.1f}%)'
+            if result['queries'] is not None and previous.get('queries') is not None:
+                line += f'  쿼리 {previous["queries"]:g} -> {result["queries"]:g}'
+            style = self.style.ERROR if change > 10 else self.style.SUCCESS if change < -10 else str
+            self.stdout.write(style(line))
@@ -0,0 +1,132 @@
+"""
+핫 쿼리 실행 계획(EXPLAIN)을 점검하는 management command
+
+blog/views.py 등에서 실제로 쓰는 쿼리를 카탈로그로 모아 EXPLAIN 을 실행하고,
+행 수가 --min-rows 이상인 테이블을 순차 스캔(Seq Scan / SCAN)하는 쿼리가 있으면 실패(종료 코드 1)한다.
+seed_data 로 데이터를 충분히 넣은 뒤 실행해야 의미 있는 계획이 나온다.
+
+사용법:
+    python manage.py seed_data --posts 100000 --comments 1000000
+    python manage.py explain_queries --min-rows 10000
+    python manage.py explain_queries --verbose   # 전체 실행 계획 출력
+"""
+import re
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from blog import archive, trending
+from blog.models import Category, Comment, HitEvent, Post, PostDailyStats, PostViewBucket, TrendingPost
+from blog.views import get_published_posts
+
+# PostgreSQL: 'Seq Scan on blog_post', SQLite: 'SCAN blog_post' (USING INDEX 가 없는 전체 스캔)
+SEQ_SCAN_PATTERNS = {
+    'postgresql': re.compile(r'Seq Scan on (\w+)'),
+    'sqlite': re.compile(r'\bSCAN (\w+)\b(?! USING)'),
+}
+
+
+def query_catalogue():
+    """(이름, 쿼리셋) 목록 - 조회가 많은 공개 게시글을 기준으로 인자를 채움"""
+    post = get_published_posts().order_by('-views').first()
+    if post is None:
+        return []
+    tag = post.tags.first()
+    now = timezone.now()
+    published = get_published_posts()
+    created = timezone.localtime(post.created_at)
+    archive_start, archive_end = archive.month_range(created.year, created.month)
+
+    catalogue = [
+        ('post_list 최신순', published.select_related('author', 'category').order_by('-created_at')[:10]),
+        ('post_list 조회순', published.select_related('author', 'category').order_by('-views', '-created_at')[:10]),
+        ('post_list 전체 개수', published.order_by().values('pk')),
+        ('인기글 Top 5', published.order_by('-views')[:5]),
+        ('post_detail 댓글', Comment.objects.filter(post=post).select_related('author').order_by('created_at')),
+        ('관련 글 (카테고리)', published.filter(category_id=post.category_id).exclude(pk=post.pk)[:3]),
+        ('category_posts', published.filter(category_id=post.category_id).order_by('-created_at')[:10]),
+        ('user_profile 글 통계', Post.objects.filter(author_id=post.author_id, status='published')),
+        ('my_posts', Post.objects.filter(author_id=post.author_id).order_by('-created_at')[:10]),
+        ('my_comments', Comment.objects.filter(author_id=post.author_id).order_by('-created_at')[:10]),
+        ('publish_scheduled 대상', Post.objects.filter(status='scheduled', published_at__lte=now)),
+        ('택소노미 로드', Category.objects.values_list('id', 'tags__id')),
+        ('신고 검토 대기열', Comment.objects.filter(report_count__gt=0).order_by('-report_count', '-last_reported_at')[:30]),
+        ('트렌딩 Top 5', TrendingPost.objects.filter(scope=trending.GLOBAL_SCOPE).order_by('rank')[:5]),
+        ('트렌딩 미반영 조회', PostViewBucket.objects.filter(views__gt=F('scored_views'))),
+        ('작성자 일별 조회 통계', PostDailyStats.objects.filter(
+            post__author_id=post.author_id, day__gte=now.date() - timedelta(days=30)
+        ).values('day').annotate(total=Sum('views'))),
+        ('보관함 월별 목록', published.filter(
+            created_at__gte=archive_start, created_at__lt=archive_end
+        ).order_by('-created_at')[:10]),
+        ('보관함 월별 글 수', archive.published_posts().filter(
+            created_at__gte=archive_start, created_at__lt=archive_end
+        )),
+        ('조회 이벤트 정리 대상', HitEvent.objects.filter(created_at__lt=now - timedelta(days=7)).values('pk')[:10000]),
+    ]
+    if tag is not None:
+        catalogue += [
+            ('tag_posts', published.filter(tags=tag).order_by('-created_at')[:10]),
+            ('관련 글 (태그)', published.filter(tags__in=[tag.pk]).exclude(pk=post.pk).distinct()[:8]),
+        ]
+    return catalogue
+
+
+class Command(BaseCommand):
+    help = '핫 쿼리의 실행 계획을 점검하고 큰 테이블 순차 스캔이 있으면 실패합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-rows', type=int, default=10000, help='순차 스캔을 실패로 볼 최소 행 수')
+        parser.add_argument('--verbose', action='store_true', help='전체 실행 계획 출력')
+        parser.add_argument('--skip-analyze', action='store_true', help='실행 전 통계 갱신(ANALYZE) 생략')
+
+    def handle(self, *args, **options):
+        pattern = SEQ_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f'{connection.vendor} 는 지원하지 않습니다. (postgresql, sqlite)')
+
+        if not options['skip_analyze']:
+            # 대량 적재 직후에는 통계가 없어 플래너가 인덱스를 고르지 않으므로 먼저 갱신
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+        catalogue = query_catalogue()
+        if not catalogue:
+            raise CommandError('게시글이 없습니다. seed_data 로 데이터를 먼저 만들어 주세요.')
+
+        table_rows = {}
+        failures = []
+        for name, queryset in catalogue:
+            plan = queryset.explain()
+            large_scans = []
+            for table in sorted(set(pattern.findall(plan))):
+                if table not in table_rows:
+                    table_rows[table] = self.count_rows(table)
+                if table_rows[table] >= options['min_rows']:
+                    large_scans.append(f'{table}({table_rows[table]}행)')
+
+            if large_scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f'[순차 스캔] {name}: {", ".join(large_scans)}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'[OK] {name}'))
+            if options['verbose'] or large_scans:
+                self.stdout.write('    ' + plan.replace('\n', '\n    '))
+
+        if failures:
+            raise CommandError(f'큰 테이블을 순차 스캔하는 쿼리 {len(failures)}개: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS(f'\n쿼리 {len(catalogue)}개 모두 인덱스를 사용합니다.'))
+
+    def count_rows(self, table):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # 큰 테이블에서 COUNT(*) 를 피하기 위해 통계의 추정치 사용
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE relname = %s', [table])
+                row = cursor.fetchone()
+                if row and row[0] >= 0:
+                    return row[0]
+            cursor.execute(f'SELECT COUNT(*) FROM {connection.ops.quote_name(table)}')
+            return cursor.fetchone()[0]
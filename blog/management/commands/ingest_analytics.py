@@ -0,0 +1,68 @@
+"""
+조회 이벤트 스풀 파일(blog.analytics)을 적재하는 management command
+
+BLOG_ANALYTICS['SPOOL_DIR'] 의 파일을 오래된 순으로 가져가 INGEST_BATCH 개씩 한 트랜잭션으로
+원본 이벤트(HitEvent)와 시간대별/일별/유입 경로별 집계에 기록한다.
+보존 기간이 지난 원본과 집계도 주기적으로 지운다. SIGTERM/SIGINT 를 받으면 현재 배치를 마치고 종료한다.
+스풀 파일은 각 서버의 로컬 디렉터리에 쌓이므로 웹 서버마다 하나씩 실행한다.
+
+사용법:
+    python manage.py ingest_analytics          # 상시 실행
+    python manage.py ingest_analytics --once   # 지금 쌓인 파일만 적재하고 종료 (SPOOL_DIR 이 없으면 정리만)
+
+권장 실행 방법:
+    - systemd 또는 supervisor 로 상시 실행
+    - 또는 cron 으로 1분마다 --once 실행
+"""
+import signal
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from blog import analytics
+
+
+class Command(BaseCommand):
+    help = '조회 이벤트 스풀 파일을 적재하고 오래된 분석 데이터를 정리합니다.'
+
+    MAINTENANCE_INTERVAL = 3600  # 오래된 원본/집계 정리 주기(초)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--poll-interval', type=float, default=5.0,
+                            help='적재할 파일이 없을 때 다시 확인하는 간격(초)')
+        parser.add_argument('--once', action='store_true', help='지금 쌓인 파일을 적재하면 종료')
+
+    def handle(self, *args, **options):
+        directory = settings.BLOG_ANALYTICS['SPOOL_DIR']
+        stop = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stop.set())
+
+        total = 0
+        next_maintenance = 0
+        while not stop.is_set():
+            if time.monotonic() >= next_maintenance:
+                if directory:
+                    requeued = analytics.requeue_stale_spool(directory)
+                    if requeued:
+                        self.stdout.write(self.style.WARNING(f'멈춘 스풀 파일 {requeued}개를 다시 적재합니다.'))
+                pruned = analytics.prune()
+                if any(pruned.values()):
+                    self.stdout.write(
+                        f'정리: 원본 {pruned["events"]}건, 일별 {pruned["daily"]}행, 유입 경로 {pruned["referrers"]}행'
+                    )
+                next_maintenance = time.monotonic() + self.MAINTENANCE_INTERVAL
+
+            ingested = analytics.ingest_spool(directory) if directory else 0
+            if ingested:
+                total += ingested
+                self.stdout.write(f'조회 이벤트 {ingested}건 적재')
+            if options['once'] or not directory:
+                break
+            connections.close_all()
+            stop.wait(options['poll_interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'적재 종료: 조회 이벤트 {total}건'))
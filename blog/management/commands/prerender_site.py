@@ -0,0 +1,86 @@
+"""
+공개 페이지를 정적 파일로 사전 렌더링하는 management command (blog.prerender)
+
+홈/카테고리/태그/보관함 목록의 모든 페이지, 게시글 상세, 피드, 사이트맵을 프로세스 풀로 렌더링해
+BLOG_PRERENDER['OUTPUT_DIR'] 에 쓰고 gzip 사본을 함께 둔다. 기본은 지난 빌드 이후 바뀐 게시글에
+영향받는 페이지만 다시 만드는 증분 빌드이고, 공개 목록에서 빠진 페이지의 파일은 지운다.
+웹 서버 설정 예시는 blog/prerender.py 참고.
+
+사용법:
+    python manage.py prerender_site                 # 증분 빌드
+    python manage.py prerender_site --full          # 전체 다시 만들기 (조회수/인기글 순위 반영)
+    python manage.py prerender_site --workers 8 --output /srv/blog-static
+
+권장 실행 방법:
+    - 트래픽이 몰릴 때 cron 으로 1~5분마다 증분 빌드, 하루 한 번 --full
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from blog import prerender
+from blog.taxonomy import get_taxonomy
+
+
+def init_worker():
+    """작업 프로세스 준비 (spawn 방식이면 Django 를 다시 설정)"""
+    if not apps.ready:
+        django.setup()
+
+
+class Command(BaseCommand):
+    help = '공개 페이지를 정적 파일로 사전 렌더링합니다 (증분, gzip 사본 포함).'
+
+    CHUNK_SIZE = 50  # 작업 프로세스에 한 번에 넘길 경로 수
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=settings.BLOG_PRERENDER['OUTPUT_DIR'], help='출력 디렉터리')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='렌더링 프로세스 수')
+        parser.add_argument('--full', action='store_true', help='바뀐 페이지만이 아니라 전체를 다시 만들기')
+
+    def handle(self, *args, **options):
+        output_dir = options['output']
+        os.makedirs(output_dir, exist_ok=True)
+        start = time.monotonic()
+
+        started, paths, render, removed, previous, states = prerender.plan(output_dir, options['full'])
+        taxonomy_etag = get_taxonomy()['etag']
+        self.stdout.write(f'전체 {len(paths)}쪽 중 {len(render)}쪽 렌더링, {len(removed)}쪽 삭제')
+
+        pages = {path: previous[path] for path in paths if path in previous}
+        failed = []
+        for path, relative, keys, error in self.render(output_dir, render, options['workers']):
+            if error:
+                # 매니페스트에서 빼 두면 다음 빌드에서 다시 시도
+                pages.pop(path, None)
+                failed.append(path)
+                self.stderr.write(f'실패: {path} - {error}')
+            else:
+                pages[path] = {'file': relative, 'keys': keys}
+        for path in removed:
+            prerender.remove_file(output_dir, previous[path]['file'])
+
+        prerender.save_manifest(output_dir, started, taxonomy_etag, states, pages)
+        message = f'사전 렌더링 완료: {len(render) - len(failed)}쪽, {time.monotonic() - start:.1f}초'
+        if failed:
+            self.stdout.write(self.style.WARNING(f'{message} (실패 {len(failed)}쪽)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
+
+    def render(self, output_dir, paths, workers):
+        chunks = [paths[i:i + self.CHUNK_SIZE] for i in range(0, len(paths), self.CHUNK_SIZE)]
+        if workers <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                yield from prerender.render_pages(output_dir, chunk)
+            return
+        # fork 된 작업 프로세스가 부모의 DB 커넥션을 나눠 쓰지 않도록 먼저 닫음
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=init_worker) as pool:
+            for results in pool.map(prerender.render_pages, [output_dir] * len(chunks), chunks):
+                yield from results
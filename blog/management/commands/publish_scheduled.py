@@ -10,6 +10,7 @@
 """
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from blog import surrogate
 from blog.models import Post
 
 
@@ -33,13 +34,14 @@ class Command(BaseCommand):
             )
             return
         
-        # 상태를 published로 변경
-        for post in scheduled_posts:
-            post.status = 'published'
-            post.save(update_fields=['status'])
-            self.stdout.write(
-                self.style.SUCCESS(f'발행됨: "{post.title}" (예약: {post.published_at})')
-            )
+        # 상태를 published로 변경 (앞단 캐시 퍼지는 모아서 한 번에)
+        with surrogate.batch():
+            for post in scheduled_posts:
+                post.status = 'published'
+                post.save(update_fields=['status'])
+                self.stdout.write(
+                    self.style.SUCCESS(f'발행됨: "{post.title}" (예약: {post.published_at})')
+                )
         
         self.stdout.write(
             self.style.SUCCESS(f'\n총 {count}개의 게시글이 발행되었습니다.')
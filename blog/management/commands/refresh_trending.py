@@ -0,0 +1,31 @@
+"""
+트렌딩 순위(blog.trending)를 갱신하는 management command
+
+마지막 갱신 뒤 새로 쌓인 시간대별 조회만 읽어 게시글 점수를 감쇠 반영하고,
+전체/카테고리/태그별 Top-K 표(TrendingPost)를 다시 만든다.
+
+사용법:
+    python manage.py refresh_trending
+
+권장 실행 방법:
+    - cron 으로 5분마다 실행
+      */5 * * * * cd /path/to/project && python manage.py refresh_trending
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog import trending
+
+
+class Command(BaseCommand):
+    help = '트렌딩 점수와 범위별 Top-K 순위를 갱신합니다.'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        stats = trending.refresh()
+        self.stdout.write(self.style.SUCCESS(
+            f'트렌딩 갱신 완료: 점수 {stats["updated"]}개 갱신, 순위 {stats["entries"]}행, '
+            f'정리 점수 {stats["pruned_scores"]}개/버킷 {stats["pruned_buckets"]}개 '
+            f'({time.perf_counter() - start:.2f}초)'
+        ))
@@ -0,0 +1,81 @@
+"""
+백그라운드 작업(blog.tasks) 워커를 실행하는 management command
+
+대기열에서 작업을 꺼내 스레드 풀로 실행한다. --processes 가 2 이상이면 같은 명령을 자식 프로세스로
+여러 개 띄운다 (이미지 처리처럼 CPU 를 쓰는 작업이 많을 때).
+SIGTERM/SIGINT 를 받으면 실행 중인 작업을 마치고 종료한다.
+
+사용법:
+    python manage.py run_tasks
+    python manage.py run_tasks --threads 8 --processes 2
+    python manage.py run_tasks --burst   # 지금 실행할 작업을 모두 처리하면 종료
+
+권장 실행 방법:
+    - systemd 또는 supervisor 로 상시 실행
+    - 또는 cron 으로 1분마다 --burst 실행
+"""
+import signal
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import autodiscover_modules
+
+from blog.tasks import Worker
+
+
+class Command(BaseCommand):
+    help = '백그라운드 작업 큐의 작업을 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=settings.BLOG_TASKS['THREADS'],
+                            help='프로세스당 작업 스레드 수')
+        parser.add_argument('--processes', type=int, default=1, help='워커 프로세스 수')
+        parser.add_argument('--poll-interval', type=float, default=settings.BLOG_TASKS['POLL_INTERVAL'],
+                            help='대기열이 비었을 때 다시 확인하는 간격(초)')
+        parser.add_argument('--burst', action='store_true', help='실행할 작업이 없으면 종료')
+
+    def handle(self, *args, **options):
+        if options['processes'] > 1:
+            self.run_processes(options)
+            return
+
+        # 각 앱의 tasks 모듈을 불러와 @task 등록
+        autodiscover_modules('tasks')
+        worker = Worker(
+            threads=options['threads'],
+            poll_interval=options['poll_interval'],
+            burst=options['burst'],
+        )
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: worker.stop())
+
+        self.stdout.write(f'작업 워커 시작: {worker.worker_id} (스레드 {options["threads"]}개)')
+        start = time.perf_counter()
+        processed = worker.run()
+        self.stdout.write(self.style.SUCCESS(
+            f'작업 워커 종료: {processed}개 처리 ({time.perf_counter() - start:.1f}초)'
+        ))
+
+    def run_processes(self, options):
+        command = [
+            sys.executable, '-m', 'django', 'run_tasks',
+            '--threads', str(options['threads']),
+            '--poll-interval', str(options['poll_interval']),
+        ]
+        if options['burst']:
+            command.append('--burst')
+        children = [subprocess.Popen(command) for _ in range(options['processes'])]
+
+        def stop(*_):
+            for child in children:
+                if child.poll() is None:
+                    child.send_signal(signal.SIGTERM)
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, stop)
+
+        codes = [child.wait() for child in children]
+        if any(codes):
+            self.stderr.write(f'비정상 종료한 워커 프로세스: {sum(1 for code in codes if code)}개')
@@ -0,0 +1,254 @@
+"""
+벤치마크용 대량 데이터를 생성하는 management command
+
+bulk_create 로 사용자/카테고리/태그/게시글/댓글/신고를 배치 단위로 넣는다.
+조회수와 댓글은 소수의 인기글에 몰리도록 파레토 분포로 만든다.
+생성한 데이터는 'seed-' 접두어(슬러그/사용자명)로 구분하며 --clear 로 지울 수 있다.
+
+사용법:
+    python manage.py seed_data --posts 100000 --comments 5000000 --users 5000
+    python manage.py seed_data --clear
+"""
+import itertools
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from blog import archive
+from blog.cache import blog_cache
+from blog.models import Category, Comment, CommentReport, Post, Tag
+
+PREFIX = 'seed-'
+WORDS = (
+    'django python 성능 캐시 인덱스 쿼리 배포 서버 비동기 템플릿 데이터베이스 '
+    '튜닝 모니터링 로그 테스트 리팩터링 파이프라인 컨테이너 보안 검색'
+).split()
+
+
+@contextmanager
+def without_auto_now(*models):
+    """auto_now/auto_now_add 를 잠시 꺼서 작성일을 과거로 분산"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = '벤치마크용 대량 데이터를 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200, help='사용자 수')
+        parser.add_argument('--categories', type=int, default=10, help='카테고리 수')
+        parser.add_argument('--tags-per-category', type=int, default=8, help='카테고리당 태그 수')
+        parser.add_argument('--posts', type=int, default=2000, help='게시글 수')
+        parser.add_argument('--comments', type=int, default=20000, help='댓글 수')
+        parser.add_argument('--reports', type=int, default=500, help='댓글 신고 수')
+        parser.add_argument('--days', type=int, default=730, help='작성일을 분산할 기간(일)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create 배치 크기')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드 (같은 값이면 같은 데이터)')
+        parser.add_argument('--clear', action='store_true', help='생성했던 데이터만 삭제')
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            self.clear()
+            return
+
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        self.days = options['days']
+
+        with without_auto_now(Post, Comment, CommentReport):
+            users = self.step('사용자', self.create_users, options['users'])
+            tags_by_category = self.step(
+                '카테고리/태그', self.create_taxonomy, options['categories'], options['tags_per_category']
+            )
+            posts = self.step('게시글', self.create_posts, options['posts'], users, tags_by_category)
+            comments = self.step('댓글', self.create_comments, options['comments'], posts, users)
+            self.step('신고', self.create_reports, options['reports'], comments, users)
+
+        # 캐시된 인기글/택소노미가 새 데이터를 반영하도록 (bulk_create 는 시그널이 없으므로 보관함도 다시 계산)
+        blog_cache.invalidate('posts')
+        blog_cache.invalidate('taxonomy')
+        blog_cache.invalidate('suggest')
+        blog_cache.invalidate('fragments')
+        archive.rebuild()
+
+    def step(self, label, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        count = len(result) if hasattr(result, '__len__') else result
+        self.stdout.write(f'{label}: {count}개 ({time.perf_counter() - start:.1f}초)')
+        return result
+
+    # ----- 생성 -----
+
+    def create_users(self, count):
+        password = make_password('seed-password')
+        start = User.objects.filter(username__startswith=PREFIX).count()
+        users = [
+            User(username=f'{PREFIX}user{start + i}', email=f'{PREFIX}user{start + i}@example.com',
+                 password=password)
+            for i in range(count)
+        ]
+        User.objects.bulk_create(users, batch_size=self.batch_size)
+        return list(User.objects.filter(username__startswith=PREFIX).values_list('id', flat=True))
+
+    def create_taxonomy(self, count, tags_per_category):
+        categories = [
+            Category(name=f'{PREFIX}category-{i}', slug=f'{PREFIX}category-{i}')
+            for i in range(count)
+        ]
+        Category.objects.bulk_create(categories, ignore_conflicts=True)
+        categories = Category.objects.filter(slug__startswith=PREFIX)
+        tags = [
+            Tag(name=f'{WORDS[j % len(WORDS)]}-{j}', slug=f'{category.slug}-tag-{j}', category=category)
+            for category in categories for j in range(tags_per_category)
+        ]
+        Tag.objects.bulk_create(tags, ignore_conflicts=True)
+        tags_by_category = {}
+        for tag_id, category_id in Tag.objects.filter(category__slug__startswith=PREFIX).values_list(
+            'id', 'category_id'
+        ):
+            tags_by_category.setdefault(category_id, []).append(tag_id)
+        return tags_by_category
+
+    def create_posts(self, count, users, tags_by_category):
+        rand = self.random
+        category_ids = list(tags_by_category)
+        start = Post.objects.filter(slug__startswith=PREFIX).count()
+        statuses = ['published'] * 90 + ['draft'] * 7 + ['scheduled'] * 3
+        tag_through = Post.tags.through
+        created_ids = []
+
+        for offset in range(0, count, self.batch_size):
+            batch = []
+            for i in range(offset, min(offset + self.batch_size, count)):
+                created_at = self.random_time()
+                status = rand.choice(statuses)
+                batch.append(Post(
+                    title=self.sentence(4, 10),
+                    slug=f'{PREFIX}post-{start + i}',
+                    content='\n\n'.join(self.sentence(20, 60) for _ in range(rand.randint(3, 12))),
+                    author_id=rand.choice(users),
+                    category_id=rand.choice(category_ids),
+                    status=status,
+                    published_at=created_at + timedelta(days=rand.randint(-30, 30)) if status == 'scheduled' else None,
+                    # 소수의 글이 대부분의 조회를 차지하는 파레토 분포
+                    views=int(rand.paretovariate(1.16) * 10) - 10,
+                    created_at=created_at,
+                    updated_at=created_at,
+                    is_public=rand.random() > 0.05,
+                ))
+            Post.objects.bulk_create(batch)
+            ids = list(
+                Post.objects.filter(slug__in=[post.slug for post in batch]).values_list('id', 'category_id')
+            )
+            links = [
+                tag_through(post_id=post_id, tag_id=tag_id)
+                for post_id, category_id in ids
+                for tag_id in rand.sample(tags_by_category[category_id], rand.randint(0, 3))
+            ]
+            tag_through.objects.bulk_create(links, batch_size=self.batch_size, ignore_conflicts=True)
+            created_ids.extend(post_id for post_id, _ in ids)
+        return created_ids
+
+    def create_comments(self, count, posts, users):
+        rand = self.random
+        # 인기글에 댓글이 몰리도록 게시글별 가중치도 파레토 분포
+        cum_weights = list(itertools.accumulate(rand.paretovariate(1.16) for _ in posts))
+        created_ids = []
+        for offset in range(0, count, self.batch_size):
+            size = min(self.batch_size, count - offset)
+            batch = []
+            for post_id in rand.choices(posts, cum_weights=cum_weights, k=size):
+                created_at = self.random_time()
+                batch.append(Comment(
+                    post_id=post_id,
+                    author_id=rand.choice(users),
+                    content=self.sentence(5, 40),
+                    created_at=created_at,
+                    updated_at=created_at,
+                    is_hidden=rand.random() < 0.01,
+                ))
+            with transaction.atomic():
+                Comment.objects.bulk_create(batch)
+            if len(created_ids) < 100000:
+                # 신고 대상 후보로 일부만 보관 (수백만 건을 메모리에 두지 않도록)
+                created_ids.extend(comment.pk for comment in batch if comment.pk)
+        if not created_ids:
+            created_ids = list(
+                Comment.objects.filter(post_id__in=posts[:1000]).values_list('id', flat=True)[:100000]
+            )
+        return created_ids
+
+    def create_reports(self, count, comments, users):
+        rand = self.random
+        reasons = [choice for choice, _ in CommentReport.REASON_CHOICES]
+        pairs = set()
+        attempts = 0
+        while len(pairs) < count and comments and attempts < count * 10:
+            pairs.add((rand.choice(comments), rand.choice(users)))
+            attempts += 1
+        reports = [
+            CommentReport(comment_id=comment_id, reporter_id=user_id, reason=rand.choice(reasons),
+                          created_at=self.random_time())
+            for comment_id, user_id in pairs
+        ]
+        CommentReport.objects.bulk_create(reports, batch_size=self.batch_size, ignore_conflicts=True)
+        counts = {}
+        for comment_id, _ in pairs:
+            counts[comment_id] = counts.get(comment_id, 0) + 1
+        # 신고 횟수가 같은 댓글끼리 묶어 UPDATE
+        by_count = {}
+        for comment_id, report_count in counts.items():
+            by_count.setdefault(report_count, []).append(comment_id)
+        latest = CommentReport.objects.filter(
+            comment=OuterRef('pk')
+        ).order_by('-created_at').values('created_at')[:1]
+        for report_count, comment_ids in by_count.items():
+            Comment.objects.filter(pk__in=comment_ids).update(
+                report_count=report_count, last_reported_at=Subquery(latest)
+            )
+        return reports
+
+    # ----- 삭제 -----
+
+    def clear(self):
+        start = time.perf_counter()
+        # 게시글/댓글/신고는 사용자 삭제에 연쇄 삭제됨
+        users, _ = User.objects.filter(username__startswith=PREFIX).delete()
+        categories, _ = Category.objects.filter(slug__startswith=PREFIX).delete()
+        blog_cache.invalidate('posts')
+        blog_cache.invalidate('taxonomy')
+        blog_cache.invalidate('suggest')
+        archive.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'삭제 완료: 사용자 관련 {users}행, 카테고리 관련 {categories}행 ({time.perf_counter() - start:.1f}초)'
+        ))
+
+    # ----- 도우미 -----
+
+    def random_time(self):
+        # 최근일수록 글이 많도록 기간 안에서 제곱 분포
+        return self.now - timedelta(seconds=int((self.random.random() ** 2) * self.days * 86400))
+
+    def sentence(self, low, high):
+        return ' '.join(self.random.choices(WORDS, k=self.random.randint(low, high)))
@@ -0,0 +1,77 @@
+"""
+아웃박스(blog.outbox)에 쌓인 메일을 발송하는 management command
+
+BLOG_OUTBOX['BACKEND'] 연결 하나를 배치마다 재사용해 보내고, 실패한 메일은 백오프 후 재시도,
+영구 오류나 MAX_ATTEMPTS 초과는 발송 포기(dead)로 남긴다. SIGTERM/SIGINT 를 받으면 현재 배치를 마치고 종료한다.
+
+사용법:
+    python manage.py send_outbox          # 상시 실행
+    python manage.py send_outbox --once   # 지금 보낼 메일을 모두 보내면 종료
+
+로컬 디버깅 SMTP 서버로 확인:
+    pip install aiosmtpd && python -m aiosmtpd -n -l localhost:1025
+    BLOG_OUTBOX_BACKEND=django.core.mail.backends.smtp.EmailBackend EMAIL_PORT=1025 \\
+        python manage.py send_outbox --once
+
+권장 실행 방법:
+    - systemd 또는 supervisor 로 상시 실행
+"""
+import signal
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from blog.outbox import Sender
+
+
+class Command(BaseCommand):
+    help = '아웃박스에 쌓인 메일을 발송합니다.'
+
+    MAINTENANCE_INTERVAL = 60  # 멈춘 메일 회수/오래된 메일 정리 주기(초)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='연결 하나로 한 번에 보낼 메일 수')
+        parser.add_argument('--poll-interval', type=float, default=settings.BLOG_OUTBOX['POLL_INTERVAL'],
+                            help='보낼 메일이 없을 때 다시 확인하는 간격(초)')
+        parser.add_argument('--once', action='store_true', help='지금 보낼 메일이 없으면 종료')
+
+    def handle(self, *args, **options):
+        sender = Sender(batch_size=options['batch_size'])
+        stop = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stop.set())
+
+        totals = {}
+        next_maintenance = 0
+        while not stop.is_set():
+            if time.monotonic() >= next_maintenance:
+                requeued = sender.requeue_stale()
+                if requeued:
+                    self.stdout.write(self.style.WARNING(f'멈춘 메일 {requeued}개를 다시 대기열로 돌렸습니다.'))
+                sender.prune_sent()
+                next_maintenance = time.monotonic() + self.MAINTENANCE_INTERVAL
+
+            rows = sender.claim()
+            if rows:
+                results = sender.send_batch(rows)
+                for result, count in results.items():
+                    totals[result] = totals.get(result, 0) + count
+                self.stdout.write(
+                    f'{len(rows)}개 처리: 발송 {results["sent"]}, 재시도 {results["retry"]}, '
+                    f'포기 {results["dead"]}, 지연 {results["throttled"]}'
+                )
+                # 도메인 제한으로 모두 미뤘으면 잠시 쉼
+                if results['throttled'] == len(rows):
+                    stop.wait(options['poll_interval'])
+                continue
+            if options['once']:
+                break
+            connections.close_all()
+            stop.wait(options['poll_interval'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'발송 종료: 발송 {totals.get("sent", 0)}개, 포기 {totals.get("dead", 0)}개'
+        ))
@@ -0,0 +1,291 @@
+"""
+애플리케이션 메트릭 (Prometheus 텍스트 형식)
+
+Counter / Gauge / Histogram 을 프로세스 안에 모으고, settings.BLOG_METRICS['DIR'] 이 있으면
+워커마다 '{pid}.json' 파일로 최대 FLUSH_INTERVAL 초마다 내려 쓴다.
+/metrics 요청을 받은 워커가 디렉터리의 파일을 모두 읽어 합산하므로 어느 워커가 응답해도 같은 값이 나온다.
+    - Counter/Histogram: 종료된 워커 값까지 합산 (누적 값이므로)
+    - Gauge: 살아 있는 워커 값만 합산
+    - 수집 함수(register_collector): 응답 시점에 한 번 계산 (DB 조회 등)
+DIR 은 배포(재시작)할 때 비워야 한다. 설정하지 않으면 응답한 워커의 값만 보인다.
+"""
+import atexit
+import json
+import math
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import OutboxMessage, Post, Task
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        registry.register(self)
+
+    def _key(self, labels):
+        return (self.name, tuple(str(labels[name]) for name in self.labelnames))
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        self.registry.update(self._key(labels), lambda value: (value or 0) + amount)
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        self.registry.update(self._key(labels), lambda _: value)
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+
+        def update(data):
+            # [버킷별 횟수..., +Inf 횟수, 합계]
+            data = data or [0] * (len(self.buckets) + 1) + [0.0]
+            data[index] += 1
+            data[-1] += value
+            return data
+        self.registry.update(self._key(labels), update)
+
+
+class Registry:
+    """메트릭 저장소 (멀티 프로세스 파일 공유)"""
+
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.metrics = {}
+        self.collectors = []
+        self._values = {}
+        self._lock = threading.Lock()
+        self._flushed_at = 0.0
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+
+    def register_collector(self, func):
+        """응답 시점에 호출해 (메트릭 이름, {라벨 튜플: 값}) 목록을 돌려주는 함수 등록"""
+        self.collectors.append(func)
+        return func
+
+    def update(self, key, func):
+        with self._lock:
+            self._values[key] = func(self._values.get(key))
+        self.maybe_flush()
+
+    # ----- 멀티 프로세스 -----
+
+    def maybe_flush(self):
+        if self.directory and time.monotonic() - self._flushed_at >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """현재 프로세스 값을 '{pid}.json' 으로 원자적으로 기록"""
+        if not self.directory:
+            return
+        with self._lock:
+            self._flushed_at = time.monotonic()
+            data = [[name, list(labels), value] for (name, labels), value in self._values.items()]
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f'{os.getpid()}.json')
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def _load_all(self):
+        """모든 워커 파일을 읽어 [(살아 있는지, 값 dict)] 반환"""
+        if not self.directory:
+            with self._lock:
+                return [(True, dict(self._values))]
+        self.flush()
+        results = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename)) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            values = {(name, tuple(labels)): value for name, labels, value in data}
+            results.append((_pid_alive(int(filename[:-5])), values))
+        return results
+
+    # ----- 출력 -----
+
+    def collect(self):
+        """전체 워커를 합산한 {메트릭 이름: {라벨 튜플: 값}}"""
+        merged = {name: {} for name in self.metrics}
+        for alive, values in self._load_all():
+            for (name, labels), value in values.items():
+                metric = self.metrics.get(name)
+                if metric is None or (metric.kind == 'gauge' and not alive):
+                    continue
+                series = merged[name]
+                if metric.kind == 'histogram':
+                    current = series.get(labels)
+                    series[labels] = value if current is None else [a + b for a, b in zip(current, value)]
+                else:
+                    series[labels] = series.get(labels, 0) + value
+        for collector in self.collectors:
+            for name, series in collector():
+                merged[name] = series
+        return merged
+
+    def exposition(self):
+        """Prometheus 텍스트 형식"""
+        lines = []
+        for name, series in self.collect().items():
+            metric = self.metrics[name]
+            lines.append(f'# HELP {name} {metric.documentation}')
+            lines.append(f'# TYPE {name} {metric.kind}')
+            for labels, value in sorted(series.items()):
+                label_pairs = list(zip(metric.labelnames, labels))
+                if metric.kind == 'histogram':
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets + (math.inf,), value[:-1]):
+                        cumulative += count
+                        le = '+Inf' if bound == math.inf else repr(float(bound))
+                        lines.append(f'{name}_bucket{_format_labels(label_pairs + [("le", le)])} {cumulative}')
+                    lines.append(f'{name}_sum{_format_labels(label_pairs)} {value[-1]}')
+                    lines.append(f'{name}_count{_format_labels(label_pairs)} {cumulative}')
+                else:
+                    lines.append(f'{name}{_format_labels(label_pairs)} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+def _pid_alive(pid):
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+registry = Registry(
+    directory=settings.BLOG_METRICS['DIR'],
+    flush_interval=settings.BLOG_METRICS['FLUSH_INTERVAL'],
+)
+# 워커 종료 시 마지막 값을 남겨 누적 값이 사라지지 않도록
+atexit.register(registry.flush)
+
+# ----- 블로그 메트릭 -----
+
+http_requests = Counter(
+    registry, 'blog_http_requests_total', '처리한 요청 수', ('view', 'method', 'status'))
+http_request_duration = Histogram(
+    registry, 'blog_http_request_duration_seconds', '요청 처리 시간', ('view',))
+db_query_duration = Histogram(
+    registry, 'blog_http_request_db_seconds', '요청당 SQL 실행 시간 합계', ('view',))
+db_queries = Counter(
+    registry, 'blog_db_queries_total', '실행한 SQL 수', ('view',))
+cache_lookups = Counter(
+    registry, 'blog_cache_lookups_total', 'blog_cache 조회 수 (hit/miss)', ('result',))
+upload_duration = Histogram(
+    registry, 'blog_image_upload_seconds', '이미지 업로드 처리 시간')
+tasks_processed = Counter(
+    registry, 'blog_tasks_total', '실행한 백그라운드 작업 수', ('task', 'status'))
+task_duration = Histogram(
+    registry, 'blog_task_duration_seconds', '백그라운드 작업 실행 시간', ('task',))
+task_queue = Gauge(
+    registry, 'blog_task_queue', '상태별 백그라운드 작업 수 (대기는 실행 시각이 된 것만)', ('status',))
+outbox_messages = Counter(
+    registry, 'blog_outbox_messages_total', '아웃박스 메일 처리 결과 (sent/retry/dead/throttled)', ('result',))
+outbox_pending = Gauge(
+    registry, 'blog_outbox_pending', '발송 시각이 된 대기 메일 수')
+analytics_events = Counter(
+    registry, 'blog_analytics_events_total', '조회 이벤트 처리 수 (spooled/ingested/dropped)', ('result',))
+analytics_spool = Gauge(
+    registry, 'blog_analytics_spool_files', '적재를 기다리는 조회 이벤트 스풀 파일 수')
+analytics_spool_lag = Gauge(
+    registry, 'blog_analytics_spool_lag_seconds', '가장 오래된 미적재 스풀 파일의 경과 시간(초)')
+surrogate_purges = Counter(
+    registry, 'blog_surrogate_purge_keys_total', '앞단 캐시 서로게이트 키 퍼지 수 (purged/failed)', ('result',))
+scheduled_backlog = Gauge(
+    registry, 'blog_scheduled_publish_backlog', '발행 시각이 지났지만 아직 scheduled 인 게시글 수')
+
+
+@registry.register_collector
+def collect_scheduled_backlog():
+    count = Post.objects.filter(status='scheduled', published_at__lte=timezone.now()).count()
+    return [(scheduled_backlog.name, {(): count})]
+
+
+@registry.register_collector
+def collect_task_queue():
+    now = timezone.now()
+    ready = Task.objects.filter(status='queued', run_at__lte=now).count()
+    running = Task.objects.filter(status='running').count()
+    return [(task_queue.name, {('queued',): ready, ('running',): running})]
+
+
+@registry.register_collector
+def collect_outbox_pending():
+    count = OutboxMessage.objects.filter(status='pending', next_attempt_at__lte=timezone.now()).count()
+    return [(outbox_pending.name, {(): count})]
+
+
+@registry.register_collector
+def collect_analytics_spool():
+    directory = settings.BLOG_ANALYTICS['SPOOL_DIR']
+    if not directory:
+        return []
+    try:
+        mtimes = [entry.stat().st_mtime for entry in os.scandir(directory) if entry.name.endswith('.json')]
+    except FileNotFoundError:
+        mtimes = []
+    lag = time.time() - min(mtimes) if mtimes else 0
+    return [(analytics_spool.name, {(): len(mtimes)}), (analytics_spool_lag.name, {(): round(lag, 3)})]
+
+
+def observe_request(request, response, stats, elapsed):
+    """요청 1건의 계측 결과(instrumentation.RequestStats)를 메트릭에 반영"""
+    match = getattr(request, 'resolver_match', None)
+    view = (match.url_name or match.view_name) if match else 'unmatched'
+    http_requests.inc(view=view, method=request.method, status=response.status_code)
+    http_request_duration.observe(elapsed, view=view)
+    db_query_duration.observe(stats.sql_time, view=view)
+    if stats.queries:
+        db_queries.inc(stats.queries, view=view)
+    if stats.cache_hits:
+        cache_lookups.inc(stats.cache_hits, result='hit')
+    if stats.cache_misses:
+        cache_lookups.inc(stats.cache_misses, result='miss')
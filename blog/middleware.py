@@ -0,0 +1,192 @@
+"""
+블로그 미들웨어
+"""
+import asyncio
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.db import DatabaseError
+
+from . import instrumentation, metrics
+from .models import RequestProfile
+from .profiling import profile_call
+from .db.routers import mark_unhealthy, replica_routing
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+logger = logging.getLogger(__name__)
+performance_logger = logging.getLogger('blog.performance')
+
+
+class PerformanceMiddleware:
+    """
+    요청별 쿼리 수/SQL 시간/템플릿 시간/캐시 적중을 계측
+    관리자에게는 Server-Timing 헤더로 보여 주고, 느린 요청/쿼리와 반복 쿼리(N+1 의심)는 로그로 남김
+    URL 이름별 지연/SQL 시간/캐시 적중은 blog.metrics 에 반영
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        options = settings.BLOG_PERFORMANCE
+        self.slow_request_ms = options['SLOW_REQUEST_MS']
+        self.slow_query_ms = options['SLOW_QUERY_MS']
+        self.duplicate_threshold = options['DUPLICATE_QUERY_THRESHOLD']
+
+    def __call__(self, request):
+        stats, token = instrumentation.start_request(self.slow_query_ms, self.duplicate_threshold)
+        request.performance = stats
+        try:
+            response = self.get_response(request)
+        finally:
+            instrumentation.finish_request(token)
+
+        elapsed = stats.elapsed
+        total_ms = elapsed * 1000
+        metrics.observe_request(request, response, stats, elapsed)
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_staff:
+            response['Server-Timing'] = self.server_timing(stats, total_ms)
+        self.log(request, stats, total_ms)
+        return response
+
+    def server_timing(self, stats, total_ms):
+        return ', '.join([
+            f'db;dur={stats.sql_time * 1000:.1f};desc="{stats.queries} queries"',
+            f'tpl;dur={stats.template_time * 1000:.1f}',
+            f'cache;desc="hit {stats.cache_hits} / miss {stats.cache_misses}"',
+            f'total;dur={total_ms:.1f}',
+        ])
+
+    def log(self, request, stats, total_ms):
+        path = request.get_full_path()
+        if total_ms >= self.slow_request_ms:
+            performance_logger.warning(
+                '느린 요청 %s %s %.1fms (SQL %d개 %.1fms, 템플릿 %.1fms)',
+                request.method, path, total_ms,
+                stats.queries, stats.sql_time * 1000, stats.template_time * 1000,
+            )
+        for duration_ms, sql, site in stats.slow_queries:
+            performance_logger.warning('느린 쿼리 %.1fms %s [%s] (%s)', duration_ms, path, site, sql)
+        for count, sql, site in stats.repeated_queries():
+            performance_logger.warning('반복 쿼리(N+1 의심) %d회 %s [%s] (%s)', count, path, site, sql)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    안전한 요청(GET/HEAD)의 읽기 쿼리를 복제본으로 보냄
+    쓰기 요청 직후에는 쿠키로 REPLICA_PIN_SECONDS 동안 primary 에 고정 (read-your-writes)
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        use_replicas = (
+            bool(settings.DATABASE_REPLICAS)
+            and request.method in SAFE_METHODS
+            and settings.REPLICA_PIN_COOKIE_NAME not in request.COOKIES
+        )
+        with replica_routing(use_replicas) as state:
+            request.replica_routing = state
+            response = self.get_response(request)
+
+        if state.wrote and request.method not in SAFE_METHODS:
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE_NAME,
+                '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+    def process_exception(self, request, exception):
+        """복제본 쿼리가 실패했으면 다음 확인 때까지 해당 복제본을 제외하고 primary 로 뷰를 다시 실행
+        (안전한 요청만, 한 번만. primary 에서 난 오류, 이미 쓰기를 한 요청, 비동기 뷰는 다시 실행하지 않음)"""
+        state = getattr(request, 'replica_routing', None)
+        if state is None or state.failed_replica is None or not isinstance(exception, DatabaseError):
+            return None
+        mark_unhealthy(state.failed_replica)
+        logger.warning('복제본 %s 쿼리 실패: %s', state.failed_replica, exception)
+        state.failed_replica = None
+        state.replica = None
+        state.use_replicas = False
+        if state.wrote:
+            # 부수 효과(조회수 등)가 두 번 남지 않도록
+            return None
+        match = request.resolver_match
+        if match is None or asyncio.iscoroutinefunction(match.func):
+            return None
+        return match.func(request, *match.args, **match.kwargs)
+
+
+class ProfilingMiddleware:
+    """
+    요청 프로파일링 - 관리자가 X-Profile 헤더나 ?_profile 파라미터로 요청하거나,
+    BLOG_PROFILING['SAMPLE_RATE'] 비율로 샘플링된 요청을 프로파일링해 RequestProfile 로 저장
+    헤더/파라미터 값이 'sample' 이면 스택 샘플링, 그 밖에는 기본 방식(MODE) 사용
+    트래픽 샘플링은 항상 스택 샘플링
+    """
+    QUERY_PARAM = '_profile'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        options = settings.BLOG_PROFILING
+        self.sample_rate = options['SAMPLE_RATE']
+        self.default_mode = options['MODE']
+        self.interval = options['SAMPLE_INTERVAL']
+        self.max_stored = options['MAX_STORED']
+
+    def __call__(self, request):
+        trigger, mode = self.get_trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        stats = getattr(request, 'performance', None)
+        queries_before = stats.queries if stats else 0
+        sql_before = stats.sql_time if stats else 0.0
+        start = time.perf_counter()
+        response, result = profile_call(lambda: self.get_response(request), mode, self.interval)
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        self.save(request, response, result, {
+            'mode': mode,
+            'trigger': trigger,
+            'duration_ms': duration_ms,
+            'query_count': (stats.queries - queries_before) if stats else 0,
+            'sql_ms': ((stats.sql_time - sql_before) * 1000) if stats else 0.0,
+        })
+        return response
+
+    def get_trigger(self, request):
+        """(계기, 방식) - 프로파일링하지 않으면 (None, None)"""
+        # 꺼져 있을 때는 딕셔너리 조회 두 번과 (샘플링 시) 난수 한 번만 든다
+        flag = request.headers.get('X-Profile')
+        trigger = 'header'
+        if flag is None:
+            flag = request.GET.get(self.QUERY_PARAM)
+            trigger = 'query'
+        if flag is not None and request.user.is_staff:
+            return trigger, 'sample' if flag == 'sample' else self.default_mode
+        if self.sample_rate and random.random() < self.sample_rate:
+            # 일반 트래픽은 오버헤드가 작은 스택 샘플링으로
+            return 'sample', 'sample'
+        return None, None
+
+    def save(self, request, response, result, values):
+        match = getattr(request, 'resolver_match', None)
+        RequestProfile.objects.create(
+            method=request.method,
+            path=request.get_full_path()[:500],
+            view_name=(match.url_name or match.view_name) if match else '',
+            user=request.user if request.user.is_authenticated else None,
+            status_code=response.status_code,
+            summary=result.summary,
+            collapsed=result.collapsed,
+            pstats_data=result.pstats_data,
+            **values,
+        )
+        # 오래된 프로파일 정리
+        stale = RequestProfile.objects.values_list('pk', flat=True)[self.max_stored:self.max_stored + 1]
+        if stale:
+            RequestProfile.objects.filter(pk__lte=stale[0]).delete()
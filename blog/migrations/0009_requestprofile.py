@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0008_userprofile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('method', models.CharField(max_length=10, verbose_name='메서드')),
+                ('path', models.CharField(max_length=500, verbose_name='경로')),
+                ('view_name', models.CharField(blank=True, max_length=200, verbose_name='URL 이름')),
+                ('status_code', models.PositiveSmallIntegerField(verbose_name='응답 코드')),
+                ('duration_ms', models.FloatField(verbose_name='소요 시간(ms)')),
+                ('query_count', models.PositiveIntegerField(default=0, verbose_name='쿼리 수')),
+                ('sql_ms', models.FloatField(default=0, verbose_name='SQL 시간(ms)')),
+                ('mode', models.CharField(choices=[('cprofile', 'cProfile'), ('sample', '스택 샘플링')], max_length=10, verbose_name='방식')),
+                ('trigger', models.CharField(choices=[('header', 'X-Profile 헤더'), ('query', '쿼리 파라미터'), ('sample', '트래픽 샘플링')], max_length=10, verbose_name='계기')),
+                ('summary', models.TextField(verbose_name='요약')),
+                ('collapsed', models.TextField(blank=True, verbose_name='collapsed 스택')),
+                ('pstats_data', models.BinaryField(blank=True, null=True, verbose_name='pstats 데이터')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='기록일')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='request_profiles', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '요청 프로파일',
+                'verbose_name_plural': '요청 프로파일 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
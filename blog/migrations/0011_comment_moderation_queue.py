@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:10
+
+from django.db import migrations, models
+
+
+def backfill_last_reported_at(apps, schema_editor):
+    """기존 신고의 최근 신고일 채우기"""
+    Comment = apps.get_model('blog', 'Comment')
+    CommentReport = apps.get_model('blog', 'CommentReport')
+    latest = CommentReport.objects.filter(
+        comment=models.OuterRef('pk')
+    ).order_by('-created_at').values('created_at')[:1]
+    Comment.objects.filter(report_count__gt=0).update(last_reported_at=models.Subquery(latest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='last_reported_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='최근 신고일'),
+        ),
+        migrations.RunPython(backfill_last_reported_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('report_count__gt', 0)), fields=['-report_count', '-last_reported_at'], name='comment_moderation_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:15
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_comment_moderation_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='작업 이름')),
+                ('args', models.JSONField(blank=True, default=list, verbose_name='위치 인자')),
+                ('kwargs', models.JSONField(blank=True, default=dict, verbose_name='키워드 인자')),
+                ('priority', models.SmallIntegerField(default=0, verbose_name='우선순위')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='queued', max_length=10, verbose_name='상태')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='실행 예정')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=5, verbose_name='최대 시도 횟수')),
+                ('idempotency_key', models.CharField(blank=True, max_length=200, null=True, unique=True, verbose_name='멱등 키')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='실행 워커')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='실행 시작')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록일')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일')),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업 목록',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'queued')), fields=['-priority', 'run_at'], name='task_queue_idx'), models.Index(condition=models.Q(('status', 'running')), fields=['locked_at'], name='task_running_idx'), models.Index(fields=['status', 'finished_at'], name='task_finished_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:18
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_task'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_email', models.CharField(max_length=254, verbose_name='보낸 사람')),
+                ('recipients', models.JSONField(verbose_name='받는 사람')),
+                ('domain', models.CharField(max_length=253, verbose_name='수신 도메인')),
+                ('subject', models.CharField(blank=True, max_length=255, verbose_name='제목')),
+                ('mime', models.BinaryField(verbose_name='MIME 메시지')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('sending', '발송 중'), ('sent', '발송 완료'), ('dead', '발송 포기')], default='pending', max_length=10, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='다음 시도')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='발송 프로세스')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 시작')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록일')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='발송일')),
+            ],
+            options={
+                'verbose_name': '발송 대기 메일',
+                'verbose_name_plural': '발송 대기 메일 목록',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['next_attempt_at'], name='outbox_pending_idx'), models.Index(condition=models.Q(('status', 'sending')), fields=['locked_at'], name='outbox_sending_idx'), models.Index(fields=['status', 'sent_at'], name='outbox_sent_idx')],
+            },
+        ),
+    ]
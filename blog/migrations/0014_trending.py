@@ -0,0 +1,72 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_outboxmessage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrendingPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=50, verbose_name='범위')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='순위')),
+                ('score', models.FloatField(verbose_name='점수')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='blog.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '트렌딩 게시글',
+                'verbose_name_plural': '트렌딩 게시글 목록',
+                'ordering': ['scope', 'rank'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostViewBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(verbose_name='시간대')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='조회수')),
+                ('scored_views', models.PositiveIntegerField(default=0, verbose_name='점수 반영 조회수')),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='view_buckets', to='blog.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '시간대별 조회수',
+                'verbose_name_plural': '시간대별 조회수 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='PostTrendScore',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='trend_score', serialize=False, to='blog.post', verbose_name='게시글')),
+                ('score', models.FloatField(default=0, verbose_name='점수')),
+                ('scored_at', models.DateTimeField(verbose_name='계산 시각')),
+            ],
+            options={
+                'verbose_name': '트렌딩 점수',
+                'verbose_name_plural': '트렌딩 점수 목록',
+                'indexes': [models.Index(fields=['scored_at'], name='trend_score_scored_at_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='trendingpost',
+            constraint=models.UniqueConstraint(fields=('scope', 'rank'), name='trending_post_scope_rank_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='postviewbucket',
+            index=models.Index(condition=models.Q(('views__gt', models.F('scored_views'))), fields=['hour'], name='view_bucket_dirty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postviewbucket',
+            index=models.Index(fields=['hour'], name='view_bucket_hour_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='postviewbucket',
+            constraint=models.UniqueConstraint(fields=('post', 'hour'), name='post_view_bucket_unique'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_trending'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='날짜')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='조회수')),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='blog.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '일별 조회수',
+                'verbose_name_plural': '일별 조회수 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='HitEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(verbose_name='조회 시각')),
+                ('referrer', models.CharField(blank=True, max_length=255, verbose_name='유입 호스트')),
+                ('post', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='blog.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '조회 이벤트',
+                'verbose_name_plural': '조회 이벤트 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='ReferrerDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='날짜')),
+                ('referrer', models.CharField(blank=True, max_length=255, verbose_name='유입 호스트')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='조회수')),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='referrer_stats', to='blog.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '유입 경로별 조회수',
+                'verbose_name_plural': '유입 경로별 조회수 목록',
+                'indexes': [models.Index(fields=['day'], name='referrer_daily_stats_day_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='referrerdailystats',
+            constraint=models.UniqueConstraint(fields=('post', 'day', 'referrer'), name='referrer_daily_stats_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='postdailystats',
+            index=models.Index(fields=['day'], name='post_daily_stats_day_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='postdailystats',
+            constraint=models.UniqueConstraint(fields=('post', 'day'), name='post_daily_stats_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='hitevent',
+            index=models.Index(fields=['created_at'], name='hit_event_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:29
+
+from django.db import migrations, models
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+
+def backfill_monthly_archive(apps, schema_editor):
+    """기존 발행 게시글의 월별 수 채우기"""
+    Post = apps.get_model('blog', 'Post')
+    MonthlyArchive = apps.get_model('blog', 'MonthlyArchive')
+    published = models.Q(status='published') | models.Q(status='scheduled', published_at__lte=timezone.now())
+    rows = Post.objects.filter(published, is_public=True).order_by().annotate(
+        month=TruncMonth('created_at')
+    ).values('month').annotate(count=models.Count('pk'))
+    MonthlyArchive.objects.bulk_create([
+        MonthlyArchive(year=row['month'].year, month=row['month'].month, post_count=row['count'])
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_analytics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(verbose_name='연도')),
+                ('month', models.PositiveSmallIntegerField(verbose_name='월')),
+                ('post_count', models.PositiveIntegerField(default=0, verbose_name='게시글 수')),
+            ],
+            options={
+                'verbose_name': '월별 보관함',
+                'verbose_name_plural': '월별 보관함 목록',
+                'ordering': ['-year', '-month'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='monthlyarchive',
+            constraint=models.UniqueConstraint(fields=('year', 'month'), name='monthly_archive_unique'),
+        ),
+        migrations.RunPython(backfill_monthly_archive, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,48 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils.text import slugify
+from django.utils import timezone
+
+
+class TrackChangesMixin:
+    """DB 에서 읽어온 값을 기억해 두고, 바뀐 필드만 저장 (바뀐 것이 없으면 쿼리 없음)"""
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def get_changed_fields(self):
+        """읽어온 뒤 바뀐 필드 이름 목록 (DB 에서 읽지 않은 인스턴스는 None)"""
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is None:
+            return None
+        changed = []
+        for field in self._meta.concrete_fields:
+            if field.attname not in loaded:
+                continue
+            value = getattr(self, field.attname)
+            # 새로 올린 파일은 저장 전까지 이름이 같아도 변경으로 본다
+            if value != loaded[field.attname] or not getattr(value, '_committed', True):
+                changed.append(field.name)
+        return changed
+
+    def has_changes(self):
+        changed = self.get_changed_fields()
+        return changed is None or bool(changed)
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            changed = self.get_changed_fields()
+            if changed == []:
+                return
+            if changed is not None:
+                kwargs['update_fields'] = changed
+        super().save(*args, **kwargs)
+        self._loaded_values = {
+            field.attname: field.value_from_object(self) for field in self._meta.concrete_fields
+        }
 
 
 class Category(models.Model):
@@ -119,6 +161,20 @@ class Post(models.Model):
         verbose_name = '게시글'
         verbose_name_plural = '게시글 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 발행글 목록 (최신순/조회순), 카테고리별 목록
+            models.Index(fields=['is_public', 'status', '-created_at'], name='post_pub_status_created_idx'),
+            models.Index(fields=['is_public', 'status', '-views'], name='post_pub_status_views_idx'),
+            models.Index(fields=['category', 'is_public', 'status', '-created_at'], name='post_cat_pub_status_idx'),
+            # 작성자별 글 수/내 글 목록
+            models.Index(fields=['author', 'status'], name='post_author_status_idx'),
+            # 예약 발행 대상 (scheduled 글만 담는 부분 인덱스)
+            models.Index(
+                fields=['published_at'],
+                condition=models.Q(status='scheduled'),
+                name='post_scheduled_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.title
@@ -138,13 +194,15 @@ class Post(models.Model):
         return reverse('post_detail', kwargs={'pk': self.pk})
     
     def increment_views(self):
-        """조회수 증가"""
+        """조회수 증가 (조회수 컬럼만 원자적으로 갱신)"""
+        Post.objects.filter(pk=self.pk).update(views=models.F('views') + 1)
         self.views += 1
-        self.save(update_fields=['views'])
 
 
 class Comment(models.Model):
     """댓글 모델"""
+    AUTO_HIDE_REPORT_COUNT = 3  # 이 횟수만큼 신고되면 자동 숨김
+
     post = models.ForeignKey(
         Post, 
         on_delete=models.CASCADE, 
@@ -159,13 +217,27 @@ class Comment(models.Model):
     )
     content = models.TextField(verbose_name='내용')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='작성일')
+    # update() 로 숨김 상태를 바꿀 때도 함께 갱신 (prerender 증분 빌드가 바뀐 댓글을 찾음)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     is_hidden = models.BooleanField(default=False, verbose_name='숨김')
-    report_count = models.PositiveIntegerField(default=0, verbose_name='신고 횟수')
+    report_count = models.PositiveIntegerField(default=0, verbose_name='신고 횟수')  # 검토 전 신고 수
+    last_reported_at = models.DateTimeField(null=True, blank=True, verbose_name='최근 신고일')
     
     class Meta:
         verbose_name = '댓글'
         verbose_name_plural = '댓글 목록'
         ordering = ['created_at']
+        indexes = [
+            # 게시글 상세의 댓글 목록, 내 댓글 목록
+            models.Index(fields=['post', 'created_at'], name='comment_post_created_idx'),
+            models.Index(fields=['author', '-created_at'], name='comment_author_created_idx'),
+            # 신고 검토 대기열 (신고 많은 순, 최근 신고 순) - 처리 안 된 신고가 있는 댓글만 색인
+            models.Index(
+                fields=['-report_count', '-last_reported_at'],
+                name='comment_moderation_idx',
+                condition=models.Q(report_count__gt=0),
+            ),
+        ]
     
     def __str__(self):
         return f'{self.author.username}: {self.content[:20]}'
@@ -232,7 +304,7 @@ class PostImage(models.Model):
         return f'{self.uploaded_by.username} - {self.image.name}'
 
 
-class UserProfile(models.Model):
+class UserProfile(TrackChangesMixin, models.Model):
     """사용자 프로필"""
     user = models.OneToOneField(
         User,
@@ -268,3 +340,325 @@ class UserProfile(models.Model):
         if self.skills:
             return [s.strip() for s in self.skills.split(',') if s.strip()]
         return []
+
+
+class RequestProfile(models.Model):
+    """요청 프로파일 (관리자 요청 또는 샘플링된 요청)"""
+    MODE_CHOICES = [
+        ('cprofile', 'cProfile'),
+        ('sample', '스택 샘플링'),
+    ]
+    TRIGGER_CHOICES = [
+        ('header', 'X-Profile 헤더'),
+        ('query', '쿼리 파라미터'),
+        ('sample', '트래픽 샘플링'),
+    ]
+    
+    method = models.CharField(max_length=10, verbose_name='메서드')
+    path = models.CharField(max_length=500, verbose_name='경로')
+    view_name = models.CharField(max_length=200, blank=True, verbose_name='URL 이름')
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='request_profiles',
+        verbose_name='사용자'
+    )
+    status_code = models.PositiveSmallIntegerField(verbose_name='응답 코드')
+    duration_ms = models.FloatField(verbose_name='소요 시간(ms)')
+    query_count = models.PositiveIntegerField(default=0, verbose_name='쿼리 수')
+    sql_ms = models.FloatField(default=0, verbose_name='SQL 시간(ms)')
+    mode = models.CharField(max_length=10, choices=MODE_CHOICES, verbose_name='방식')
+    trigger = models.CharField(max_length=10, choices=TRIGGER_CHOICES, verbose_name='계기')
+    summary = models.TextField(verbose_name='요약')
+    collapsed = models.TextField(blank=True, verbose_name='collapsed 스택')
+    pstats_data = models.BinaryField(null=True, blank=True, verbose_name='pstats 데이터')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='기록일')
+    
+    class Meta:
+        verbose_name = '요청 프로파일'
+        verbose_name_plural = '요청 프로파일 목록'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f'{self.method} {self.path} ({self.duration_ms:.0f}ms)'
+
+
+class Task(models.Model):
+    """백그라운드 작업 (blog.tasks, python manage.py run_tasks 가 실행)"""
+    STATUS_CHOICES = [
+        ('queued', '대기'),
+        ('running', '실행 중'),
+        ('done', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    name = models.CharField(max_length=100, verbose_name='작업 이름')
+    args = models.JSONField(default=list, blank=True, verbose_name='위치 인자')
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name='키워드 인자')
+    priority = models.SmallIntegerField(default=0, verbose_name='우선순위')  # 클수록 먼저 실행
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued', verbose_name='상태')
+    run_at = models.DateTimeField(default=timezone.now, verbose_name='실행 예정')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')
+    max_attempts = models.PositiveSmallIntegerField(default=5, verbose_name='최대 시도 횟수')
+    idempotency_key = models.CharField(
+        max_length=200,
+        unique=True,
+        null=True,
+        blank=True,
+        verbose_name='멱등 키'
+    )
+    last_error = models.TextField(blank=True, verbose_name='마지막 오류')
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name='실행 워커')
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name='실행 시작')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='등록일')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='종료일')
+    
+    class Meta:
+        verbose_name = '백그라운드 작업'
+        verbose_name_plural = '백그라운드 작업 목록'
+        ordering = ['-created_at']
+        indexes = [
+            # 워커가 꺼낼 작업 (우선순위, 실행 예정 순) - 대기 중인 작업만 색인
+            models.Index(
+                fields=['-priority', 'run_at'],
+                name='task_queue_idx',
+                condition=models.Q(status='queued'),
+            ),
+            # 멈춘 워커의 작업 회수
+            models.Index(
+                fields=['locked_at'],
+                name='task_running_idx',
+                condition=models.Q(status='running'),
+            ),
+            # 오래된 완료/실패 작업 정리
+            models.Index(fields=['status', 'finished_at'], name='task_finished_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.name} #{self.pk} ({self.get_status_display()})'
+
+
+class OutboxMessage(models.Model):
+    """발송 대기 메일 (blog.outbox.OutboxEmailBackend 가 기록, send_outbox 가 발송)"""
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('sending', '발송 중'),
+        ('sent', '발송 완료'),
+        ('dead', '발송 포기'),
+    ]
+    
+    from_email = models.CharField(max_length=254, verbose_name='보낸 사람')
+    recipients = models.JSONField(verbose_name='받는 사람')  # 봉투(envelope) 수신자 - 같은 도메인만
+    domain = models.CharField(max_length=253, verbose_name='수신 도메인')
+    subject = models.CharField(max_length=255, blank=True, verbose_name='제목')
+    mime = models.BinaryField(verbose_name='MIME 메시지')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending', verbose_name='상태')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name='다음 시도')
+    last_error = models.TextField(blank=True, verbose_name='마지막 오류')
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name='발송 프로세스')
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name='발송 시작')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='등록일')
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name='발송일')
+    
+    class Meta:
+        verbose_name = '발송 대기 메일'
+        verbose_name_plural = '발송 대기 메일 목록'
+        ordering = ['-created_at']
+        indexes = [
+            # 발송할 메일 (다음 시도 시각 순) - 대기 중인 메일만 색인
+            models.Index(
+                fields=['next_attempt_at'],
+                name='outbox_pending_idx',
+                condition=models.Q(status='pending'),
+            ),
+            # 멈춘 발송 프로세스의 메일 회수
+            models.Index(
+                fields=['locked_at'],
+                name='outbox_sending_idx',
+                condition=models.Q(status='sending'),
+            ),
+            # 오래된 발송 완료 메일 정리
+            models.Index(fields=['status', 'sent_at'], name='outbox_sent_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.subject} → {", ".join(self.recipients)} ({self.get_status_display()})'
+
+
+class PostViewBucket(models.Model):
+    """게시글 시간대별 조회수 (조회 이벤트 집계, blog.trending 에서 사용)"""
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='view_buckets',
+        db_index=False,  # (post, hour) 유니크 제약의 인덱스로 충분
+        verbose_name='게시글'
+    )
+    hour = models.DateTimeField(verbose_name='시간대')  # 정시로 자른 시각
+    views = models.PositiveIntegerField(default=0, verbose_name='조회수')
+    scored_views = models.PositiveIntegerField(default=0, verbose_name='점수 반영 조회수')
+    
+    class Meta:
+        verbose_name = '시간대별 조회수'
+        verbose_name_plural = '시간대별 조회수 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'hour'], name='post_view_bucket_unique'),
+        ]
+        indexes = [
+            # 아직 트렌딩 점수에 반영하지 않은 조회가 있는 버킷만 색인
+            models.Index(
+                fields=['hour'],
+                name='view_bucket_dirty_idx',
+                condition=models.Q(views__gt=models.F('scored_views')),
+            ),
+            models.Index(fields=['hour'], name='view_bucket_hour_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.post_id} @ {self.hour:%Y-%m-%d %H}시: {self.views}'
+
+
+class PostTrendScore(models.Model):
+    """게시글 트렌딩 점수 (scored_at 시점 기준으로 감쇠된 값)"""
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='trend_score',
+        verbose_name='게시글'
+    )
+    score = models.FloatField(default=0, verbose_name='점수')
+    scored_at = models.DateTimeField(verbose_name='계산 시각')
+    
+    class Meta:
+        verbose_name = '트렌딩 점수'
+        verbose_name_plural = '트렌딩 점수 목록'
+        indexes = [
+            models.Index(fields=['scored_at'], name='trend_score_scored_at_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.post_id}: {self.score:.2f}'
+
+
+class TrendingPost(models.Model):
+    """범위(전체/카테고리/태그)별 트렌딩 Top-K (refresh_trending 이 주기적으로 다시 만듦)"""
+    scope = models.CharField(max_length=50, verbose_name='범위')  # 'all', 'category:<id>', 'tag:<id>'
+    rank = models.PositiveSmallIntegerField(verbose_name='순위')
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='게시글'
+    )
+    score = models.FloatField(verbose_name='점수')
+    
+    class Meta:
+        verbose_name = '트렌딩 게시글'
+        verbose_name_plural = '트렌딩 게시글 목록'
+        ordering = ['scope', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['scope', 'rank'], name='trending_post_scope_rank_unique'),
+        ]
+    
+    def __str__(self):
+        return f'[{self.scope}] {self.rank}. {self.post_id}'
+
+
+class HitEvent(models.Model):
+    """게시글 조회 원본 이벤트 (추가 전용, blog.analytics 가 묶어서 기록)"""
+    created_at = models.DateTimeField(verbose_name='조회 시각')
+    # 추가 전용 로그이므로 FK 제약/인덱스 없이 번호만 보관 (게시글 삭제와 무관하게 보존 기간까지 유지)
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name='+',
+        verbose_name='게시글'
+    )
+    referrer = models.CharField(max_length=255, blank=True, verbose_name='유입 호스트')  # 빈 값 = 직접 방문
+    
+    class Meta:
+        verbose_name = '조회 이벤트'
+        verbose_name_plural = '조회 이벤트 목록'
+        indexes = [
+            models.Index(fields=['created_at'], name='hit_event_created_at_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.post_id} @ {self.created_at:%Y-%m-%d %H:%M:%S}'
+
+
+class PostDailyStats(models.Model):
+    """게시글 일별 조회수 (조회 이벤트 집계)"""
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='daily_stats',
+        db_index=False,  # (post, day) 유니크 제약의 인덱스로 충분
+        verbose_name='게시글'
+    )
+    day = models.DateField(verbose_name='날짜')
+    views = models.PositiveIntegerField(default=0, verbose_name='조회수')
+    
+    class Meta:
+        verbose_name = '일별 조회수'
+        verbose_name_plural = '일별 조회수 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'day'], name='post_daily_stats_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['day'], name='post_daily_stats_day_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.post_id} @ {self.day}: {self.views}'
+
+
+class ReferrerDailyStats(models.Model):
+    """게시글 유입 호스트별 일별 조회수 (조회 이벤트 집계)"""
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='referrer_stats',
+        db_index=False,  # (post, day, referrer) 유니크 제약의 인덱스로 충분
+        verbose_name='게시글'
+    )
+    day = models.DateField(verbose_name='날짜')
+    referrer = models.CharField(max_length=255, blank=True, verbose_name='유입 호스트')
+    views = models.PositiveIntegerField(default=0, verbose_name='조회수')
+    
+    class Meta:
+        verbose_name = '유입 경로별 조회수'
+        verbose_name_plural = '유입 경로별 조회수 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'day', 'referrer'], name='referrer_daily_stats_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['day'], name='referrer_daily_stats_day_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.post_id} @ {self.day} ← {self.referrer or "직접"}: {self.views}'
+
+
+class MonthlyArchive(models.Model):
+    """월별 발행 게시글 수 (blog.archive 가 게시글 변경 시 해당 월만 다시 셈)"""
+    year = models.PositiveSmallIntegerField(verbose_name='연도')
+    month = models.PositiveSmallIntegerField(verbose_name='월')
+    post_count = models.PositiveIntegerField(default=0, verbose_name='게시글 수')
+    
+    class Meta:
+        verbose_name = '월별 보관함'
+        verbose_name_plural = '월별 보관함 목록'
+        ordering = ['-year', '-month']
+        constraints = [
+            models.UniqueConstraint(fields=['year', 'month'], name='monthly_archive_unique'),
+        ]
+    
+    def __str__(self):
+        return f'{self.year}년 {self.month}월: {self.post_count}'
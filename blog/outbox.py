@@ -0,0 +1,216 @@
+"""
+트랜잭션 메일 아웃박스
+
+EMAIL_BACKEND = 'blog.outbox.OutboxEmailBackend' 이면 send_mail() 등은 메일을 보내지 않고
+MIME 메시지를 blog_outboxmessage 테이블에 기록만 한다. 호출한 쪽의 트랜잭션 안에서 기록되므로
+작업이 롤백되면 메일도 나가지 않고, SMTP 서버가 느려도 요청(gunicorn 워커)이 막히지 않는다.
+
+send_outbox 명령(Sender)이 BLOG_OUTBOX['BACKEND'] 연결 하나를 열어 둔 채 배치 단위로 발송한다.
+    - 수신자를 도메인별로 나눠 저장하고, 도메인별 분당 발송 수(DOMAIN_RATES)를 넘으면 뒤로 미룸
+    - 일시 오류(연결 끊김, 4xx)는 지수 백오프로 재시도, 영구 오류(5xx)나 MAX_ATTEMPTS 초과는 'dead'
+    - 발송 직후 프로세스가 죽으면 LEASE_SECONDS 뒤 다시 보내므로 드물게 중복 발송될 수 있다
+"""
+import email
+import logging
+import os
+import random
+import smtplib
+import socket
+import time
+import traceback
+from collections import deque
+from datetime import timedelta
+from email.utils import parseaddr
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.mail.message import MIMEMixin
+from django.db import connections, router, transaction
+from django.db.models import Subquery
+from django.utils import timezone
+
+from . import metrics
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY = 6 * 3600  # 재시도 간격 상한(초)
+
+
+def recipient_domain(address):
+    return parseaddr(address)[1].rpartition('@')[2].lower()
+
+
+class OutboxEmailBackend(BaseEmailBackend):
+    """메일을 보내지 않고 아웃박스 테이블에 기록하는 EMAIL_BACKEND"""
+
+    def send_messages(self, email_messages):
+        rows = []
+        count = 0
+        for message in email_messages:
+            by_domain = {}
+            for address in message.recipients():
+                by_domain.setdefault(recipient_domain(address), []).append(address)
+            if not by_domain:
+                continue
+            mime = message.message().as_bytes()
+            rows.extend(
+                OutboxMessage(
+                    from_email=message.from_email,
+                    recipients=recipients,
+                    domain=domain,
+                    subject=str(message.subject)[:255],
+                    mime=mime,
+                )
+                for domain, recipients in by_domain.items()
+            )
+            count += 1
+        OutboxMessage.objects.bulk_create(rows)
+        return count
+
+
+class StoredMIMEMessage(MIMEMixin, email.message.Message):
+    """저장해 둔 MIME 을 그대로 다시 내보내는 메시지 (as_bytes(linesep=...) 지원)"""
+
+
+class StoredEmailMessage(EmailMessage):
+    """아웃박스 행을 일반 메일 백엔드로 보내기 위한 EmailMessage"""
+
+    def __init__(self, row):
+        super().__init__(from_email=row.from_email, to=row.recipients)
+        self.mime = bytes(row.mime)
+
+    def message(self):
+        return email.message_from_bytes(self.mime, _class=StoredMIMEMessage)
+
+
+def is_permanent(error):
+    """다시 보내도 실패할 오류인지 (SMTP 5xx)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+
+class DomainThrottle:
+    """도메인별 최근 60초 발송 수 제한 (발송 프로세스 안에서만 유효)"""
+
+    WINDOW = 60
+
+    def __init__(self, rates):
+        self.rates = rates
+        self.sent = {}
+
+    def wait_time(self, domain):
+        """지금 보내려면 기다려야 하는 시간(초) - 0 이면 바로 보낼 수 있음"""
+        rate = self.rates.get(domain, self.rates['default'])
+        sent = self.sent.setdefault(domain, deque())
+        now = time.monotonic()
+        while sent and now - sent[0] >= self.WINDOW:
+            sent.popleft()
+        if len(sent) < rate:
+            return 0
+        return self.WINDOW - (now - sent[0])
+
+    def record(self, domain):
+        self.sent.setdefault(domain, deque()).append(time.monotonic())
+
+
+class Sender:
+    """아웃박스 메일 발송 (send_outbox 명령에서 사용)"""
+
+    def __init__(self, batch_size=None):
+        self.config = settings.BLOG_OUTBOX
+        self.batch_size = batch_size or self.config['BATCH_SIZE']
+        self.throttle = DomainThrottle(self.config['DOMAIN_RATES'])
+        self.sender_id = f'{socket.gethostname()}:{os.getpid()}'
+        self.using = router.db_for_write(OutboxMessage)
+
+    def claim(self):
+        """보낼 메일을 최대 batch_size 개 선점"""
+        now = timezone.now()
+        queryset = OutboxMessage.objects.using(self.using).filter(
+            status='pending', next_attempt_at__lte=now
+        ).order_by('next_attempt_at')
+        claim_fields = {'status': 'sending', 'locked_by': self.sender_id, 'locked_at': now}
+
+        if connections[self.using].features.has_select_for_update_skip_locked:
+            # 다른 발송 프로세스가 잠근 행은 건너뜀
+            with transaction.atomic(using=self.using):
+                ids = list(
+                    queryset.select_for_update(skip_locked=True).values_list('pk', flat=True)[:self.batch_size]
+                )
+                OutboxMessage.objects.using(self.using).filter(pk__in=ids).update(**claim_fields)
+        else:
+            # SKIP LOCKED 가 없는 DB(SQLite): 고르기와 선점을 UPDATE 한 문장으로
+            OutboxMessage.objects.using(self.using).filter(
+                pk__in=Subquery(queryset.values('pk')[:self.batch_size]), status='pending'
+            ).update(**claim_fields)
+        return list(OutboxMessage.objects.using(self.using).filter(
+            status='sending', locked_by=self.sender_id, locked_at=now
+        ).order_by('next_attempt_at'))
+
+    def send_batch(self, rows):
+        """연결 하나로 rows 를 보내고 {결과: 개수} 반환"""
+        results = {'sent': 0, 'retry': 0, 'dead': 0, 'throttled': 0}
+        connection = get_connection(self.config['BACKEND'])
+        try:
+            for row in rows:
+                wait = self.throttle.wait_time(row.domain)
+                if wait:
+                    # 시도 횟수는 그대로 두고 뒤로 미룸
+                    self._update(row, status='pending', next_attempt_at=timezone.now() + timedelta(seconds=wait))
+                    results['throttled'] += 1
+                    continue
+                try:
+                    connection.open()  # 이미 열려 있으면 그대로 사용
+                    connection.send_messages([StoredEmailMessage(row)])
+                except Exception as error:
+                    results[self._fail(row, error)] += 1
+                    # 연결 상태를 알 수 없으므로 다음 메일은 새 연결로
+                    connection.close()
+                else:
+                    self.throttle.record(row.domain)
+                    self._update(row, status='sent', sent_at=timezone.now())
+                    results['sent'] += 1
+        finally:
+            connection.close()
+        for result, count in results.items():
+            if count:
+                metrics.outbox_messages.inc(count, result=result)
+        return results
+
+    def _fail(self, row, error):
+        attempts = row.attempts + 1
+        fields = {
+            'attempts': attempts,
+            'last_error': ''.join(traceback.format_exception_only(type(error), error)).strip(),
+        }
+        if is_permanent(error) or attempts >= self.config['MAX_ATTEMPTS']:
+            logger.error('메일 #%s 발송 포기 (%s회 시도, %s): %s', row.pk, attempts, row.domain, error)
+            self._update(row, status='dead', **fields)
+            return 'dead'
+        delay = min(self.config['RETRY_DELAY'] * 2 ** (attempts - 1), MAX_RETRY_DELAY) * random.uniform(0.8, 1.2)
+        logger.warning('메일 #%s 발송 실패 (%s회), %.0f초 뒤 재시도: %s', row.pk, attempts, delay, error)
+        self._update(row, status='pending', next_attempt_at=timezone.now() + timedelta(seconds=delay), **fields)
+        return 'retry'
+
+    def _update(self, row, **fields):
+        OutboxMessage.objects.using(self.using).filter(pk=row.pk, locked_by=self.sender_id).update(
+            locked_by='', locked_at=None, **fields
+        )
+
+    def requeue_stale(self):
+        """발송 중으로 LEASE_SECONDS 를 넘긴 메일(발송 프로세스 비정상 종료)을 다시 대기로"""
+        cutoff = timezone.now() - timedelta(seconds=self.config['LEASE_SECONDS'])
+        return OutboxMessage.objects.using(self.using).filter(status='sending', locked_at__lt=cutoff).update(
+            status='pending', locked_by='', locked_at=None
+        )
+
+    def prune_sent(self):
+        """보관 기간(KEEP_DAYS)이 지난 발송 완료 메일 삭제"""
+        cutoff = timezone.now() - timedelta(days=self.config['KEEP_DAYS'])
+        deleted, _ = OutboxMessage.objects.using(self.using).filter(status='sent', sent_at__lt=cutoff).delete()
+        return deleted
@@ -0,0 +1,51 @@
+"""
+큰 테이블용 페이지네이터
+"""
+import re
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+_EXPLAIN_ROWS_RE = re.compile(r'rows=(\d+)')
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    PostgreSQL 에서 COUNT(*) 대신 통계 추정치를 쓰는 페이지네이터
+    조건이 없으면 pg_class.reltuples, 있으면 EXPLAIN 의 예상 행 수를 쓰고,
+    추정치가 EXACT_COUNT_LIMIT 미만이면 정확히 센다. 그 밖의 DB 는 일반 Paginator 와 같다.
+    """
+    EXACT_COUNT_LIMIT = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql':
+            estimate = self._estimate(queryset, connection)
+            if estimate is not None and estimate >= self.EXACT_COUNT_LIMIT:
+                return estimate
+        return super().count
+
+    def _estimate(self, queryset, connection):
+        if not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= 0:
+                return row[0]
+            return None
+        match = _EXPLAIN_ROWS_RE.search(queryset.order_by().explain())
+        return int(match.group(1)) if match else None
+
+
+class KnownCountPaginator(Paginator):
+    """전체 개수를 이미 알 때(요약 테이블 등) COUNT(*) 없이 쓰는 페이지네이터"""
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = count
@@ -0,0 +1,247 @@
+"""
+공개 페이지 정적 사전 렌더링 (prerender_site 명령)
+
+비로그인 사용자에게 보이는 페이지(홈/카테고리/태그/보관함 목록의 모든 페이지, 게시글 상세, 피드, 사이트맵)를
+테스트 클라이언트로 렌더링해 BLOG_PRERENDER['OUTPUT_DIR'] 에 파일로 쓰고, 옆에 gzip 사본(.gz)을 둔다.
+렌더링 중에는 조회수를 세지 않는다 (is_prerendering()).
+
+증분 빌드:
+    각 페이지의 서로게이트 키(blog.surrogate)와 공개 게시글의 카테고리/태그/보이는 댓글 수를 매니페스트(.prerender.json)에
+    적어 두고, 지난 빌드 이후 바뀐 게시글(updated_at, 댓글 작성/숨김/삭제, 공개/비공개 전환, 삭제)의 키가 붙은 페이지만
+    다시 만든다. 삭제된 글은 매니페스트에 남은 이전 카테고리/태그 목록을 다시 만든다.
+    카테고리/태그가 바뀌면(택소노미 ETag) 전체를 다시 만든다. 조회수/인기글 순위는 증분 빌드에 반영되지 않으므로
+    주기적으로 --full 로 다시 만든다.
+
+파일 배치와 nginx 예시 (파일이 없거나 다른 쿼리 문자열이면 Django 오리진으로 - 댓글, 로그인, 검색 등):
+    /post/12/           -> post/12/index.html
+    /category/django/?page=3&sort=latest -> category/django/page-3.html
+    /feed/              -> feed/index.xml,  /sitemap.xml -> sitemap.xml
+
+    map $args $prerendered {
+        "~^(sort=latest)?$"                 index;
+        "~^page=(?<n>\\d+)(&sort=latest)?$"  page-$n;
+        default                             "";
+    }
+    location / {
+        gzip_static on;
+        try_files $uri$prerendered.html $uri$prerendered.xml $uri @django;
+    }
+"""
+import gzip
+import json
+import math
+import os
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db.models import Count
+from django.test import Client
+from django.urls import NoReverseMatch, reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import archive, surrogate
+from .models import Comment, Post
+from .taxonomy import get_taxonomy
+
+MANIFEST = '.prerender.json'
+PER_PAGE = 10  # 목록 뷰의 페이지 크기와 같아야 함
+
+_active = ContextVar('prerendering', default=False)
+
+
+def is_prerendering():
+    """사전 렌더링 중인 요청인지 (조회수/방문 쿠키를 남기지 않음)"""
+    return _active.get()
+
+
+@contextmanager
+def prerendering():
+    token = _active.set(True)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+# ----- 페이지 목록 -----
+
+def _paged(path, count):
+    """목록의 모든 페이지 경로 (글이 없어도 첫 페이지는 있음)"""
+    if path is None:
+        return []
+    return [path] + [f'{path}?page={number}' for number in range(1, math.ceil(count / PER_PAGE) + 1)]
+
+
+def _reverse(name, *args):
+    try:
+        return reverse(name, args=args)
+    except NoReverseMatch:
+        # 한글 슬러그는 <slug:> URL 패턴에 맞지 않아 주소를 만들 수 없음
+        return None
+
+
+def post_states(posts):
+    """공개 게시글 pk -> [카테고리 슬러그, 태그 슬러그 목록, 보이는 댓글 수] (다음 증분 빌드에서 비교)"""
+    states = {pk: [category_slug, [], 0] for pk, category_slug in posts.values_list('pk', 'category__slug')}
+    for pk, tag_slug in posts.filter(tags__isnull=False).values_list('pk', 'tags__slug'):
+        states[pk][1].append(tag_slug)
+    counts = Comment.objects.filter(post__in=posts, is_hidden=False).values_list('post_id').annotate(
+        count=Count('pk')
+    ).order_by()
+    for pk, count in counts:
+        states[pk][2] = count
+    return states
+
+
+def list_pages():
+    """(렌더링할 경로 목록, 공개 게시글 상태 {pk: post_states() 항목})"""
+    posts = archive.published_posts().order_by()
+    states = post_states(posts)
+    post_ids = set(states)
+    taxonomy = get_taxonomy()
+    category_counts = dict(posts.values_list('category__slug').annotate(count=Count('pk')))
+    tag_counts = dict(posts.values_list('tags__slug').annotate(count=Count('pk')))
+
+    paths = _paged(reverse('post_list'), len(post_ids))
+    paths += [reverse('post_detail', args=[pk]) for pk in sorted(post_ids)]
+    for slug in taxonomy['category_slugs']:
+        paths += _paged(_reverse('category_posts', slug), category_counts.get(slug, 0))
+        paths.append(_reverse('category_feed', slug))
+    for slug in taxonomy['tag_slugs']:
+        paths += _paged(_reverse('tag_posts', slug), tag_counts.get(slug, 0))
+    for year in archive.get_archive_years():
+        paths += _paged(reverse('archive_year', args=[year['year']]), year['post_count'])
+        for month in year['months']:
+            paths += _paged(reverse('archive_month', args=[year['year'], month['month']]), month['post_count'])
+    paths += [reverse('rss_feed'), reverse('django.contrib.sitemaps.views.sitemap')]
+    return [path for path in paths if path], states
+
+
+def changed_keys(since, states, previous_states):
+    """지난 빌드 이후 바뀐 게시글의 서로게이트 키 (댓글만 바뀐 글은 그 글이 보이는 페이지만)"""
+    changed = states.keys() ^ previous_states.keys()
+    changed.update(Post.objects.filter(updated_at__gte=since).values_list('pk', flat=True))
+    # 새 댓글과 숨김/표시는 updated_at, 삭제는 보이는 댓글 수로 찾음
+    commented = set(Comment.objects.filter(updated_at__gte=since).values_list('post_id', flat=True))
+    commented.update(
+        pk for pk, state in states.items() if pk in previous_states and state[2] != previous_states[pk][2]
+    )
+    keys = set(map(surrogate.post_key, changed | commented))
+    if not changed:
+        return keys
+    keys.update((surrogate.POST_LIST, surrogate.FEED, surrogate.SITEMAP))
+    # 지금과 지난 빌드의 카테고리/태그 모두 (삭제되거나 비공개로 바뀐 글은 지난 빌드 것만 있음)
+    for pk in changed:
+        for state in (states.get(pk), previous_states.get(pk)):
+            if state is None:
+                continue
+            category_slug, tag_slugs, _ = state
+            if category_slug:
+                keys.add(surrogate.category_key(category_slug))
+            keys.update(map(surrogate.tag_key, tag_slugs))
+    return keys
+
+
+# ----- 파일 -----
+
+def page_file(path, content_type):
+    """URL 경로 -> 출력 디렉터리 안의 상대 파일 경로"""
+    path, _, query = path.partition('?')
+    name = f'page-{query.removeprefix("page=")}' if query else 'index'
+    if not path.endswith('/'):
+        return path.lstrip('/')
+    extension = 'html' if content_type.startswith('text/html') else 'xml'
+    return f'{path.lstrip("/")}{name}.{extension}'
+
+
+def write_file(output_dir, relative, content):
+    """원자적으로 쓰고 gzip 사본도 함께"""
+    target = os.path.join(output_dir, relative)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    for name, data in ((target, content), (f'{target}.gz', gzip.compress(content, 9, mtime=0))):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, name)
+
+
+def remove_file(output_dir, relative):
+    for name in (relative, f'{relative}.gz'):
+        try:
+            os.remove(os.path.join(output_dir, name))
+        except FileNotFoundError:
+            pass
+
+
+def render_pages(output_dir, paths):
+    """경로들을 렌더링해 파일로 쓰고 [(경로, 파일, 키 목록, 오류)] 반환 (작업 프로세스에서 실행)"""
+    client = Client(HTTP_HOST=settings.BLOG_PRERENDER['HOST'])
+    header = settings.BLOG_SURROGATE['HEADER']
+    results = []
+    with prerendering():
+        for path in paths:
+            try:
+                response = client.get(path)
+            except Exception as error:
+                results.append((path, None, None, repr(error)))
+                continue
+            if response.status_code != 200 or response.cookies:
+                results.append((path, None, None, f'정적 파일로 둘 수 없는 응답 (HTTP {response.status_code})'))
+                continue
+            relative = page_file(path, response['Content-Type'])
+            write_file(output_dir, relative, response.content)
+            results.append((path, relative, response.get(header, '').split(), None))
+    return results
+
+
+# ----- 매니페스트 -----
+
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST)) as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if not isinstance(manifest.get('posts'), dict):
+        # 게시글 상태가 없는 예전 형식 - 전체를 다시 만듦
+        return None
+    manifest['built_at'] = parse_datetime(manifest['built_at'])
+    manifest['posts'] = {int(pk): state for pk, state in manifest['posts'].items()}
+    return manifest
+
+
+def save_manifest(output_dir, built_at, taxonomy_etag, states, pages):
+    data = {
+        'built_at': built_at.isoformat(),
+        'taxonomy': taxonomy_etag,
+        'posts': states,  # pk -> [카테고리 슬러그, 태그 슬러그 목록, 보이는 댓글 수]
+        'pages': pages,  # 경로 -> {'file', 'keys'}
+    }
+    fd, tmp = tempfile.mkstemp(dir=output_dir, prefix='.tmp-')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, os.path.join(output_dir, MANIFEST))
+
+
+def plan(output_dir, full=False):
+    """이번 빌드 계획 - (시작 시각, 전체 경로, 렌더링할 경로, 지울 경로, 이전 페이지 정보, 공개 게시글 상태)"""
+    started = timezone.now()
+    paths, states = list_pages()
+    manifest = load_manifest(output_dir)
+    previous = manifest['pages'] if manifest else {}
+    current = set(paths)
+    removed = [path for path in previous if path not in current]
+    if full or manifest is None or manifest['taxonomy'] != get_taxonomy()['etag']:
+        return started, paths, paths, removed, previous, states
+
+    keys = changed_keys(manifest['built_at'], states, manifest['posts'])
+    render = [
+        path for path in paths
+        # 키가 없는 페이지는 어떤 변경에 영향받는지 모르므로 매번 다시 만듦
+        if path not in previous or not previous[path]['keys'] or keys.intersection(previous[path]['keys'])
+    ]
+    return started, paths, render, removed, previous, states
@@ -0,0 +1,96 @@
+"""
+요청 프로파일러 (blog.middleware.ProfilingMiddleware 에서 사용)
+
+cprofile: cProfile 로 모든 함수 호출을 기록. pstats 덤프(snakeviz 등으로 열람)와 누적 시간 상위 목록을 남긴다.
+sample:   별도 스레드가 SAMPLE_INTERVAL 마다 요청 스레드의 스택을 찍어 flamegraph collapsed 형식
+          ('a;b;c 횟수')으로 모은다. 호출 수가 많은 코드에서도 오버헤드가 작다.
+"""
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+
+
+class ProfileResult:
+    def __init__(self, summary, collapsed='', pstats_data=None):
+        self.summary = summary
+        self.collapsed = collapsed
+        self.pstats_data = pstats_data
+
+
+class StackSampler:
+    """대상 스레드의 스택을 주기적으로 수집"""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='blog-stack-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+
+    def collapsed(self):
+        return '\n'.join(f'{stack} {count}' for stack, count in self.stacks.most_common())
+
+    def summary(self, limit=40):
+        """자기 시간(스택 맨 위) 기준 상위 함수"""
+        total = sum(self.stacks.values())
+        own = Counter()
+        for stack, count in self.stacks.items():
+            own[stack.rsplit(';', 1)[-1]] += count
+        lines = [f'샘플 {total}개 (간격 {self.interval * 1000:g}ms)', '']
+        for frame, count in own.most_common(limit):
+            lines.append(f'{count / total * 100:6.1f}%  {count:6d}  {frame}')
+        return '\n'.join(lines)
+
+
+def _short_path(filename):
+    for path in sorted(sys.path, key=len, reverse=True):
+        if path and filename.startswith(path + os.sep):
+            return filename[len(path) + 1:]
+    return filename
+
+
+def profile_call(func, mode, interval=0.005):
+    """func() 를 프로파일링하며 실행하고 (결과, ProfileResult) 반환"""
+    if mode == 'sample':
+        sampler = StackSampler(threading.get_ident(), interval)
+        sampler.start()
+        try:
+            result = func()
+        finally:
+            sampler.stop()
+        return result, ProfileResult(sampler.summary(), collapsed=sampler.collapsed())
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = func()
+    finally:
+        profiler.disable()
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats('cumulative').print_stats(40)
+    return result, ProfileResult(stream.getvalue(), pstats_data=marshal.dumps(stats.stats))
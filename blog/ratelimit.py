@@ -0,0 +1,214 @@
+"""
+공유 저장소 기반 슬라이딩 윈도우 요청 제한
+
+고정 윈도우는 경계 직전/직후에 한도의 2배까지 몰아서 허용하므로,
+직전 윈도우 카운트를 경과 비율만큼 가중한 슬라이딩 윈도우 추정치로 판단한다.
+    추정치 = 직전 윈도우 횟수 × (1 - 현재 윈도우 경과 비율) + 현재 윈도우 횟수
+
+카운터는 settings.CACHES['default'] 가 Redis 일 때 그 Redis 에 저장해 모든 워커가 공유하고,
+INCRBY/EXPIRE/GET 을 파이프라인 한 번(왕복 1회)으로 처리한다.
+Redis 가 아니면(파일/DB 캐시는 incr 가 읽은 뒤 쓰기라 워커가 동시에 세면 횟수를 잃음)
+프로세스 안 LocMem 카운터로 대신 세고 경고를 남긴다. 이때 한도는 워커마다 따로 적용된다.
+
+한도에 한참 못 미치는 클라이언트는 직전 동기화 결과를 믿고 프로세스 안에서만 센 뒤
+다음 동기화 때 한꺼번에 반영한다 (fast path).
+"""
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import JsonResponse
+from django.shortcuts import render
+
+# fast path 는 추정치가 한도의 이 비율 미만일 때만 사용
+FAST_PATH_RATIO = 0.5
+# fast path 로 쌓아둘 수 있는 최대 횟수 (한도 대비 비율)
+FAST_PATH_MAX_PENDING_RATIO = 0.1
+# 이 시간(초)이 지나면 fast path 를 쓰지 않고 공유 저장소와 동기화
+SYNC_INTERVAL = 1.0
+# 프로세스 안에 보관할 클라이언트 상태 수
+MAX_LOCAL_ENTRIES = 10000
+
+logger = logging.getLogger(__name__)
+
+RATE_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+Decision = namedtuple('Decision', ['allowed', 'retry_after'])
+
+
+def parse_rate(rate):
+    """'30/h' -> (30, 3600)"""
+    count, _, unit = rate.partition('/')
+    return int(count), RATE_UNITS[unit]
+
+
+def retry_after_seconds(current, previous, elapsed, limit, window):
+    """추정치가 한도 아래로 내려갈 때까지 남은 시간(초)"""
+    if current < limit and previous > 0:
+        # 이번 윈도우 안에서 직전 윈도우 가중치가 줄어들며 풀림
+        wait = window * (1 - (limit - current) / previous) - elapsed
+    else:
+        # 다음 윈도우로 넘어간 뒤 이번 윈도우 횟수의 가중치가 줄어들어야 풀림
+        wait = (window - elapsed) + window * (1 - limit / current)
+    return max(1, math.ceil(wait))
+
+
+class _LocalState:
+    __slots__ = ('window', 'estimate', 'synced_at', 'pending')
+
+    def __init__(self, window, estimate, synced_at):
+        self.window = window
+        self.estimate = estimate
+        self.synced_at = synced_at
+        self.pending = 0
+
+
+def _redis_client(alias):
+    """캐시 별칭이 Redis 면 그 서버의 클라이언트, 아니면 None"""
+    config = settings.CACHES[alias]
+    backend = config['BACKEND']
+    if backend.startswith('django_redis.'):
+        from django_redis import get_redis_connection
+        return get_redis_connection(alias)
+    if backend == 'django.core.cache.backends.redis.RedisCache':
+        import redis
+        location = config['LOCATION']
+        if not isinstance(location, str):
+            # 여러 서버면 첫 번째(쓰기 서버)
+            location = location[0]
+        return redis.Redis.from_url(location)
+    return None
+
+
+class SlidingWindowLimiter:
+    """슬라이딩 윈도우 카운터 (공유 Redis 또는 프로세스 안 LocMem + 프로세스 내 fast path)"""
+
+    def __init__(self, cache_alias='default'):
+        self.cache_alias = cache_alias
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self._backend = None  # (Redis 클라이언트 또는 None, 키를 만들 캐시)
+
+    def _get_backend(self):
+        if self._backend is None:
+            client = _redis_client(self.cache_alias)
+            if client is None:
+                logger.warning(
+                    "CACHES['%s'] 가 Redis 가 아니어서 요청 제한 카운터를 워커마다 따로 셉니다 "
+                    '(한도가 워커 수만큼 느슨해짐).', self.cache_alias,
+                )
+                self._backend = (None, LocMemCache('blog-ratelimit', {'OPTIONS': {'MAX_ENTRIES': MAX_LOCAL_ENTRIES}}))
+            else:
+                self._backend = (client, caches[self.cache_alias])
+        return self._backend
+
+    def hit(self, scope, ident, limit, window):
+        """요청 1회를 기록하고 허용 여부 반환"""
+        now = time.time()
+        index, elapsed = divmod(now, window)
+        index = int(index)
+        local_key = f'{scope}:{ident}'
+
+        with self._lock:
+            state = self._local.get(local_key)
+            pending = 0
+            if state is not None:
+                if state.window == index and self._can_skip_sync(state, limit, now):
+                    state.pending += 1
+                    return Decision(True, 0)
+                # 윈도우가 바뀌었어도 아직 반영하지 않은 횟수는 새 윈도우에 더함
+                pending, state.pending = state.pending, 0
+
+        current, previous = self._increment(local_key, index, 1 + pending, window)
+        estimate = previous * (1 - elapsed / window) + current
+
+        with self._lock:
+            self._local[local_key] = _LocalState(index, estimate, now)
+            self._local.move_to_end(local_key)
+            while len(self._local) > MAX_LOCAL_ENTRIES:
+                self._local.popitem(last=False)
+
+        if estimate > limit:
+            return Decision(False, retry_after_seconds(current, previous, elapsed, limit, window))
+        return Decision(True, 0)
+
+    def _can_skip_sync(self, state, limit, now):
+        return (
+            now - state.synced_at < SYNC_INTERVAL
+            and state.estimate + state.pending + 1 < limit * FAST_PATH_RATIO
+            and state.pending + 1 <= limit * FAST_PATH_MAX_PENDING_RATIO
+        )
+
+    def _increment(self, local_key, index, amount, window):
+        """현재 윈도우 카운터를 amount 만큼 올리고 (현재, 직전) 횟수 반환"""
+        client, cache = self._get_backend()
+        current_key = cache.make_and_validate_key(f'ratelimit:{local_key}:{index}')
+        previous_key = cache.make_and_validate_key(f'ratelimit:{local_key}:{index - 1}')
+
+        if client is not None:
+            # 왕복 1회: INCRBY + EXPIRE + GET
+            pipe = client.pipeline(transaction=False)
+            pipe.incrby(current_key, amount)
+            pipe.expire(current_key, window * 2)
+            pipe.get(previous_key)
+            current, _, previous = pipe.execute()
+            return int(current), int(previous or 0)
+
+        # LocMem 은 add/incr 가 캐시 잠금 안에서 처리되어 프로세스 안에서는 원자적
+        cache.add(current_key, 0, window * 2)
+        try:
+            current = cache.incr(current_key, amount)
+        except ValueError:
+            # add 와 incr 사이에 만료된 경우
+            cache.set(current_key, amount, window * 2)
+            current = amount
+        return current, cache.get(previous_key, 0)
+
+
+limiter = SlidingWindowLimiter()
+
+
+def _client_ident(request, key):
+    if key == 'user' and request.user.is_authenticated:
+        return f'user:{request.user.pk}'
+    return f'ip:{request.META.get("REMOTE_ADDR", "")}'
+
+
+def _limited_response(request, retry_after, json_response):
+    if json_response:
+        response = JsonResponse({
+            'error': f'요청이 너무 많습니다. {retry_after}초 후 다시 시도해주세요.'
+        }, status=429)
+    else:
+        response = render(request, '403.html', status=429)
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def rate_limit(key, rate, method='POST', json_response=False):
+    """
+    뷰 요청 제한 데코레이터 - 초과 시 429 와 Retry-After 헤더 반환
+
+    key: 'user'(로그인 사용자별, 비로그인은 IP) 또는 'ip'
+    rate: '30/h' 형식 (단위 s/m/h/d)
+    """
+    limit, window = parse_rate(rate)
+
+    def decorator(view_func):
+        scope = f'{view_func.__module__}.{view_func.__name__}'
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method == method:
+                decision = limiter.hit(scope, _client_ident(request, key), limit, window)
+                if not decision.allowed:
+                    return _limited_response(request, decision.retry_after, json_response)
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
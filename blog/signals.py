@@ -1,18 +1,107 @@
-from django.db.models.signals import post_save
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_init, post_save, post_delete
+from django.db import transaction
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import UserProfile
+from django.utils import timezone
+from . import archive, suggest, surrogate
+from .cache import blog_cache
+from .instrumentation import install_query_wrapper
+from .models import Category, Comment, Post, Tag
+from .taxonomy import invalidate_taxonomy
 
 
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    """사용자 생성 시 프로필 자동 생성"""
-    if created:
-        UserProfile.objects.create(user=instance)
+def save_user_profile(sender, instance, **kwargs):
+    """사용자 저장 시 함께 불러온 프로필이 바뀐 경우에만 저장
+
+    프로필은 편집할 때 처음 만들어지므로 (views.profile_edit) 여기서 조회/생성하지 않는다.
+    로그인 시 last_login 갱신 같은 저장은 추가 쿼리 없이 끝난다.
+    """
+    if User.profile.is_cached(instance):
+        profile = instance.profile
+        if profile.has_changes():
+            profile.save()
+
+
+@receiver(post_init, sender=User)
+def remember_username(sender, instance, **kwargs):
+    """읽어온 사용자 이름 기억 (only() 로 읽지 않았으면 None)"""
+    instance._loaded_username = instance.__dict__.get('username')
 
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """사용자 저장 시 프로필도 저장"""
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
+def invalidate_author_fragments(sender, instance, created=False, update_fields=None, **kwargs):
+    """사용자 이름이 바뀐 경우에만 작성자 이름이 들어간 게시글 조각 캐시 무효화"""
+    loaded, instance._loaded_username = instance._loaded_username, instance.username
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
+    if loaded is not None and loaded == instance.username:
+        return
+    blog_cache.invalidate('fragments')
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_cache(sender, instance, update_fields=None, **kwargs):
+    """게시글 변경 시 게시글 캐시 무효화, 월별 보관함/자동완성 색인 갱신, 앞단 캐시 퍼지 (조회수만 바뀐 경우는 제외)"""
+    if update_fields and set(update_fields) <= {'views'}:
+        return
+    blog_cache.invalidate('posts')
+    archive.refresh_months([instance.created_at])
+    surrogate.purge_posts([instance.pk], [instance.category_id])
+    if kwargs['signal'] is post_delete:
+        # 삭제 후에는 pk 가 None 이 되므로 미리 잡아 둠
+        pk = instance.pk
+        transaction.on_commit(lambda: suggest.remove('post', pk))
+    else:
+        transaction.on_commit(lambda: suggest.update_post(instance))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_taxonomy_cache(sender, instance, **kwargs):
+    """카테고리/태그 변경 시 택소노미/조각 캐시 무효화, 자동완성 색인 갱신, 앞단 캐시 퍼지"""
+    invalidate_taxonomy()
+    blog_cache.invalidate('fragments')
+    surrogate.purge(surrogate.TAXONOMY)
+    kind = 'tag' if sender is Tag else 'category'
+    if kwargs['signal'] is post_delete:
+        pk = instance.pk
+        transaction.on_commit(lambda: suggest.remove(kind, pk))
+    else:
+        transaction.on_commit(lambda: suggest.update_taxonomy(kind, instance))
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def purge_post_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """게시글-태그 연결 변경 시 게시글 updated_at 갱신(조각 캐시 키가 바뀜), 해당 태그 목록과 게시글 페이지 퍼지
+    (clear() 는 pk_set 이 None)"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        post_ids = pk_set or ()
+        if pk_set is None:
+            # tag.posts.clear() - 어떤 글이었는지 알 수 없으므로 조각 캐시 전체 무효화
+            blog_cache.invalidate('fragments')
+        surrogate.purge_tags([instance.pk], post_ids)
+    else:
+        post_ids = [instance.pk]
+        surrogate.purge_tags(pk_set or (), post_ids)
+    if post_ids:
+        Post.objects.filter(pk__in=post_ids).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def purge_comment_post(sender, instance, **kwargs):
+    """댓글 변경 시 게시글 페이지 퍼지"""
+    surrogate.purge(surrogate.post_key(instance.post_id))
+
+
+@receiver(connection_created)
+def instrument_connection(sender, connection, **kwargs):
+    """새 DB 커넥션에 요청 계측용 execute_wrapper 설치"""
+    install_query_wrapper(connection)
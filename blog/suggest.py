@@ -0,0 +1,288 @@
+"""
+검색어 자동완성 (프로세스 안 접두어 색인)
+
+발행된 게시글 제목, 태그 이름, 카테고리 이름을 단어 시작 위치마다 잘라 정렬된 키 배열에 넣고
+bisect 로 접두어 범위를 찾는다. 키는 한글을 자모로 풀어 쓴 형태라 입력 중인 글자('한ㄱ', '하')도 맞고,
+초성만 모은 키도 함께 넣어 'ㅎㄱ' 으로 '한국' 을 찾을 수 있다.
+
+워커 간 공유:
+    - 색인 항목(종류, id, 이름, 슬러그, 가중치)을 zlib 압축 JSON 스냅숏으로 blog_cache 'suggest' 네임스페이스에 둔다.
+    - 게시글/태그/카테고리가 바뀌면(blog/signals.py) 커밋 후 현재 워커 색인만 고치고, 스냅숏은 작업 큐에서
+      SNAPSHOT_DEBOUNCE 초에 한 번만 DB 에서 다시 만든다 (저장할 때마다 색인 전체를 직렬화/압축해 올리지 않음).
+      일괄 변경(관리자 액션, seed_data)은 네임스페이스를 무효화해 DB 에서 다시 만들게 한다.
+    - 다른 워커는 요청 때 스냅숏 토큰이 바뀐 것을 보고 백그라운드 스레드에서 다시 읽는다 (그동안은 이전 색인으로 응답).
+스냅숏이 만료되면(1시간) DB 에서 새로 만들어 조회수 가중치도 갱신된다. 변경이 다른 워커에 보이기까지는
+최대 SNAPSHOT_DEBOUNCE 초(와 작업 워커 지연)가 걸린다.
+"""
+import bisect
+import json
+import threading
+import time
+import unicodedata
+import uuid
+import zlib
+
+from django.db.models import Q
+from django.urls import NoReverseMatch, reverse
+from django.utils import timezone
+
+from .cache import blog_cache
+from .models import Category, Post, Tag
+from .tasks import enqueue, task
+
+SUGGEST_LIMIT = 8
+MAX_SCAN = 200  # 접두어가 짧을 때 살펴볼 최대 키 수
+MAX_KEY_LENGTH = 60
+SNAPSHOT_TIMEOUT = 60 * 60
+SNAPSHOT_DEBOUNCE = 30  # 변경 후 스냅숏을 다시 만들 때까지 모으는 시간(초)
+
+KIND_ORDER = {'category': 0, 'tag': 1, 'post': 2}
+# 이름 맨 앞에서 시작하는 키 표시 - 흔한 단어로 끝나는 제목이 많아도 앞부분이 맞는 항목을 먼저 찾도록 따로 모음
+HEAD = '\x01'
+
+# ----- 한글 자모 -----
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ' ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'
+# 입력 중간 상태와 맞도록 겹모음/겹받침은 두 글자로 풂 ('과' 입력 중 '고')
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+
+
+def is_syllable(char):
+    return HANGUL_BASE <= ord(char) <= HANGUL_END
+
+
+def to_jamo(text):
+    """한글 음절을 자모열로 ('한국' -> 'ㅎㅏㄴㄱㅜㄱ')"""
+    parts = []
+    for char in text:
+        if is_syllable(char):
+            index = ord(char) - HANGUL_BASE
+            parts.append(CHOSEONG[index // 588])
+            parts.append(COMPOUND_JAMO.get(JUNGSEONG[index % 588 // 28], JUNGSEONG[index % 588 // 28]))
+            if index % 28:
+                parts.append(COMPOUND_JAMO.get(JONGSEONG[index % 28], JONGSEONG[index % 28]))
+        else:
+            parts.append(COMPOUND_JAMO.get(char, char))
+    return ''.join(parts)
+
+
+def to_choseong(text):
+    """한글 음절은 초성만 남김 ('한국 여행' -> 'ㅎㄱ ㅇㅎ')"""
+    return ''.join(CHOSEONG[(ord(char) - HANGUL_BASE) // 588] if is_syllable(char) else char for char in text)
+
+
+def normalize(text):
+    return ' '.join(unicodedata.normalize('NFC', text).casefold().split())
+
+
+def index_keys(label):
+    """단어 시작 위치마다 자른 자모 키와 초성 키 - 이름 맨 앞 키에는 HEAD 표시를 붙임"""
+    text = normalize(label)
+    has_hangul = any(is_syllable(char) for char in text)
+    keys = set()
+    for start in [0] + [i + 1 for i, char in enumerate(text) if char == ' ']:
+        suffix = text[start:start + MAX_KEY_LENGTH]
+        mark = HEAD if start == 0 else ''
+        keys.add(mark + to_jamo(suffix))
+        if has_hangul:
+            keys.add(mark + to_choseong(suffix))
+    return keys
+
+
+# ----- 색인 -----
+
+def entry_id(kind, pk):
+    return f'{kind}:{pk}'
+
+
+class PrefixIndex:
+    """정렬된 키 배열 + bisect 접두어 색인 (스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.token = None
+        self.loading = False
+        self.entries = {}  # 항목 id -> (종류, pk, 이름, 슬러그, 가중치)
+        self.keys = []
+        self.refs = []  # keys 와 같은 위치의 항목 id
+
+    def load(self, snapshot):
+        entries = {entry_id(entry[0], entry[1]): tuple(entry) for entry in unpack(snapshot['entries'])}
+        pairs = sorted((key, ref) for ref, entry in entries.items() for key in index_keys(entry[2]))
+        with self.lock:
+            self.entries = entries
+            self.keys = [key for key, _ in pairs]
+            self.refs = [ref for _, ref in pairs]
+            self.token = snapshot['token']
+
+    def put(self, entry):
+        """항목 추가/교체 - 이름/슬러그가 그대로면 False"""
+        with self.lock:
+            ref = entry_id(entry[0], entry[1])
+            current = self.entries.get(ref)
+            if current is not None and current[2:4] == entry[2:4]:
+                return False
+            self.remove(ref)
+            self.entries[ref] = entry
+            for key in index_keys(entry[2]):
+                position = bisect.bisect_left(self.keys, key)
+                self.keys.insert(position, key)
+                self.refs.insert(position, ref)
+            return True
+
+    def remove(self, ref):
+        """항목 삭제 - 없던 항목이면 False"""
+        with self.lock:
+            entry = self.entries.pop(ref, None)
+            if entry is None:
+                return False
+            for key in index_keys(entry[2]):
+                position = bisect.bisect_left(self.keys, key)
+                while position < len(self.keys) and self.keys[position] == key:
+                    if self.refs[position] == ref:
+                        del self.keys[position]
+                        del self.refs[position]
+                        break
+                    position += 1
+            return True
+
+    def search(self, query, limit=SUGGEST_LIMIT):
+        """접두어가 맞는 항목 - 이름이 검색어로 시작하는 것, 카테고리/태그, 가중치 순"""
+        prefix = to_jamo(normalize(query))
+        if not prefix:
+            return []
+        found = {}
+        with self.lock:
+            # 이름 맨 앞이 맞는 키, 단어 중간부터 맞는 키 순으로 각각 MAX_SCAN 개까지
+            for starts, key_prefix in ((True, HEAD + prefix), (False, prefix)):
+                position = bisect.bisect_left(self.keys, key_prefix)
+                end = min(position + MAX_SCAN, len(self.keys))
+                while position < end and self.keys[position].startswith(key_prefix):
+                    found.setdefault(self.refs[position], starts)
+                    position += 1
+            entries = [(self.entries[ref], starts) for ref, starts in found.items()]
+        entries.sort(key=lambda item: (not item[1], KIND_ORDER[item[0][0]], -item[0][4], len(item[0][2])))
+        return [entry for entry, _ in entries[:limit]]
+
+
+def pack(entries):
+    return zlib.compress(json.dumps(entries, ensure_ascii=False, separators=(',', ':')).encode())
+
+
+def unpack(data):
+    return json.loads(zlib.decompress(data))
+
+
+index = PrefixIndex()
+
+
+# ----- DB -----
+
+def post_entry(pk, title, views):
+    return ('post', pk, title, '', views)
+
+
+def published_posts():
+    """지금 공개 상태인 게시글 (views.get_published_posts 와 같은 조건)"""
+    return Post.objects.filter(
+        Q(status='published') | Q(status='scheduled', published_at__lte=timezone.now()), is_public=True
+    )
+
+
+def load_entries():
+    """DB 에서 색인 항목 전체 읽기"""
+    entries = [('category', pk, name, slug, 0) for pk, name, slug in Category.objects.values_list('pk', 'name', 'slug')]
+    entries += [('tag', pk, name, slug, 0) for pk, name, slug in Tag.objects.values_list('pk', 'name', 'slug')]
+    entries += [post_entry(*row) for row in published_posts().values_list('pk', 'title', 'views').iterator()]
+    return entries
+
+
+def build_snapshot():
+    return {'token': uuid.uuid4().hex, 'entries': pack(load_entries())}
+
+
+def get_index(wait=False):
+    """최신 스냅숏을 반영한 색인 - 이미 색인이 있으면 새 스냅숏은 백그라운드에서 읽음 (wait=True 면 기다림)"""
+    snapshot = blog_cache.get_or_set('suggest', 'snapshot', build_snapshot, SNAPSHOT_TIMEOUT)
+    if snapshot['token'] == index.token:
+        return index
+    if index.token is None or wait:
+        index.load(snapshot)
+        return index
+    with index.lock:
+        if index.loading:
+            return index
+        index.loading = True
+
+    def reload():
+        try:
+            index.load(snapshot)
+        finally:
+            index.loading = False
+
+    threading.Thread(target=reload, daemon=True).start()
+    return index
+
+
+def suggest(query, limit=SUGGEST_LIMIT):
+    """자동완성 결과 [{'type', 'label', 'url'}]"""
+    results = []
+    for kind, pk, label, slug, _ in get_index().search(query, limit):
+        try:
+            if kind == 'post':
+                url = reverse('post_detail', args=[pk])
+            elif kind == 'tag':
+                url = reverse('tag_posts', args=[slug])
+            else:
+                url = reverse('category_posts', args=[slug])
+        except NoReverseMatch:
+            # 한글 슬러그는 <slug:> URL 패턴에 맞지 않아 링크를 만들 수 없음
+            continue
+        results.append({'type': kind, 'label': label, 'url': url})
+    return results
+
+
+# ----- 변경 반영 (signals) -----
+
+@task(priority=1, max_attempts=3)
+def rebuild_snapshot():
+    """DB 에서 새 스냅숏을 만들어 올림 - 다른 워커는 토큰이 바뀐 것을 보고 다시 읽음"""
+    snapshot = build_snapshot()
+    blog_cache.invalidate('suggest')
+    blog_cache.get_or_set('suggest', 'snapshot', lambda: snapshot, SNAPSHOT_TIMEOUT)
+
+
+def _publish(change):
+    """현재 워커 색인을 고치고, 스냅숏 재생성은 SNAPSHOT_DEBOUNCE 초 단위로 한 번만 등록"""
+    # 아직 색인을 읽지 않은 워커는 여기서 DB 로 만들지 않음 (첫 요청 때 새 스냅숏을 읽음)
+    if index.token is not None and not change():
+        return
+    window = int(time.time() // SNAPSHOT_DEBOUNCE)
+    enqueue(rebuild_snapshot, delay=SNAPSHOT_DEBOUNCE, idempotency_key=f'suggest-snapshot:{window}')
+
+
+def update_post(post):
+    visible = post.is_public and (
+        post.status == 'published'
+        or (post.status == 'scheduled' and post.published_at and post.published_at <= timezone.now())
+    )
+    if visible:
+        _publish(lambda: index.put(post_entry(post.pk, post.title, post.views)))
+    else:
+        remove('post', post.pk)
+
+
+def update_taxonomy(kind, obj):
+    _publish(lambda: index.put((kind, obj.pk, obj.name, obj.slug, 0)))
+
+
+def remove(kind, pk):
+    _publish(lambda: index.remove(entry_id(kind, pk)))
@@ -0,0 +1,198 @@
+"""
+앞단 HTTP 캐시(Varnish/nginx/CDN)용 서로게이트 키
+
+뷰가 응답에 담긴 객체의 키를 request 에 모으면 SurrogateKeyMiddleware 가 응답 헤더
+(BLOG_SURROGATE['HEADER'], 기본 Surrogate-Key)와 Cache-Control(public, s-maxage)을 붙인다.
+    post-<pk>        게시글 상세, 그리고 그 글이 보이는 모든 목록/사이드바/관련 글
+    category-<slug>  카테고리 목록 (새 글이 들어올 자리)
+    tag-<slug>       태그 목록
+    post-list        홈/검색/보관함 목록
+    feed, sitemap    RSS 피드, 사이트맵
+    taxonomy         카테고리/태그 이름이 보이는 모든 페이지
+로그인 사용자 응답, 쿠키를 굽는 응답(첫 방문 조회수 쿠키, 세션, CSRF)은 공유 캐시에 두지 않는다.
+
+모델이 바뀌면(blog/signals.py, 관리자 일괄 변경) 영향받는 키를 커밋 후에 모아 요청(또는 batch() 블록)이 끝날 때
+중복 없이 purge_surrogate_keys 작업(blog.tasks)으로 한 번 넘기고, 작업은 PURGE_BATCH 개씩 묶어 PURGE_URL 로
+퍼지 요청을 보낸다 (실패하면 작업 큐가 백오프로 재시도).
+PURGE_URL 이 없으면 헤더만 붙이고 퍼지는 하지 않는다.
+"""
+import logging
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+
+from . import metrics
+from .tasks import enqueue, task
+from .taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+POST_LIST = 'post-list'
+FEED = 'feed'
+SITEMAP = 'sitemap'
+TAXONOMY = 'taxonomy'
+
+
+def post_key(pk):
+    return f'post-{pk}'
+
+
+def category_key(slug):
+    return f'category-{slug}'
+
+
+def tag_key(slug):
+    return f'tag-{slug}'
+
+
+# ----- 응답 태깅 -----
+
+def add_keys(request, *keys):
+    """응답에 붙일 키 추가"""
+    if not hasattr(request, 'surrogate_keys'):
+        request.surrogate_keys = set()
+    request.surrogate_keys.update(keys)
+
+
+def add_posts(request, posts):
+    """목록/사이드바에 보이는 게시글 키 추가 (게시글 또는 dict, 페이지 객체도 가능)"""
+    add_keys(request, *(post_key(post['id'] if isinstance(post, dict) else post.pk) for post in posts))
+
+
+def surrogate_keys(*keys):
+    """고정 키를 붙이는 뷰 데코레이터 (피드, 사이트맵)"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            add_keys(request, *keys)
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def is_shared_cacheable(request, response):
+    """공유 캐시에 둬도 되는 응답인지 - 익명 GET/HEAD 200, 쿠키를 굽지 않음"""
+    user = getattr(request, 'user', None)
+    return (
+        request.method in ('GET', 'HEAD')
+        and response.status_code == 200
+        and not response.cookies
+        and not (user is not None and user.is_authenticated)
+        and 'private' not in response.get('Cache-Control', '')
+    )
+
+
+class SurrogateKeyMiddleware:
+    """키가 모인 응답에 서로게이트 키 헤더와 Cache-Control 을 붙이고, 요청 중 모인 퍼지 키를 한 번에 보냄"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.options = settings.BLOG_SURROGATE
+
+    def __call__(self, request):
+        with batch():
+            response = self.get_response(request)
+
+        keys = getattr(request, 'surrogate_keys', None)
+        if not keys:
+            return response
+        if is_shared_cacheable(request, response):
+            response[self.options['HEADER']] = ' '.join(sorted(keys | {TAXONOMY}))
+            patch_cache_control(
+                response, public=True, max_age=self.options['MAX_AGE'], s_maxage=self.options['S_MAXAGE'],
+            )
+        else:
+            patch_cache_control(response, private=True)
+        return response
+
+
+# ----- 퍼지 -----
+
+# batch() 안에서 커밋된 퍼지 키 (밖에서는 None 이라 커밋마다 바로 보냄)
+_pending_purges = ContextVar('surrogate_purges', default=None)
+
+
+@contextmanager
+def batch():
+    """이 안에서 커밋된 퍼지 키를 모아 끝날 때 한 번에 보냄 (요청은 미들웨어가 감쌈)"""
+    if _pending_purges.get() is not None:
+        yield
+        return
+    token = _pending_purges.set(set())
+    try:
+        yield
+    finally:
+        pending = _pending_purges.get()
+        _pending_purges.reset(token)
+        if pending:
+            send_purge(pending)
+
+
+def purge(*keys):
+    """키 퍼지 예약 - 트랜잭션이 커밋되면 모으고, batch() 가 끝날 때 중복 없이 한 번에 보냄 (롤백되면 버림)"""
+    if settings.BLOG_SURROGATE['PURGE_URL'] and keys:
+        transaction.on_commit(lambda: _collect(keys))
+
+
+def _collect(keys):
+    pending = _pending_purges.get()
+    if pending is None:
+        send_purge(keys)
+    else:
+        pending.update(keys)
+
+
+def send_purge(keys):
+    enqueue(purge_surrogate_keys, args=[sorted(set(keys))])
+
+
+def purge_posts(pks, category_ids=()):
+    """게시글이 바뀌었을 때 - 그 글이 보이는 페이지와 새로 들어갈 수 있는 목록
+    (이전 카테고리/태그 목록은 post-<pk> 로 함께 지워짐)"""
+    if not settings.BLOG_SURROGATE['PURGE_URL']:
+        return
+    slugs = {category['id']: category['slug'] for category in get_taxonomy()['categories']}
+    purge(
+        POST_LIST, FEED, SITEMAP, *map(post_key, pks),
+        *(category_key(slugs[pk]) for pk in set(category_ids) if pk in slugs),
+    )
+
+
+def purge_tags(tag_ids, post_ids):
+    """게시글-태그 연결이 바뀌었을 때"""
+    if not settings.BLOG_SURROGATE['PURGE_URL']:
+        return
+    tag_ids = set(tag_ids)
+    purge(
+        *map(post_key, post_ids),
+        *(tag_key(slug) for slug, tag in get_taxonomy()['tag_slugs'].items() if tag['id'] in tag_ids),
+    )
+
+
+@task(priority=5, max_attempts=8, retry_delay=5)
+def purge_surrogate_keys(keys):
+    """PURGE_URL 로 퍼지 요청 (PURGE_BATCH 개씩, 키는 공백으로 구분) - 퍼지는 멱등이라 재시도 때 전부 다시 보냄"""
+    options = settings.BLOG_SURROGATE
+    if not options['PURGE_URL']:
+        return
+    batch = options['PURGE_BATCH']
+    for start in range(0, len(keys), batch):
+        chunk = keys[start:start + batch]
+        request = urllib.request.Request(
+            options['PURGE_URL'], method=options['PURGE_METHOD'],
+            headers={options['PURGE_HEADER']: ' '.join(chunk)},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=options['PURGE_TIMEOUT']):
+                pass
+        except OSError:
+            # URLError/HTTPError 포함
+            metrics.surrogate_purges.inc(len(keys) - start, result='failed')
+            logger.warning('서로게이트 키 퍼지 실패 (%d개, 재시도 예정)', len(keys) - start)
+            raise
+        metrics.surrogate_purges.inc(len(chunk), result='purged')
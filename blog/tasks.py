@@ -0,0 +1,313 @@
+"""
+DB 기반 백그라운드 작업 큐
+
+별도 브로커 없이 blog_task 테이블(models.Task)에 작업을 넣고 run_tasks 워커가 꺼내 실행한다.
+    - 꺼내기: PostgreSQL 은 SELECT ... FOR UPDATE SKIP LOCKED 로 워커끼리 서로 기다리지 않고,
+      SKIP LOCKED 가 없는 DB(SQLite)는 UPDATE ... WHERE pk = (SELECT ...) 한 문장으로 선점
+    - 우선순위(priority 가 큰 것 먼저), 예약 실행(run_at), 지수 백오프 재시도, 멱등 키(idempotency_key)
+    - 트랜잭션 안에서 등록하면 커밋된 뒤에야 워커에 보인다
+    - 실행 중 상태로 LEASE_SECONDS 를 넘긴 작업(워커 비정상 종료)은 다시 대기열로 돌린다
+settings.BLOG_TASKS['EAGER'] 가 True 면 등록 즉시 현재 프로세스에서 실행한다 (워커 없는 개발 환경용).
+
+작업 정의:
+    @task(priority=10, max_attempts=3)
+    def rebuild_something(post_id): ...
+
+    rebuild_something.enqueue(post.pk)
+    enqueue(rebuild_something, args=[post.pk], delay=60, idempotency_key=f'rebuild:{post.pk}')
+인자는 JSON 으로 저장하므로 모델 인스턴스 대신 pk 를 넘긴다.
+"""
+import functools
+import io
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, close_old_connections, connections, router, transaction
+from django.db.models import F, Subquery
+from django.utils import timezone
+
+from . import metrics
+from .models import PostImage, Task
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY = 3600  # 재시도 간격 상한(초)
+
+_registry = {}
+
+
+class TaskFunction:
+    """@task 로 등록한 함수 - 직접 호출하면 바로 실행, enqueue() 하면 워커가 실행"""
+
+    def __init__(self, func, name, priority, max_attempts, retry_delay):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = name
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, *args, **kwargs):
+        return enqueue(self, args=args, kwargs=kwargs)
+
+    def backoff(self, attempts):
+        """attempts 번째 실패 뒤 다시 시도할 때까지의 시간(초) - 지수 증가 + 지터"""
+        delay = min(self.retry_delay * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+        return delay * random.uniform(0.8, 1.2)
+
+
+def task(func=None, *, name=None, priority=0, max_attempts=5, retry_delay=10):
+    """백그라운드 작업 등록 데코레이터"""
+    def decorator(func):
+        task_name = name or f'{func.__module__}.{func.__name__}'
+        task_function = TaskFunction(func, task_name, priority, max_attempts, retry_delay)
+        _registry[task_name] = task_function
+        return task_function
+    return decorator(func) if func is not None else decorator
+
+
+def get_task(name):
+    return _registry.get(name)
+
+
+def enqueue(func, args=(), kwargs=None, *, priority=None, run_at=None, delay=None, idempotency_key=None):
+    """
+    작업 등록 - 만든(또는 멱등 키가 같은 기존) Task 반환
+    EAGER 모드에서는 바로 실행하고 None 반환
+    """
+    task_function = func if isinstance(func, TaskFunction) else _registry[func]
+    kwargs = kwargs or {}
+    if settings.BLOG_TASKS['EAGER']:
+        task_function(*args, **kwargs)
+        return None
+
+    if run_at is None:
+        run_at = timezone.now()
+    if delay:
+        run_at += timedelta(seconds=delay)
+    fields = {
+        'name': task_function.name,
+        'args': list(args),
+        'kwargs': kwargs,
+        'priority': task_function.priority if priority is None else priority,
+        'run_at': run_at,
+        'max_attempts': task_function.max_attempts,
+        'idempotency_key': idempotency_key,
+    }
+    if idempotency_key is None:
+        return Task.objects.create(**fields)
+
+    # 같은 키의 작업이 이미 있으면 새로 만들지 않음 (동시 등록도 유니크 제약으로 하나만 남음)
+    try:
+        with transaction.atomic(using=router.db_for_write(Task)):
+            return Task.objects.create(**fields)
+    except IntegrityError:
+        return Task.objects.using(router.db_for_write(Task)).get(idempotency_key=idempotency_key)
+
+
+# ----- 워커 -----
+
+def claim(worker_id):
+    """실행할 작업 하나를 선점해 반환 (없으면 None)"""
+    using = router.db_for_write(Task)
+    now = timezone.now()
+    queryset = Task.objects.using(using).filter(status='queued', run_at__lte=now).order_by('-priority', 'run_at')
+    claim_fields = {'status': 'running', 'locked_by': worker_id, 'locked_at': now, 'attempts': F('attempts') + 1}
+
+    if connections[using].features.has_select_for_update_skip_locked:
+        with transaction.atomic(using=using):
+            # 다른 워커가 잠근 행은 기다리지 않고 건너뛰어 다음 작업을 가져감
+            task = queryset.select_for_update(skip_locked=True).only('pk').first()
+            if task is None:
+                return None
+            Task.objects.using(using).filter(pk=task.pk).update(**claim_fields)
+        return Task.objects.using(using).get(pk=task.pk)
+
+    # SKIP LOCKED 가 없는 DB(SQLite): 고르기와 선점을 UPDATE 한 문장으로
+    # (SELECT 뒤 UPDATE 하는 트랜잭션은 동시에 돌면 잠금 승격에 실패함)
+    claimed = Task.objects.using(using).filter(
+        pk=Subquery(queryset.values('pk')[:1]), status='queued'
+    ).update(**claim_fields)
+    if not claimed:
+        return None
+    return Task.objects.using(using).filter(status='running', locked_by=worker_id, locked_at=now).first()
+
+
+def execute(task):
+    """선점한 작업을 실행하고 결과(done/queued/failed)를 기록"""
+    task_function = _registry.get(task.name)
+    start = time.perf_counter()
+    update = {'locked_by': '', 'locked_at': None}
+    try:
+        if task_function is None:
+            raise LookupError(f'등록되지 않은 작업입니다: {task.name}')
+        task_function(*task.args, **task.kwargs)
+    except Exception:
+        update['last_error'] = traceback.format_exc()
+        if task_function is not None and task.attempts < task.max_attempts:
+            delay = task_function.backoff(task.attempts)
+            update.update(status='queued', run_at=timezone.now() + timedelta(seconds=delay))
+            logger.warning('작업 %s #%s 실패 (%s/%s회), %.0f초 뒤 재시도',
+                           task.name, task.pk, task.attempts, task.max_attempts, delay, exc_info=True)
+        else:
+            update.update(status='failed', finished_at=timezone.now())
+            logger.error('작업 %s #%s 최종 실패 (%s회 시도)', task.name, task.pk, task.attempts, exc_info=True)
+    else:
+        update.update(status='done', finished_at=timezone.now())
+    elapsed = time.perf_counter() - start
+
+    # 임대 시간을 넘겨 다른 워커가 가져간 경우에는 덮어쓰지 않음
+    Task.objects.using(router.db_for_write(Task)).filter(
+        pk=task.pk, status='running', locked_by=task.locked_by
+    ).update(**update)
+    metrics.tasks_processed.inc(task=task.name, status=update['status'])
+    metrics.task_duration.observe(elapsed, task=task.name)
+    return update['status']
+
+
+def requeue_stale():
+    """실행 중으로 LEASE_SECONDS 를 넘긴 작업을 다시 대기열로 (시도 횟수를 다 쓴 작업은 실패 처리)"""
+    using = router.db_for_write(Task)
+    cutoff = timezone.now() - timedelta(seconds=settings.BLOG_TASKS['LEASE_SECONDS'])
+    stale = Task.objects.using(using).filter(status='running', locked_at__lt=cutoff)
+    error = '워커가 응답하지 않아 작업을 회수했습니다.'
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status='failed', last_error=error, finished_at=timezone.now(), locked_by='', locked_at=None,
+    )
+    requeued = stale.update(status='queued', last_error=error, locked_by='', locked_at=None)
+    return requeued, failed
+
+
+def prune_finished():
+    """보관 기간(KEEP_DAYS)이 지난 완료/실패 작업 삭제"""
+    cutoff = timezone.now() - timedelta(days=settings.BLOG_TASKS['KEEP_DAYS'])
+    deleted, _ = Task.objects.using(router.db_for_write(Task)).filter(
+        status__in=['done', 'failed'], finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+class Worker:
+    """스레드 여러 개로 작업을 꺼내 실행하는 워커 (run_tasks 명령에서 사용)"""
+
+    MAINTENANCE_INTERVAL = 60  # 멈춘 작업 회수/오래된 작업 정리 주기(초)
+
+    def __init__(self, threads=4, poll_interval=1.0, burst=False):
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.burst = burst  # True 면 실행할 작업이 없을 때 종료
+        self.stop_event = threading.Event()
+        self.processed = 0
+        self._lock = threading.Lock()
+        self.worker_id = f'{socket.gethostname()}:{os.getpid()}'
+
+    def run(self):
+        threads = [
+            threading.Thread(target=self._loop, args=(f'{self.worker_id}:{i}',), name=f'blog-task-{i}')
+            for i in range(self.threads)
+        ]
+        for thread in threads:
+            thread.start()
+        next_maintenance = 0
+        try:
+            while any(thread.is_alive() for thread in threads):
+                if time.monotonic() >= next_maintenance:
+                    self.maintenance()
+                    next_maintenance = time.monotonic() + self.MAINTENANCE_INTERVAL
+                self.stop_event.wait(min(self.poll_interval, 1.0))
+        finally:
+            self.stop_event.set()
+            for thread in threads:
+                thread.join()
+        return self.processed
+
+    def stop(self):
+        self.stop_event.set()
+
+    def maintenance(self):
+        try:
+            requeued, failed = requeue_stale()
+            if requeued or failed:
+                logger.warning('멈춘 작업 회수: 재시도 %s개, 실패 %s개', requeued, failed)
+            prune_finished()
+        except Exception:
+            logger.exception('작업 큐 정리 실패')
+        finally:
+            connections.close_all()
+
+    def _loop(self, worker_id):
+        try:
+            while not self.stop_event.is_set():
+                close_old_connections()
+                try:
+                    task = claim(worker_id)
+                except Exception:
+                    logger.exception('작업을 가져오지 못했습니다.')
+                    self.stop_event.wait(self.poll_interval)
+                    continue
+                if task is None:
+                    if self.burst:
+                        return
+                    self.stop_event.wait(self.poll_interval)
+                    continue
+                execute(task)
+                with self._lock:
+                    self.processed += 1
+        finally:
+            connections.close_all()
+
+
+# ----- 블로그 작업 -----
+
+MAX_IMAGE_SIZE = 2000  # 업로드 이미지의 긴 변 최대 픽셀
+
+
+@task(priority=0, max_attempts=3)
+def process_post_image(image_id):
+    """업로드 이미지 정리 - EXIF 방향 적용, 메타데이터(위치 정보 등) 제거, 너무 큰 이미지 축소"""
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    post_image = PostImage.objects.filter(pk=image_id).first()
+    if post_image is None:
+        return
+    field = post_image.image
+    with field.open('rb') as f:
+        data = f.read()
+    try:
+        image = Image.open(io.BytesIO(data))
+        image_format = image.format
+        # 애니메이션(GIF/WebP)은 프레임이 깨지지 않도록 그대로 둠
+        if getattr(image, 'is_animated', False):
+            return
+        # 이미 작고 메타데이터도 없으면 다시 인코딩하지 않음
+        if max(image.size) <= MAX_IMAGE_SIZE and not image.getexif():
+            return
+        image = ImageOps.exif_transpose(image)
+    except (UnidentifiedImageError, OSError):
+        logger.warning('이미지 %s 를 열 수 없어 처리하지 않습니다: %s', image_id, field.name)
+        return
+    image.thumbnail((MAX_IMAGE_SIZE, MAX_IMAGE_SIZE))
+    if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    output = io.BytesIO()
+    options = {'quality': 85, 'optimize': True} if image_format in ('JPEG', 'WEBP') else {}
+    image.save(output, format=image_format, **options)
+
+    # 본문에 이미 URL 이 들어갔으므로 같은 이름으로 덮어씀
+    name = field.name
+    field.storage.delete(name)
+    saved_name = field.storage.save(name, ContentFile(output.getvalue()))
+    if saved_name != name:
+        PostImage.objects.filter(pk=image_id).update(image=saved_name)
@@ -0,0 +1,84 @@
+"""
+카테고리/태그 택소노미 서비스
+
+카테고리와 태그 전체를 쿼리 1번(LEFT JOIN)으로 읽어 트리와 슬러그 맵을 만들고
+blog_cache 의 'taxonomy' 네임스페이스에 보관한다.
+Category/Tag 저장/삭제 시 blog/signals.py 에서 네임스페이스 버전을 올려 무효화한다.
+
+글 작성 폼은 JSON 엔드포인트(views.taxonomy_json)를 ETag 로 캐시해 불러오고,
+카테고리/태그별 목록은 슬러그 맵에서 바로 찾는다.
+"""
+import hashlib
+import json
+
+from django.http import Http404
+
+from .cache import blog_cache
+from .models import Category, Tag
+
+TAXONOMY_CACHE_TIMEOUT = 60 * 60
+
+
+def load_taxonomy():
+    """카테고리와 태그를 쿼리 1번으로 읽어 직렬화 가능한 트리 구성"""
+    rows = Category.objects.values_list(
+        'id', 'name', 'slug', 'description', 'tags__id', 'tags__name', 'tags__slug'
+    ).order_by('name', 'tags__name')
+
+    categories = {}
+    for cat_id, name, slug, description, tag_id, tag_name, tag_slug in rows:
+        category = categories.get(cat_id)
+        if category is None:
+            category = categories[cat_id] = {
+                'id': cat_id, 'name': name, 'slug': slug, 'description': description, 'tags': [],
+            }
+        if tag_id is not None:
+            category['tags'].append({'id': tag_id, 'name': tag_name, 'slug': tag_slug})
+
+    tree = list(categories.values())
+    # JSON 객체 키는 문자열이므로 카테고리 id 도 문자열로
+    tags_by_category = {
+        str(category['id']): [{'id': tag['id'], 'name': tag['name']} for tag in category['tags']]
+        for category in tree
+    }
+    payload = json.dumps(
+        {'categories': tree, 'tags_by_category': tags_by_category},
+        ensure_ascii=False, separators=(',', ':'),
+    )
+    return {
+        'categories': tree,
+        'category_slugs': {category['slug']: category for category in tree},
+        'tag_slugs': {
+            tag['slug']: dict(tag, category_id=category['id'])
+            for category in tree for tag in category['tags']
+        },
+        'json': payload,
+        'etag': hashlib.md5(payload.encode()).hexdigest(),
+    }
+
+
+def get_taxonomy():
+    """캐시된 택소노미"""
+    return blog_cache.get_or_set('taxonomy', 'tree', load_taxonomy, TAXONOMY_CACHE_TIMEOUT)
+
+
+def invalidate_taxonomy():
+    blog_cache.invalidate('taxonomy')
+
+
+def get_category_or_404(slug):
+    """슬러그로 카테고리 조회 (DB 조회 없이 택소노미 맵 사용)"""
+    data = get_taxonomy()['category_slugs'].get(slug)
+    if data is None:
+        raise Http404('카테고리를 찾을 수 없습니다.')
+    return Category(
+        id=data['id'], name=data['name'], slug=data['slug'], description=data['description']
+    )
+
+
+def get_tag_or_404(slug):
+    """슬러그로 태그 조회 (DB 조회 없이 택소노미 맵 사용)"""
+    data = get_taxonomy()['tag_slugs'].get(slug)
+    if data is None:
+        raise Http404('태그를 찾을 수 없습니다.')
+    return Tag(id=data['id'], name=data['name'], slug=data['slug'], category_id=data['category_id'])
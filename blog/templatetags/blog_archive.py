@@ -0,0 +1,18 @@
+from django import template
+
+from blog import archive
+
+register = template.Library()
+
+
+@register.inclusion_tag('blog/includes/archive_widget.html')
+def archive_widget(current_year=None, current_month=None):
+    """월별 보관함 사이드바 위젯 (요약 테이블 캐시만 읽음)"""
+    years = archive.get_archive_years()
+    return {
+        'years': years,
+        # 보고 있는 연도, 없으면 가장 최근 연도를 펼쳐 둠
+        'open_year': current_year or (years[0]['year'] if years else None),
+        'current_year': current_year,
+        'current_month': current_month,
+    }
@@ -0,0 +1,15 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from blog import fragments
+
+register = template.Library()
+
+
+@register.simple_tag
+def post_fragments(**groups):
+    """게시글 카드/사이드바 조각 (조각 캐시, 한 번에 조회) - {% post_fragments card=posts popular=popular_posts as fragments %}"""
+    return {
+        name: [mark_safe(html) for html in rendered]
+        for name, rendered in fragments.render_fragments(groups).items()
+    }
@@ -0,0 +1,734 @@
+import email
+import email.policy
+import io
+import smtplib
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management import call_command
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import IntegrityError, OperationalError, connection, connections, transaction
+from django.db.models import F
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import analytics, api, fragments, suggest, surrogate, trending
+from .cache import blog_cache
+from .db import routers
+from .middleware import ReplicaRoutingMiddleware
+from .models import (
+    Category, Comment, CommentReport, MonthlyArchive, OutboxMessage, Post, PostDailyStats, PostTrendScore,
+    PostViewBucket, Tag, Task, TrendingPost, UserProfile,
+)
+from .outbox import Sender
+
+WRITE_PREFIXES = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def write_queries(context, table=None):
+    """캡처한 쿼리 중 쓰기 쿼리 (table 을 주면 그 테이블만)"""
+    return [
+        query['sql'] for query in context.captured_queries
+        if query['sql'].lstrip().upper().startswith(WRITE_PREFIXES)
+        and (table is None or f'"{table}"' in query['sql'])
+    ]
+
+
+class ProfileWriteTests(TestCase):
+    """로그인/프로필 조회가 프로필을 불필요하게 저장하지 않는지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('writer', password='pass-1234!')
+
+    def test_login_does_not_write_profile(self):
+        UserProfile.objects.create(user=self.user, bio='소개')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('login'), {'username': 'writer', 'password': 'pass-1234!'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(write_queries(context, 'blog_userprofile'), [])
+        # last_login 갱신은 그대로
+        self.assertEqual(len(write_queries(context, 'auth_user')), 1)
+
+    def test_login_without_profile_does_not_create_one(self):
+        self.client.post(reverse('login'), {'username': 'writer', 'password': 'pass-1234!'})
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+
+    def test_profile_view_does_not_write(self):
+        UserProfile.objects.create(user=self.user, bio='소개')
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('user_profile', args=['writer']))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(write_queries(context), [])
+
+    def test_profile_view_without_profile_does_not_write(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('user_profile', args=['writer']))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(write_queries(context), [])
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+
+    def test_profile_edit_creates_profile_once(self):
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse('profile_edit'))
+        self.assertEqual(write_queries(context, 'blog_userprofile'), [])
+
+        data = {'bio': '소개', 'website': '', 'github': '', 'skills': '', 'location': ''}
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('profile_edit'), data)
+        self.assertEqual(response.status_code, 302)
+        writes = write_queries(context, 'blog_userprofile')
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0].lstrip().upper().startswith('INSERT'))
+
+        # 바뀐 것이 없으면 다시 저장하지 않음
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(reverse('profile_edit'), data)
+        self.assertEqual(write_queries(context, 'blog_userprofile'), [])
+
+    def test_changed_profile_updates_only_changed_fields(self):
+        profile = UserProfile.objects.create(user=self.user, bio='소개')
+        profile = UserProfile.objects.get(pk=profile.pk)
+        profile.location = '서울'
+        with CaptureQueriesContext(connection) as context:
+            profile.save()
+        writes = write_queries(context, 'blog_userprofile')
+        self.assertEqual(len(writes), 1)
+        self.assertIn('"location"', writes[0])
+        self.assertNotIn('"bio"', writes[0])
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    """항상 SMTP 응답 오류를 내는 발송 백엔드 (코드는 smtp_code 로 지정)"""
+
+    smtp_code = 451
+
+    def send_messages(self, email_messages):
+        raise smtplib.SMTPResponseException(self.smtp_code, b'test failure')
+
+
+class PermanentlyFailingEmailBackend(FailingEmailBackend):
+    smtp_code = 550
+
+
+def outbox_settings(backend, **options):
+    return override_settings(BLOG_OUTBOX={**settings.BLOG_OUTBOX, 'BACKEND': backend, **options})
+
+
+@override_settings(EMAIL_BACKEND='blog.outbox.OutboxEmailBackend')
+class OutboxTests(TestCase):
+    """아웃박스 기록과 Sender 발송/재시도/발송 포기"""
+
+    def queue_mail(self, to=('reader@example.com',)):
+        mail.send_mail('제목', '본문', 'noreply@example.com', list(to))
+
+    def send(self):
+        sender = Sender()
+        return sender.send_batch(sender.claim())
+
+    def test_send_mail_only_records_rows_per_domain(self):
+        self.queue_mail(['a@example.com', 'b@example.com', 'c@example.org'])
+        self.assertEqual(mail.outbox, [])
+        rows = {row.domain: row.recipients for row in OutboxMessage.objects.all()}
+        self.assertEqual(rows, {'example.com': ['a@example.com', 'b@example.com'], 'example.org': ['c@example.org']})
+
+    def test_rolled_back_mail_is_not_recorded(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.queue_mail()
+                raise RuntimeError
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    @outbox_settings('django.core.mail.backends.locmem.EmailBackend')
+    def test_sender_delivers_stored_message(self):
+        self.queue_mail()
+        self.assertEqual(self.send()['sent'], 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['reader@example.com'])
+        # 기록해 둔 MIME 이 그대로 나감
+        sent = email.message_from_bytes(mail.outbox[0].message().as_bytes(), policy=email.policy.default)
+        self.assertEqual(sent['Subject'], '제목')
+        self.assertEqual(sent.get_content().strip(), '본문')
+        row = OutboxMessage.objects.get()
+        self.assertEqual(row.status, 'sent')
+        self.assertIsNotNone(row.sent_at)
+        self.assertEqual(row.locked_by, '')
+
+    @outbox_settings('blog.tests.FailingEmailBackend')
+    def test_temporary_failure_is_retried_later(self):
+        self.queue_mail()
+        self.assertEqual(self.send()['retry'], 1)
+        row = OutboxMessage.objects.get()
+        self.assertEqual((row.status, row.attempts), ('pending', 1))
+        self.assertGreater(row.next_attempt_at, timezone.now())
+        self.assertIn('451', row.last_error)
+        # 다음 시도 시각 전에는 다시 선점하지 않음
+        self.assertEqual(Sender().claim(), [])
+
+    @outbox_settings('blog.tests.PermanentlyFailingEmailBackend')
+    def test_permanent_failure_is_dead_lettered(self):
+        self.queue_mail()
+        self.assertEqual(self.send()['dead'], 1)
+        row = OutboxMessage.objects.get()
+        self.assertEqual((row.status, row.attempts), ('dead', 1))
+
+    @outbox_settings('blog.tests.FailingEmailBackend', MAX_ATTEMPTS=3)
+    def test_dead_lettered_after_max_attempts(self):
+        self.queue_mail()
+        OutboxMessage.objects.update(attempts=2)
+        self.assertEqual(self.send()['dead'], 1)
+        row = OutboxMessage.objects.get()
+        self.assertEqual((row.status, row.attempts), ('dead', 3))
+
+
+@override_settings(BLOG_ANALYTICS={**settings.BLOG_ANALYTICS, 'SPOOL_DIR': None, 'BATCH_SIZE': 1000, 'FLUSH_INTERVAL': 3600})
+class PostViewTests(TestCase):
+    """조회 요청은 게시글 행에 쓰지 않고, 적재 때 조회수를 묶어서 더함"""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user('author')
+        cls.posts = [
+            Post.objects.create(title=f'글 {number}', content='본문', author=author, status='published')
+            for number in range(3)
+        ]
+
+    def tearDown(self):
+        analytics.hit_buffer.flush()
+
+    def test_view_does_not_update_post_row(self):
+        post = self.posts[0]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('post_detail', args=[post.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(write_queries(context, 'blog_post'), [])
+        self.assertEqual(len(analytics.hit_buffer.hits), 1)
+
+    def test_ingest_adds_views_in_grouped_updates(self):
+        first, second, third = self.posts
+        now = timezone.now().timestamp()
+        hits = [(now, first.pk, '')] * 3 + [(now, second.pk, '')] * 3 + [(now, third.pk, 'example.com')]
+        with CaptureQueriesContext(connection) as context:
+            analytics.ingest(hits)
+        post_updates = write_queries(context, 'blog_post')
+        # 증가분 3, 1 두 묶음
+        self.assertEqual(len([sql for sql in post_updates if sql.lstrip().upper().startswith('UPDATE')]), 2)
+        views = dict(Post.objects.values_list('pk', 'views'))
+        self.assertEqual((views[first.pk], views[second.pk], views[third.pk]), (3, 3, 1))
+        self.assertEqual(PostDailyStats.objects.get(post=first).views, 3)
+
+
+class SeedDataTests(TestCase):
+    """벤치마크용 seed_data 명령이 모델 변경 뒤에도 돌아가는지 (작은 데이터로)"""
+
+    def test_seed_and_clear(self):
+        options = {'users': 3, 'categories': 2, 'tags_per_category': 3, 'posts': 5, 'comments': 10, 'reports': 2}
+        call_command('seed_data', stdout=io.StringIO(), **options)
+        self.assertEqual(Post.objects.count(), 5)
+        self.assertEqual(Comment.objects.count(), 10)
+        # 작성일을 과거로 분산해도 수정일이 함께 채워짐
+        self.assertFalse(Comment.objects.exclude(updated_at=F('created_at')).exists())
+
+        call_command('seed_data', clear=True, stdout=io.StringIO())
+        self.assertFalse(Post.objects.exists())
+        self.assertFalse(Comment.objects.exists())
+
+
+@skipUnless('replica_1' in settings.DATABASES, 'replica_1 DB 설정이 없음 (config.test_settings 로 실행)')
+@override_settings(
+    DATABASE_REPLICAS=['replica_1'],
+    BLOG_ANALYTICS={**settings.BLOG_ANALYTICS, 'SPOOL_DIR': None, 'BATCH_SIZE': 1000, 'FLUSH_INTERVAL': 3600},
+)
+class ReplicaRoutingTests(TransactionTestCase):
+    """GET 읽기는 복제본, 쓰기 요청 뒤 primary 고정, 복제본 장애 시 primary 로 대체 (config.test_settings 의 미러 사용)
+
+    복제본 커넥션이 커밋된 데이터를 봐야 하므로 TransactionTestCase
+    """
+
+    databases = {'default', 'replica_1'}.intersection(settings.DATABASES)
+
+    def setUp(self):
+        self.user = User.objects.create_user('reader', password='pass-1234!')
+        self.post = Post.objects.create(title='복제본 글', content='본문', author=self.user, status='published')
+        # 방금 확인한 정상 복제본으로 - 백그라운드 상태 확인 스레드를 띄우지 않음
+        health = mock.patch.dict(routers._health, {'replica_1': (True, time.monotonic())})
+        health.start()
+        self.addCleanup(health.stop)
+        # 조회 이벤트는 테스트 DB 가 남아 있을 때 적재
+        self.addCleanup(analytics.hit_buffer.flush)
+
+    def get_post(self):
+        """게시글 상세 GET - (요청의 라우팅 상태, primary 에서 게시글을 읽은 쿼리)"""
+        with CaptureQueriesContext(connections['default']) as primary:
+            response = self.client.get(reverse('post_detail', args=[self.post.pk]))
+        self.assertEqual(response.status_code, 200)
+        return response.wsgi_request.replica_routing, [
+            query['sql'] for query in primary.captured_queries if '"blog_post"' in query['sql']
+        ]
+
+    def test_get_reads_from_replica(self):
+        with CaptureQueriesContext(connections['replica_1']) as replica:
+            state, primary_reads = self.get_post()
+        self.assertEqual(state.replica, 'replica_1')
+        self.assertTrue(any('"blog_post"' in query['sql'] for query in replica.captured_queries))
+        self.assertEqual(primary_reads, [])
+
+    def test_write_request_pins_primary(self):
+        response = self.client.post(reverse('login'), {'username': 'reader', 'password': 'pass-1234!'})
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(settings.REPLICA_PIN_COOKIE_NAME, response.cookies)
+
+        state, primary_reads = self.get_post()
+        self.assertFalse(state.use_replicas)
+        self.assertIsNone(state.replica)
+        self.assertTrue(primary_reads)
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        error = OperationalError('unable to open database file')
+        with mock.patch.object(connections['replica_1'], 'ensure_connection', side_effect=error):
+            state, primary_reads = self.get_post()
+        self.assertIsNone(state.replica)
+        self.assertTrue(primary_reads)
+        self.assertFalse(routers._health['replica_1'][0])
+
+    def test_failed_replica_query_reruns_on_primary(self):
+        class BrokenCursor:
+            def execute(self, sql, params=None):
+                raise sqlite3.OperationalError('replica went away')
+
+            def close(self):
+                pass
+
+        connections['replica_1'].ensure_connection()
+        with mock.patch.object(connections['replica_1'], 'create_cursor', return_value=BrokenCursor()):
+            state, primary_reads = self.get_post()
+        self.assertIsNone(state.replica)
+        self.assertTrue(primary_reads)
+        self.assertFalse(routers._health['replica_1'][0])
+
+    def test_primary_error_keeps_replica(self):
+        request = RequestFactory().get('/')
+        request.replica_routing = state = routers.RoutingState(True)
+        state.replica = 'replica_1'
+        middleware = ReplicaRoutingMiddleware(lambda request: None)
+        self.assertIsNone(middleware.process_exception(request, IntegrityError('primary error')))
+        self.assertTrue(routers._health['replica_1'][0])
+
+
+@override_settings(BLOG_ANALYTICS={**settings.BLOG_ANALYTICS, 'SPOOL_DIR': None, 'BATCH_SIZE': 1000, 'FLUSH_INTERVAL': 3600})
+class RelatedPostsTests(TestCase):
+    """관련 글 카드의 카테고리는 관련 글 쿼리에서 함께 읽음"""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user('author')
+        category = Category.objects.create(name='장고', slug='django')
+        cls.post = Post.objects.create(title='본문 글', content='본문', author=author, category=category,
+                                       status='published')
+        for number in range(3):
+            Post.objects.create(title=f'관련 {number}', content='본문', author=author, category=category,
+                                status='published')
+
+    def tearDown(self):
+        analytics.hit_buffer.flush()
+
+    def test_related_cards_do_not_query_categories(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('post_detail', args=[self.post.pk]))
+        self.assertEqual(len(response.context['related_posts']), 3)
+        category_queries = [query['sql'] for query in context.captured_queries
+                            if 'FROM "blog_category"' in query['sql']]
+        self.assertEqual(category_queries, [])
+
+
+class CommentReportTests(TestCase):
+    """댓글 신고 - 중복 신고는 경고, 세 번째 신고에서 자동 숨김"""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user('author')
+        cls.reporters = [User.objects.create_user(f'reporter{number}') for number in range(3)]
+        cls.post = Post.objects.create(title='글', content='본문', author=author, status='published')
+        cls.comment = Comment.objects.create(post=cls.post, author=author, content='댓글')
+
+    def report(self, user):
+        self.client.force_login(user)
+        return self.client.post(
+            reverse('comment_report', args=[self.post.pk, self.comment.pk]), {'reason': 'spam'}, follow=True
+        )
+
+    def test_duplicate_report_warns(self):
+        self.report(self.reporters[0])
+        response = self.report(self.reporters[0])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('이미 신고한 댓글입니다.', [str(message) for message in response.context['messages']])
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.report_count, 1)
+        self.assertEqual(CommentReport.objects.filter(comment=self.comment).count(), 1)
+
+    def test_third_report_hides_comment(self):
+        for number, reporter in enumerate(self.reporters, start=1):
+            self.report(reporter)
+            self.comment.refresh_from_db()
+            self.assertEqual(self.comment.report_count, number)
+            self.assertEqual(self.comment.is_hidden, number >= Comment.AUTO_HIDE_REPORT_COUNT)
+        self.assertIsNotNone(self.comment.last_reported_at)
+
+    def test_moderation_link_for_staff(self):
+        staff = User.objects.create_user('moderator', is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get(reverse('post_list'))
+        self.assertContains(response, reverse('moderation_queue'))
+        self.assertEqual(self.client.get(reverse('moderation_queue')).status_code, 200)
+
+        self.client.force_login(self.reporters[0])
+        self.assertNotContains(self.client.get(reverse('post_list')), reverse('moderation_queue'))
+
+
+@override_settings(BLOG_TRENDING={**settings.BLOG_TRENDING, 'HALF_LIFE_HOURS': 24, 'TOP_K': 2})
+class TrendingTests(TestCase):
+    """시간 감쇠 점수 누적과 범위별 Top-K 재구성"""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user('author')
+        cls.category = Category.objects.create(name='장고', slug='django')
+        cls.tag = Tag.objects.create(name='ORM', slug='orm', category=cls.category)
+        cls.posts = [
+            Post.objects.create(title=f'글 {number}', content='본문', author=author, category=cls.category,
+                                status='published')
+            for number in range(3)
+        ]
+        cls.posts[0].tags.add(cls.tag)
+        cls.now = trending.truncate_hour(timezone.now())
+
+    def add_views(self, post, hours_ago, views):
+        bucket, _ = PostViewBucket.objects.get_or_create(post=post, hour=self.now - timedelta(hours=hours_ago))
+        PostViewBucket.objects.filter(pk=bucket.pk).update(views=F('views') + views)
+
+    def score(self, post):
+        return PostTrendScore.objects.get(post=post).score
+
+    def test_decay_halves_every_half_life(self):
+        self.assertEqual(trending.decay(0), 1.0)
+        self.assertAlmostEqual(trending.decay(24 * 3600), 0.5)
+        self.assertAlmostEqual(trending.decay(48 * 3600), 0.25)
+
+    def test_only_new_views_are_added(self):
+        post = self.posts[0]
+        self.add_views(post, 24, 10)
+        self.assertEqual(trending.apply_new_views(self.now), 1)
+        self.assertAlmostEqual(self.score(post), 5.0)
+        # 새 조회가 없으면 다시 계산하지 않음
+        self.assertEqual(trending.apply_new_views(self.now), 0)
+
+        # 하루 뒤: 기존 점수와 지금 시간대의 새 조회 4건 모두 반으로
+        self.add_views(post, 0, 4)
+        trending.apply_new_views(self.now + timedelta(hours=24))
+        self.assertAlmostEqual(self.score(post), 2.5 + 4 * 0.5)
+        self.assertFalse(PostViewBucket.objects.filter(views__gt=F('scored_views')).exists())
+
+    def test_rebuild_keeps_top_k_per_scope(self):
+        for post, views in zip(self.posts, (30, 20, 10)):
+            self.add_views(post, 0, views)
+        Post.objects.filter(pk=self.posts[1].pk).update(status='draft')
+        trending.refresh(self.now)
+
+        ranked = {}
+        for scope, post_id in TrendingPost.objects.order_by('scope', 'rank').values_list('scope', 'post_id'):
+            ranked.setdefault(scope, []).append(post_id)
+        # 비공개(초안) 글은 빠지고, 범위마다 TOP_K 개까지
+        self.assertEqual(ranked[trending.GLOBAL_SCOPE], [self.posts[0].pk, self.posts[2].pk])
+        self.assertEqual(ranked[trending.category_scope(self.category.pk)], [self.posts[0].pk, self.posts[2].pk])
+        self.assertEqual(ranked[trending.tag_scope(self.tag.pk)], [self.posts[0].pk])
+
+        with self.assertNumQueries(1):
+            posts = trending.query_trending_posts(trending.category_scope(self.category.pk))
+        self.assertEqual(posts, [self.posts[0], self.posts[2]])
+
+
+class ApiTests(TestCase):
+    """JSON API - 키셋 cursor, 필드 선택, ETag 304"""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user('author')
+        created_at = timezone.now()
+        cls.posts = [
+            Post.objects.create(title=f'글 {number}', content='본문', author=author, status='published')
+            for number in range(5)
+        ]
+        # 작성일이 같은 글도 id 로 순서가 정해지는지
+        Post.objects.update(created_at=created_at)
+
+    def setUp(self):
+        blog_cache.invalidate('posts')
+
+    def test_cursor_round_trip(self):
+        created_at = timezone.now()
+        self.assertEqual(api.decode_cursor(api.encode_cursor(created_at, 42)), (created_at, 42))
+        response = self.client.get(reverse('api_post_list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_keyset_pages_cover_all_posts_without_offset(self):
+        seen = []
+        cursor = None
+        with CaptureQueriesContext(connection) as context:
+            while True:
+                params = {'limit': 2, 'fields': 'id,title'}
+                if cursor:
+                    params['cursor'] = cursor
+                data = self.client.get(reverse('api_post_list'), params).json()
+                self.assertTrue(all(list(item) == ['id', 'title'] for item in data['results']))
+                seen += [item['id'] for item in data['results']]
+                cursor = data['next']
+                if not cursor:
+                    break
+        self.assertEqual(seen, sorted((post.pk for post in self.posts), reverse=True))
+        self.assertFalse(any('OFFSET' in query['sql'] for query in context.captured_queries))
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(reverse('api_post_list'), {'fields': 'id,password'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.json()['error'])
+
+    def test_etag_returns_not_modified(self):
+        url = reverse('api_post_detail', args=[self.posts[0].pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['content'], '본문')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+
+class MonthlyArchiveTests(TestCase):
+    """게시글 저장/삭제/관리자 일괄 변경 때 해당 월만 다시 셈"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author')
+        cls.march = timezone.make_aware(datetime(2025, 3, 15, 12))
+
+    def setUp(self):
+        blog_cache.invalidate('archive')
+
+    def create_post(self, status='published', created_at=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = Post.objects.create(title='글', content='본문', author=self.author, status=status)
+        if created_at:
+            Post.objects.filter(pk=post.pk).update(created_at=created_at)
+            post.refresh_from_db()
+            with self.captureOnCommitCallbacks(execute=True):
+                post.save()
+        return post
+
+    def months(self):
+        return {(entry.year, entry.month): entry.post_count for entry in MonthlyArchive.objects.all()}
+
+    def test_save_and_delete_recount_month(self):
+        first = self.create_post(created_at=self.march)
+        self.create_post(created_at=self.march)
+        self.create_post(status='draft', created_at=self.march)
+        self.assertEqual(self.months().get((2025, 3)), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(self.months().get((2025, 3)), 1)
+        response = self.client.get(reverse('archive_month', args=[2025, 3]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['posts']), 1)
+
+    def test_admin_bulk_publish_recounts_months(self):
+        drafts = [self.create_post(status='draft', created_at=self.march) for _ in range(2)]
+        self.assertNotIn((2025, 3), self.months())
+        self.client.force_login(User.objects.create_superuser('admin', password='pass-1234!'))
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as context:
+            self.client.post(reverse('admin:blog_post_changelist'), {
+                'action': 'make_published', '_selected_action': [post.pk for post in drafts],
+            })
+        self.assertEqual(self.months().get((2025, 3)), 2)
+        # 선택한 행을 모두 읽지 않고 달/카테고리는 DISTINCT 로
+        distinct = [query['sql'] for query in context.captured_queries if query['sql'].startswith('SELECT DISTINCT')]
+        self.assertEqual(len(distinct), 2)
+
+    def test_unknown_month_is_404(self):
+        self.create_post(created_at=self.march)
+        self.assertEqual(self.client.get(reverse('archive_month', args=[2025, 4])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('archive_year', args=[2024])).status_code, 404)
+
+
+@override_settings(BLOG_TASKS={**settings.BLOG_TASKS, 'EAGER': False})
+class SuggestTests(TestCase):
+    """자동완성 - 자모/초성 접두어 색인과 변경 반영"""
+
+    def setUp(self):
+        self.index = suggest.PrefixIndex()
+        for entry in [
+            ('category', 1, '한국 여행', 'travel', 0),
+            ('tag', 2, '파이썬', 'python', 0),
+            ('post', 3, '장고 한국어 번역', '', 10),
+            ('post', 4, '과일 고르기', '', 5),
+        ]:
+            self.index.put(entry)
+
+    def labels(self, query):
+        return [entry[2] for entry in self.index.search(query)]
+
+    def test_jamo_decomposition(self):
+        self.assertEqual(suggest.to_jamo('한국'), 'ㅎㅏㄴㄱㅜㄱ')
+        # 겹모음은 입력 중간 상태와 맞도록 풀어 씀
+        self.assertEqual(suggest.to_jamo('과'), 'ㄱㅗㅏ')
+        self.assertEqual(suggest.to_choseong('한국 여행'), 'ㅎㄱ ㅇㅎ')
+
+    def test_prefix_matches_partial_syllables_and_choseong(self):
+        self.assertEqual(self.labels('한ㄱ'), ['한국 여행', '장고 한국어 번역'])
+        self.assertEqual(self.labels('ㅎㄱ'), ['한국 여행', '장고 한국어 번역'])
+        self.assertEqual(self.labels('고'), ['과일 고르기'])
+        self.assertEqual(self.labels('파이'), ['파이썬'])
+        self.assertEqual(self.labels('없는말'), [])
+
+    def test_put_replaces_and_remove_deletes(self):
+        self.assertFalse(self.index.put(('tag', 2, '파이썬', 'python', 0)))
+        self.assertTrue(self.index.put(('tag', 2, '자바', 'java', 0)))
+        self.assertEqual(self.labels('파이'), [])
+        self.assertTrue(self.index.remove(suggest.entry_id('tag', 2)))
+        self.assertEqual(self.labels('자바'), [])
+        self.assertEqual(len(self.index.keys), len(self.index.refs))
+
+    def test_save_patches_local_index_and_enqueues_one_rebuild(self):
+        blog_cache.invalidate('suggest')
+        suggest.get_index(wait=True)
+        author = User.objects.create_user('author')
+        # 같은 SNAPSHOT_DEBOUNCE 구간 안의 변경
+        with mock.patch.object(suggest.time, 'time', return_value=1_000_000), \
+                self.captureOnCommitCallbacks(execute=True):
+            posts = [
+                Post.objects.create(title=f'자동완성 {n}번째 글', content='본문', author=author, status='published')
+                for n in range(2)
+            ]
+        self.assertEqual({entry[1] for entry in suggest.index.search('ㅈㄷ')}, {post.pk for post in posts})
+        # 스냅숏 재생성 작업은 하나만 등록됨
+        self.assertEqual(Task.objects.filter(name=suggest.rebuild_snapshot.name).count(), 1)
+
+
+@override_settings(
+    BLOG_SURROGATE={**settings.BLOG_SURROGATE, 'PURGE_URL': 'http://cache.invalid/purge'},
+    BLOG_TASKS={**settings.BLOG_TASKS, 'EAGER': False},
+)
+class SurrogateKeyTests(TestCase):
+    """앞단 캐시 서로게이트 키 - 익명 응답 태깅과 중복 없는 퍼지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author')
+        cls.category = Category.objects.create(name='파이썬', slug='python')
+        cls.post = Post.objects.create(
+            title='글', content='본문', author=cls.author, category=cls.category, status='published'
+        )
+
+    def purges(self):
+        return [task.args[0] for task in Task.objects.filter(name=surrogate.purge_surrogate_keys.name)]
+
+    def test_anonymous_response_is_tagged_and_public(self):
+        response = self.client.get(reverse('category_posts', args=['python']))
+        keys = response['Surrogate-Key'].split()
+        self.assertIn(surrogate.category_key('python'), keys)
+        self.assertIn(surrogate.post_key(self.post.pk), keys)
+        self.assertIn(surrogate.TAXONOMY, keys)
+        self.assertIn('public', response['Cache-Control'])
+
+    def test_logged_in_response_is_private(self):
+        self.client.force_login(self.author)
+        response = self.client.get(reverse('category_posts', args=['python']))
+        self.assertFalse(response.has_header('Surrogate-Key'))
+        self.assertIn('private', response['Cache-Control'])
+
+    def test_batch_sends_deduplicated_keys_once(self):
+        with surrogate.batch():
+            with self.captureOnCommitCallbacks(execute=True):
+                surrogate.purge(surrogate.POST_LIST, surrogate.post_key(1))
+                surrogate.purge(surrogate.post_key(1), surrogate.FEED)
+            self.assertEqual(self.purges(), [])
+        self.assertEqual(self.purges(), [sorted([surrogate.FEED, surrogate.POST_LIST, surrogate.post_key(1)])])
+
+    def test_rollback_drops_purge(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                surrogate.purge(surrogate.FEED)
+                transaction.set_rollback(True)
+        self.assertEqual(self.purges(), [])
+
+    def test_admin_hide_comments_purges_post_pages(self):
+        comments = [Comment.objects.create(post=self.post, author=self.author, content='댓글') for _ in range(2)]
+        admin = User.objects.create_superuser('admin')
+        self.client.force_login(admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('admin:blog_comment_changelist'), {
+                'action': 'hide_comments', '_selected_action': [comment.pk for comment in comments],
+            })
+        self.assertFalse(Comment.objects.filter(is_hidden=False).exists())
+        self.assertEqual(self.purges(), [[surrogate.post_key(self.post.pk)]])
+
+
+@override_settings(BLOG_FRAGMENT_CACHE={**settings.BLOG_FRAGMENT_CACHE, 'ENABLED': True})
+class FragmentCacheTests(TestCase):
+    """게시글 조각 캐시 - 캐시 적중과 키/네임스페이스 무효화"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', email='author@example.com')
+        cls.category = Category.objects.create(name='파이썬', slug='python')
+        cls.tag = Tag.objects.create(name='장고', slug='django', category=cls.category)
+        cls.post = Post.objects.create(
+            title='글', content='본문', author=cls.author, category=cls.category, status='published'
+        )
+
+    def setUp(self):
+        blog_cache.invalidate('fragments')
+
+    def render(self):
+        with CaptureQueriesContext(connection) as queries:
+            html = fragments.render_fragments({'card': [Post.objects.get(pk=self.post.pk)]})['card'][0]
+        return html, len(queries)
+
+    def test_second_render_is_cache_hit(self):
+        html, misses = self.render()
+        self.assertIn('author', html)
+        cached, hits = self.render()
+        self.assertEqual(cached, html)
+        # 두 번째는 게시글과 댓글 수만 읽음 (작성자/카테고리/태그는 읽지 않음)
+        self.assertEqual(hits, 2)
+        self.assertLess(hits, misses)
+
+    def test_username_change_invalidates_but_email_change_does_not(self):
+        with mock.patch.object(blog_cache, 'invalidate') as invalidate:
+            user = User.objects.get(pk=self.author.pk)
+            user.email = 'new@example.com'
+            user.save()
+            user.last_login = timezone.now()
+            user.save(update_fields=['last_login'])
+            invalidate.assert_not_called()
+
+            user.username = 'renamed'
+            user.save()
+            invalidate.assert_called_once_with('fragments')
+
+    def test_tag_change_moves_fragment_key(self):
+        post = Post.objects.get(pk=self.post.pk)
+        post.comment_count = 0
+        before = fragments.fragment_key('card', post)
+        post.tags.add(self.tag)
+        post.refresh_from_db()
+        post.comment_count = 0
+        self.assertNotEqual(fragments.fragment_key('card', post), before)
+        self.assertIn('장고', self.render()[0])
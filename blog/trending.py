@@ -0,0 +1,166 @@
+"""
+시간 감쇠 트렌딩 순위
+
+조회는 분석 파이프라인(blog.analytics)이 게시글별 한 시간 단위 버킷(PostViewBucket)에 모아 더하고,
+refresh_trending 명령이 주기적으로 아직 반영하지 않은 조회만 읽어 게시글 점수(PostTrendScore)를 갱신한다.
+    점수 = Σ 조회수 × 0.5 ^ (경과 시간 / HALF_LIFE_HOURS)   (지수 감쇠)
+점수는 계산 시각(scored_at) 기준 값으로 저장하므로, 새 조회가 없는 글은 다시 계산하지 않고
+읽을 때 0.5 ^ (지난 시간 / 반감기) 만 곱하면 된다.
+갱신이 끝나면 전체/카테고리/태그별 Top-K 를 TrendingPost 에 다시 만들어 두므로,
+읽기는 (scope, rank) 인덱스로 K 개만 가져오는 고정 비용이다.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .cache import blog_cache
+from .models import Post, PostTrendScore, PostViewBucket, TrendingPost
+
+GLOBAL_SCOPE = 'all'
+TRENDING_CACHE_TIMEOUT = 60
+
+
+def category_scope(category_id):
+    return f'category:{category_id}'
+
+
+def tag_scope(tag_id):
+    return f'tag:{tag_id}'
+
+
+def truncate_hour(value):
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def decay(seconds):
+    """경과 시간(초)에 대한 감쇠 계수"""
+    half_life = settings.BLOG_TRENDING['HALF_LIFE_HOURS'] * 3600
+    return 0.5 ** (max(seconds, 0) / half_life)
+
+
+# ----- 읽기 -----
+
+def query_trending_posts(scope=GLOBAL_SCOPE, limit=5):
+    """범위별 트렌딩 게시글 (지금 공개 상태인 글만)"""
+    now = timezone.now()
+    visible = Q(post__status='published') | Q(post__status='scheduled', post__published_at__lte=now)
+    return [
+        entry.post for entry in TrendingPost.objects.filter(
+            visible, scope=scope, post__is_public=True
+        ).select_related('post').order_by('rank')[:limit]
+    ]
+
+
+def get_trending_posts(scope=GLOBAL_SCOPE, limit=5):
+    """트렌딩 게시글 (2단계 캐시, refresh 때 무효화)"""
+    return blog_cache.get_or_set(
+        'trending', f'{scope}:{limit}', lambda: query_trending_posts(scope, limit), TRENDING_CACHE_TIMEOUT
+    )
+
+
+# ----- 갱신 -----
+
+def apply_new_views(now):
+    """점수에 반영하지 않은 버킷 조회를 게시글 점수에 더함 - 갱신한 게시글 수 반환"""
+    added = defaultdict(float)
+    by_delta = defaultdict(list)
+    for pk, post_id, hour, views, scored_views in PostViewBucket.objects.filter(
+        views__gt=F('scored_views')
+    ).values_list('pk', 'post_id', 'hour', 'views', 'scored_views'):
+        delta = views - scored_views
+        added[post_id] += delta * decay((now - hour).total_seconds())
+        by_delta[delta].append(pk)
+    if not added:
+        return 0
+
+    scores = dict.fromkeys(added, 0.0)
+    post_ids = list(added)
+    for start in range(0, len(post_ids), 500):
+        for post_id, score, scored_at in PostTrendScore.objects.filter(
+            post_id__in=post_ids[start:start + 500]
+        ).values_list('post_id', 'score', 'scored_at'):
+            scores[post_id] = score * decay((now - scored_at).total_seconds())
+    rows = [
+        PostTrendScore(post_id=post_id, score=scores[post_id] + extra, scored_at=now)
+        for post_id, extra in added.items()
+    ]
+    with transaction.atomic():
+        PostTrendScore.objects.bulk_create(
+            rows, batch_size=500,
+            update_conflicts=True, unique_fields=['post'], update_fields=['score', 'scored_at'],
+        )
+        # 읽은 뒤 늘어난 조회는 다음 갱신 때 반영되도록 읽은 만큼만 표시 (같은 증가분끼리 묶어 UPDATE)
+        for delta, ids in by_delta.items():
+            for start in range(0, len(ids), 500):
+                PostViewBucket.objects.filter(pk__in=ids[start:start + 500]).update(
+                    scored_views=F('scored_views') + delta
+                )
+    return len(rows)
+
+
+def rebuild_top_k(now):
+    """전체/카테고리/태그별 Top-K 를 다시 만들고 만든 행 수 반환"""
+    top_k = settings.BLOG_TRENDING['TOP_K']
+    published = Q(post__status='published') | Q(post__status='scheduled', post__published_at__lte=now)
+    candidates = PostTrendScore.objects.filter(published, post__is_public=True)
+    rows = candidates.values_list('post_id', 'score', 'scored_at', 'post__category_id')
+    scored = [
+        (score * decay((now - scored_at).total_seconds()), post_id, category_id)
+        for post_id, score, scored_at, category_id in rows
+    ]
+    tags = defaultdict(list)
+    for post_id, tag_id in Post.tags.through.objects.filter(
+        post_id__in=candidates.values('post_id')
+    ).values_list('post_id', 'tag_id'):
+        tags[post_id].append(tag_id)
+
+    ranking = defaultdict(list)
+    for score, post_id, category_id in sorted(scored, reverse=True):
+        scopes = [GLOBAL_SCOPE] + [tag_scope(tag_id) for tag_id in tags[post_id]]
+        if category_id is not None:
+            scopes.append(category_scope(category_id))
+        for scope in scopes:
+            if len(ranking[scope]) < top_k:
+                ranking[scope].append((post_id, score))
+
+    entries = [
+        TrendingPost(scope=scope, rank=rank, post_id=post_id, score=score)
+        for scope, posts in ranking.items()
+        for rank, (post_id, score) in enumerate(posts, start=1)
+    ]
+    with transaction.atomic():
+        TrendingPost.objects.all().delete()
+        TrendingPost.objects.bulk_create(entries, batch_size=1000)
+    return len(entries)
+
+
+def prune(now):
+    """오래된 점수/버킷 정리 - (점수, 버킷) 삭제 수 반환"""
+    config = settings.BLOG_TRENDING
+    # 반감기의 14배가 지나면 감쇠 계수가 0.0001 미만
+    stale_scores, _ = PostTrendScore.objects.filter(
+        scored_at__lt=now - timedelta(hours=config['HALF_LIFE_HOURS'] * 14)
+    ).delete()
+    old_buckets, _ = PostViewBucket.objects.filter(
+        hour__lt=now - timedelta(days=config['BUCKET_RETENTION_DAYS']), views=F('scored_views')
+    ).delete()
+    return stale_scores, old_buckets
+
+
+def refresh(now=None):
+    """새 조회 반영 → 정리 → Top-K 재구성, {'updated', 'entries', 'pruned_scores', 'pruned_buckets'} 반환"""
+    now = now or timezone.now()
+    updated = apply_new_views(now)
+    pruned_scores, pruned_buckets = prune(now)
+    entries = rebuild_top_k(now)
+    blog_cache.invalidate('trending')
+    return {
+        'updated': updated,
+        'entries': entries,
+        'pruned_scores': pruned_scores,
+        'pruned_buckets': pruned_buckets,
+    }
@@ -1,11 +1,15 @@
+from django.conf import settings
 from django.urls import path
 from django.contrib.auth import views as auth_views
-from . import views
+from . import api, views, async_views
+
+# 읽기 전용 핫패스 - ASGI 환경에서는 비동기 뷰 사용
+read_views = async_views if settings.BLOG_ASYNC_VIEWS else views
 
 urlpatterns = [
     # 게시글
-    path('', views.post_list, name='post_list'),
-    path('post/<int:pk>/', views.post_detail, name='post_detail'),
+    path('', read_views.post_list, name='post_list'),
+    path('post/<int:pk>/', read_views.post_detail, name='post_detail'),
     path('post/new/', views.post_create, name='post_create'),
     path('post/<int:pk>/edit/', views.post_update, name='post_update'),
     path('post/<int:pk>/delete/', views.post_delete, name='post_delete'),
@@ -19,10 +23,17 @@ urlpatterns = [
     # 카테고리 & 태그
     path('category/<slug:slug>/', views.category_posts, name='category_posts'),
     path('tag/<slug:slug>/', views.tag_posts, name='tag_posts'),
+    path('taxonomy.json', views.taxonomy_json, name='taxonomy_json'),
+    path('search/suggest/', views.search_suggest, name='search_suggest'),
+    
+    # 날짜별 보관함
+    path('archive/<int:year>/', views.archive_year, name='archive_year'),
+    path('archive/<int:year>/<int:month>/', views.archive_month, name='archive_month'),
     
     # 내 게시글
     path('my-posts/', views.my_posts, name='my_posts'),
     path('my-comments/', views.my_comments, name='my_comments'),
+    path('my-stats/', views.my_stats, name='my_stats'),
     
     # 이미지 업로드
     path('upload/image/', views.image_upload, name='image_upload'),
@@ -60,7 +71,19 @@ urlpatterns = [
         ), 
         name='password_reset_complete'),
     
+    # 읽기 전용 JSON API
+    path('api/v1/posts/', api.post_list, name='api_post_list'),
+    path('api/v1/posts/<int:pk>/', api.post_detail, name='api_post_detail'),
+    path('api/v1/posts/<int:pk>/comments/', api.comment_list, name='api_comment_list'),
+    path('api/v1/categories/', api.category_list, name='api_category_list'),
+    path('api/v1/tags/', api.tag_list, name='api_tag_list'),
+    path('api/v1/authors/<str:username>/', api.author_detail, name='api_author_detail'),
+    
     # 백업 (관리자 전용)
     path('dashboard/backup/', views.backup_dashboard, name='backup_dashboard'),
     path('dashboard/backup/export/<str:data_type>/', views.export_data, name='export_data'),
+    path('dashboard/db/', views.db_status, name='db_status'),
+    path('dashboard/cache/', views.cache_status, name='cache_status'),
+    path('dashboard/moderation/', views.moderation_queue, name='moderation_queue'),
+    path('metrics', views.metrics_view, name='metrics'),
 ]
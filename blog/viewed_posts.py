@@ -0,0 +1,77 @@
+"""
+세션 없이 게시글 조회 중복을 막는 서명 쿠키
+
+방문자가 본 게시글 번호를 블룸 필터(2048비트, 해시 4개)에 담아 서명 쿠키로 보관한다.
+약 200개까지는 오탐률 1% 안팎이며, 그 이상 담기면 필터를 비우고 다시 시작한다.
+세션을 쓰지 않으므로 비로그인 방문자의 조회가 세션 행 생성/저장을 일으키지 않는다.
+"""
+import base64
+import binascii
+import hashlib
+import zlib
+
+from django.conf import settings
+
+COOKIE_NAME = 'viewed_posts'
+COOKIE_SALT = 'blog.viewed_posts'
+NUM_BITS = 2048
+NUM_HASHES = 4
+CAPACITY = 200
+
+
+class ViewedPosts:
+    """조회한 게시글 블룸 필터"""
+
+    def __init__(self, bits=None, count=0):
+        self.bits = bytearray(bits or NUM_BITS // 8)
+        self.count = count
+        self.changed = False
+
+    @classmethod
+    def from_request(cls, request):
+        value = request.get_signed_cookie(COOKIE_NAME, default=None, salt=COOKIE_SALT)
+        if not value:
+            return cls()
+        try:
+            count, _, data = value.partition('.')
+            count = int(count)
+            bits = zlib.decompress(base64.urlsafe_b64decode(data))
+        except (ValueError, binascii.Error, zlib.error):
+            return cls()
+        if len(bits) != NUM_BITS // 8:
+            return cls()
+        return cls(bits, count)
+
+    def _positions(self, post_pk):
+        digest = hashlib.blake2b(str(post_pk).encode(), digest_size=8).digest()
+        h1 = int.from_bytes(digest[:4], 'big')
+        h2 = int.from_bytes(digest[4:], 'big') | 1
+        return [(h1 + i * h2) % NUM_BITS for i in range(NUM_HASHES)]
+
+    def __contains__(self, post_pk):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(post_pk))
+
+    def add(self, post_pk):
+        if self.count >= CAPACITY:
+            # 가득 차면 오탐률이 급격히 오르므로 새로 시작
+            self.bits = bytearray(NUM_BITS // 8)
+            self.count = 0
+        for p in self._positions(post_pk):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+        self.changed = True
+
+    def save(self, response):
+        """변경된 경우에만 쿠키 갱신"""
+        if not self.changed:
+            return
+        data = base64.urlsafe_b64encode(zlib.compress(bytes(self.bits), 9)).decode()
+        response.set_signed_cookie(
+            COOKIE_NAME,
+            f'{self.count}.{data}',
+            salt=COOKIE_SALT,
+            max_age=settings.SESSION_COOKIE_AGE,
+            httponly=True,
+            samesite='Lax',
+            secure=settings.SESSION_COOKIE_SECURE,
+        )
@@ -1,17 +1,28 @@
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+from django.db.models.functions import Coalesce, Now
 from django.utils import timezone
-from django.http import JsonResponse
-import json
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.crypto import constant_time_compare
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import etag
+from django.db import IntegrityError, connections, transaction
+import time
+from . import analytics, archive, metrics, prerender, suggest, surrogate, trending
+from .cache import blog_cache
 from .models import Post, Comment, Category, Tag, CommentReport, PostImage, UserProfile
 from .forms import PostForm, CommentForm, SignUpForm, UserProfileForm
+from .paginators import KnownCountPaginator
 from django.contrib.auth.models import User
-from django_ratelimit.decorators import ratelimit
-from django_ratelimit.exceptions import Ratelimited
+from .ratelimit import rate_limit
+from .tasks import enqueue, process_post_image
+from .taxonomy import get_category_or_404, get_tag_or_404, get_taxonomy
+from .viewed_posts import ViewedPosts
 
 
 def get_published_posts():
@@ -27,9 +38,24 @@ def get_published_posts():
     )
 
 
-def post_list(request):
-    """게시글 목록"""
-    posts = get_published_posts()
+POPULAR_POSTS_CACHE_TIMEOUT = 60
+
+
+def query_popular_posts():
+    """인기글 (조회수 Top 5) 조회"""
+    return list(get_published_posts().order_by('-views')[:5])
+
+
+def get_popular_posts(scope=trending.GLOBAL_SCOPE):
+    """인기글 - 트렌딩 순위, 아직 집계된 조회가 없으면 전체 조회수 Top 5 (2단계 캐시, 최대 1분 지연 허용)"""
+    return trending.get_trending_posts(scope) or blog_cache.get_or_set(
+        'posts', 'popular', query_popular_posts, POPULAR_POSTS_CACHE_TIMEOUT
+    )
+
+
+def filter_post_list(request):
+    """게시글 목록 검색/정렬 적용 (동기/비동기 뷰 공용)"""
+    posts = get_published_posts().select_related('author', 'category')
     
     # 검색 기능
     query = request.GET.get('q')
@@ -45,13 +71,61 @@ def post_list(request):
     else:  # latest
         posts = posts.order_by('-created_at')
     
+    return posts, query, sort
+
+
+def get_post_visibility(post, user):
+    """게시글 열람 권한 판단 - (작성자 여부, 발행 여부) 반환"""
+    is_author = user.is_authenticated and post.author_id == user.pk
+    is_viewable = post.is_public and post.status == 'published'
+    is_scheduled_published = bool(
+        post.status == 'scheduled' and 
+        post.published_at and 
+        post.published_at <= timezone.now()
+    )
+    return is_author, is_viewable or is_scheduled_published
+
+
+def count_post_view(request, post):
+    """조회 기록 (서명 쿠키 기반 중복 방지) - 응답에 저장할 ViewedPosts 반환, 사전 렌더링 중이면 None
+    Post.views 는 조회 버퍼를 적재할 때 묶어서 더해지고(blog.analytics), 여기서는 화면에 보일 값만 올림"""
+    if prerender.is_prerendering():
+        return None
+    viewed = ViewedPosts.from_request(request)
+    if post.pk not in viewed:
+        analytics.record_hit(request, post)
+        post.views += 1
+        viewed.add(post.pk)
+    return viewed
+
+
+def merge_related_posts(category_posts, tag_posts, limit=5):
+    """같은 카테고리 글 뒤에 같은 태그 글을 중복 없이 이어붙임"""
+    related_posts = list(category_posts)
+    existing_ids = {p.pk for p in related_posts}
+    for p in tag_posts:
+        if len(related_posts) >= limit:
+            break
+        if p.pk not in existing_ids:
+            related_posts.append(p)
+            existing_ids.add(p.pk)
+    return related_posts
+
+
+def post_list(request):
+    """게시글 목록"""
+    posts, query, sort = filter_post_list(request)
+    
     # 페이지네이션
     paginator = Paginator(posts, 10)
     page = request.GET.get('page')
     posts = paginator.get_page(page)
     
     # 인기글 (조회수 Top 5)
-    popular_posts = get_published_posts().order_by('-views')[:5]
+    popular_posts = get_popular_posts()
+    
+    surrogate.add_keys(request, surrogate.POST_LIST)
+    surrogate.add_posts(request, [*posts, *popular_posts])
     
     return render(request, 'blog/post_list.html', {
         'posts': posts,
@@ -63,56 +137,54 @@ def post_list(request):
 
 def post_detail(request, pk):
     """게시글 상세"""
-    post = get_object_or_404(Post, pk=pk)
+    post = get_object_or_404(
+        Post.objects.select_related('author', 'category').prefetch_related('tags'),
+        pk=pk
+    )
     
     # 비공개 글 또는 미발행 글은 작성자만 볼 수 있음
-    is_author = request.user.is_authenticated and post.author == request.user
-    is_viewable = post.is_public and post.status == 'published'
-    is_scheduled_published = (
-        post.status == 'scheduled' and 
-        post.published_at and 
-        post.published_at <= timezone.now()
-    )
+    is_author, is_published = get_post_visibility(post, request.user)
     
-    if not is_author and not (is_viewable or is_scheduled_published):
+    if not is_author and not is_published:
         messages.error(request, '이 글을 볼 권한이 없습니다.')
         return redirect('post_list')
     
     # 댓글 허용 여부 - 발행된 글만 댓글 가능
-    can_comment = is_viewable or is_scheduled_published
+    can_comment = is_published
     
-    # 조회수 증가 (세션 기반 중복 방지) - 발행된 글만
-    if is_viewable or is_scheduled_published:
-        session_key = f'viewed_post_{pk}'
-        if not request.session.get(session_key, False):
-            post.increment_views()
-            request.session[session_key] = True
+    # 조회수 증가 (쿠키 기반 중복 방지, 세션 미사용) - 발행된 글만
+    viewed = count_post_view(request, post) if is_published else None
     
-    comments = post.comments.all()
+    comments = post.comments.select_related('author')
     comment_form = CommentForm()
     
     # 인기글 (조회수 Top 5)
-    popular_posts = get_published_posts().order_by('-views')[:5]
+    popular_posts = get_popular_posts()
     
     # 관련 글 추천 (같은 카테고리 또는 같은 태그)
+    # 태그는 prefetch 되어 있으므로 exists()/all() 이 추가 쿼리를 만들지 않음
+    tag_ids = [tag.pk for tag in post.tags.all()]
     related_posts = []
-    if post.category or post.tags.exists():
-        related_query = get_published_posts().exclude(pk=post.pk)
+    if post.category_id or tag_ids:
+        # 관련 글 카드에 카테고리가 보이므로 함께 읽음 (카드마다 쿼리하지 않도록)
+        related_query = get_published_posts().exclude(pk=post.pk).select_related('category', 'author')
+        category_posts = []
+        tag_posts = []
         
-        if post.category:
+        if post.category_id:
             # 같은 카테고리 글
-            category_posts = related_query.filter(category=post.category)[:3]
-            related_posts.extend(category_posts)
+            category_posts = related_query.filter(category_id=post.category_id)[:3]
+        
+        if tag_ids:
+            # 같은 태그를 가진 글 (중복은 병합 시 제외)
+            tag_posts = related_query.filter(tags__in=tag_ids).distinct()[:8]
         
-        if post.tags.exists() and len(related_posts) < 5:
-            # 같은 태그를 가진 글 (중복 제외)
-            existing_ids = [p.pk for p in related_posts]
-            tag_posts = related_query.filter(
-                tags__in=post.tags.all()
-            ).exclude(pk__in=existing_ids).distinct()[:5 - len(related_posts)]
-            related_posts.extend(tag_posts)
-    
-    return render(request, 'blog/post_detail.html', {
+        related_posts = merge_related_posts(category_posts, tag_posts)
+    
+    # 관련 글/인기글 제목도 보이므로 그 글들이 바뀌어도 퍼지되도록
+    surrogate.add_posts(request, [post, *related_posts, *popular_posts])
+    
+    response = render(request, 'blog/post_detail.html', {
         'post': post,
         'comments': comments,
         'comment_form': comment_form,
@@ -120,6 +192,9 @@ def post_detail(request, pk):
         'can_comment': can_comment,
         'related_posts': related_posts,
     })
+    if viewed is not None:
+        viewed.save(response)
+    return response
 
 
 @login_required
@@ -145,14 +220,10 @@ def post_create(request):
     else:
         form = PostForm()
     
-    # 카테고리별 태그 데이터 전달
-    categories = Category.objects.all()
-    tags_by_category = {cat.id: list(cat.tags.values('id', 'name')) for cat in categories}
-    
+    # 카테고리별 태그 데이터는 폼 페이지에서 taxonomy_json 으로 불러옴
     return render(request, 'blog/post_form.html', {
         'form': form,
         'action': '작성',
-        'tags_by_category': json.dumps(tags_by_category)
     })
 
 
@@ -183,14 +254,10 @@ def post_update(request, pk):
     else:
         form = PostForm(instance=post)
     
-    # 카테고리별 태그 데이터 전달
-    categories = Category.objects.all()
-    tags_by_category = {cat.id: list(cat.tags.values('id', 'name')) for cat in categories}
-    
+    # 카테고리별 태그 데이터는 폼 페이지에서 taxonomy_json 으로 불러옴
     return render(request, 'blog/post_form.html', {
         'form': form,
         'action': '수정',
-        'tags_by_category': json.dumps(tags_by_category)
     })
 
 
@@ -213,7 +280,7 @@ def post_delete(request, pk):
 
 
 @login_required
-@ratelimit(key='user', rate='30/h', method='POST', block=True)
+@rate_limit(key='user', rate='30/h')
 def comment_create(request, pk):
     """댓글 작성"""
     post = get_object_or_404(Post, pk=pk)
@@ -257,7 +324,7 @@ def comment_delete(request, pk, comment_pk):
     return redirect('post_detail', pk=pk)
 
 
-@ratelimit(key='ip', rate='5/h', method='POST', block=True)
+@rate_limit(key='ip', rate='5/h')
 def signup(request):
     """회원가입"""
     if request.method == 'POST':
@@ -316,9 +383,35 @@ def my_comments(request):
     })
 
 
+STATS_PERIODS = (7, 30, 90)
+STATS_CACHE_TIMEOUT = 60
+
+
+@login_required
+def my_stats(request):
+    """내 게시글 조회 통계 (분석 집계 테이블만 사용)"""
+    try:
+        days = int(request.GET.get('days', 30))
+    except ValueError:
+        days = 30
+    if days not in STATS_PERIODS:
+        days = 30
+    
+    stats = blog_cache.get_or_set(
+        'analytics', f'{request.user.pk}:{days}',
+        lambda: analytics.query_author_stats(request.user.pk, days), STATS_CACHE_TIMEOUT
+    )
+    
+    return render(request, 'blog/my_stats.html', {
+        'stats': stats,
+        'days': days,
+        'periods': STATS_PERIODS,
+    })
+
+
 def category_posts(request, slug):
     """카테고리별 게시글 목록"""
-    category = get_object_or_404(Category, slug=slug)
+    category = get_category_or_404(slug)
     now = timezone.now()
     # 발행된 글만 (status=published 또는 예약발행 시간 지난 글)
     posts = Post.objects.filter(
@@ -344,8 +437,11 @@ def category_posts(request, slug):
     page = request.GET.get('page')
     posts = paginator.get_page(page)
     
-    # 인기글
-    popular_posts = get_published_posts().order_by('-views')[:5]
+    # 인기글 (카테고리 트렌딩)
+    popular_posts = get_popular_posts(trending.category_scope(category.pk))
+    
+    surrogate.add_keys(request, surrogate.category_key(category.slug))
+    surrogate.add_posts(request, [*posts, *popular_posts])
     
     return render(request, 'blog/category_posts.html', {
         'category': category,
@@ -357,7 +453,7 @@ def category_posts(request, slug):
 
 def tag_posts(request, slug):
     """태그별 게시글 목록"""
-    tag = get_object_or_404(Tag, slug=slug)
+    tag = get_tag_or_404(slug)
     now = timezone.now()
     # 발행된 글만 (status=published 또는 예약발행 시간 지난 글)
     posts = Post.objects.filter(
@@ -383,8 +479,11 @@ def tag_posts(request, slug):
     page = request.GET.get('page')
     posts = paginator.get_page(page)
     
-    # 인기글
-    popular_posts = get_published_posts().order_by('-views')[:5]
+    # 인기글 (태그 트렌딩)
+    popular_posts = get_popular_posts(trending.tag_scope(tag.pk))
+    
+    surrogate.add_keys(request, surrogate.tag_key(tag.slug))
+    surrogate.add_posts(request, [*posts, *popular_posts])
     
     return render(request, 'blog/tag_posts.html', {
         'tag': tag,
@@ -397,39 +496,42 @@ def tag_posts(request, slug):
 @login_required
 def comment_report(request, pk, comment_pk):
     """댓글 신고"""
-    comment = get_object_or_404(Comment, pk=comment_pk)
-    post = get_object_or_404(Post, pk=pk)
+    comment = get_object_or_404(Comment.objects.only('author_id'), pk=comment_pk, post_id=pk)
     
     # 자기 댓글은 신고 불가
-    if comment.author == request.user:
+    if comment.author_id == request.user.pk:
         messages.error(request, '자신의 댓글은 신고할 수 없습니다.')
         return redirect('post_detail', pk=pk)
     
-    # 이미 신고한 경우
-    if CommentReport.objects.filter(comment=comment, reporter=request.user).exists():
-        messages.warning(request, '이미 신고한 댓글입니다.')
-        return redirect('post_detail', pk=pk)
-    
     if request.method == 'POST':
         reason = request.POST.get('reason', 'other')
-        detail = request.POST.get('detail', '')
-        
-        # 신고 생성
-        CommentReport.objects.create(
-            comment=comment,
-            reporter=request.user,
-            reason=reason,
-            detail=detail
-        )
-        
-        # 신고 횟수 증가
-        comment.report_count += 1
+        if reason not in dict(CommentReport.REASON_CHOICES):
+            reason = 'other'
         
-        # 신고 3회 이상 시 자동 숨김
-        if comment.report_count >= 3:
-            comment.is_hidden = True
-        
-        comment.save()
+        try:
+            with transaction.atomic():
+                # 중복 신고는 (comment, reporter) 유니크 제약으로 막음 - 동시 요청도 안전
+                CommentReport.objects.create(
+                    comment_id=comment_pk,
+                    reporter=request.user,
+                    reason=reason,
+                    detail=request.POST.get('detail', '')
+                )
+                # 신고 횟수 증가와 자동 숨김을 UPDATE 한 번으로 (우변의 report_count 는 증가 전 값)
+                Comment.objects.filter(pk=comment_pk).update(
+                    report_count=F('report_count') + 1,
+                    last_reported_at=Now(),
+                    updated_at=Now(),
+                    is_hidden=Case(
+                        When(report_count__gte=Comment.AUTO_HIDE_REPORT_COUNT - 1, then=Value(True)),
+                        default=F('is_hidden'),
+                    ),
+                )
+                # 자동 숨김될 수 있으므로 (update() 는 시그널을 보내지 않음)
+                surrogate.purge(surrogate.post_key(pk))
+        except IntegrityError:
+            messages.warning(request, '이미 신고한 댓글입니다.')
+            return redirect('post_detail', pk=pk)
         messages.success(request, '신고가 접수되었습니다.')
     
     return redirect('post_detail', pk=pk)
@@ -442,18 +544,139 @@ def comment_hide(request, pk, comment_pk):
         messages.error(request, '권한이 없습니다.')
         return redirect('post_detail', pk=pk)
     
-    comment = get_object_or_404(Comment, pk=comment_pk)
-    comment.is_hidden = not comment.is_hidden
-    comment.save()
+    comments = Comment.objects.filter(pk=comment_pk)
+    if not comments.update(
+        is_hidden=Case(When(is_hidden=True, then=Value(False)), default=Value(True)), updated_at=Now(),
+    ):
+        raise Http404('댓글이 없습니다.')
     
-    action = '숨김' if comment.is_hidden else '표시'
+    is_hidden, post_id = comments.values_list('is_hidden', 'post_id').first()
+    surrogate.purge(surrogate.post_key(post_id))
+    action = '숨김' if is_hidden else '표시'
     messages.success(request, f'댓글이 {action} 처리되었습니다.')
     
     return redirect('post_detail', pk=pk)
 
 
+MODERATION_ACTIONS = {
+    # 검토를 마친 댓글은 report_count 를 0 으로 돌려 대기열에서 뺀다 (신고 기록은 남김)
+    'hide': {'is_hidden': True, 'report_count': 0},
+    'dismiss': {'is_hidden': False, 'report_count': 0},
+}
+
+
+@login_required
+def moderation_queue(request):
+    """신고된 댓글 검토 대기열 (관리자 전용)"""
+    if not request.user.is_staff:
+        messages.error(request, '관리자만 접근할 수 있습니다.')
+        return redirect('post_list')
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        comment_ids = [value for value in request.POST.getlist('comments') if value.isdigit()]
+        if action not in MODERATION_ACTIONS or not comment_ids:
+            messages.error(request, '처리할 댓글과 작업을 선택해 주세요.')
+        else:
+            comments = Comment.objects.filter(pk__in=comment_ids, report_count__gt=0)
+            post_ids = set(comments.values_list('post_id', flat=True))
+            updated = comments.update(**MODERATION_ACTIONS[action], updated_at=Now())
+            surrogate.purge(*map(surrogate.post_key, post_ids))
+            label = '숨김' if action == 'hide' else '신고 기각'
+            messages.success(request, f'댓글 {updated}개를 {label} 처리했습니다.')
+        return redirect(request.get_full_path())
+    
+    queue = Comment.objects.filter(report_count__gt=0).select_related(
+        'author', 'post'
+    ).only(
+        'content', 'created_at', 'is_hidden', 'report_count', 'last_reported_at',
+        'author__username', 'post__title',
+    ).order_by('-report_count', '-last_reported_at')
+    
+    paginator = Paginator(queue, 30)
+    comments = paginator.get_page(request.GET.get('page'))
+    
+    # 현재 페이지 댓글의 신고 사유별 건수 (쿼리 1번)
+    reasons = {}
+    for comment_id, reason, count in CommentReport.objects.filter(
+        comment_id__in=[comment.pk for comment in comments]
+    ).values_list('comment_id', 'reason').annotate(count=Count('pk')).order_by():
+        reasons.setdefault(comment_id, []).append((dict(CommentReport.REASON_CHOICES)[reason], count))
+    for comment in comments:
+        comment.reason_counts = reasons.get(comment.pk, [])
+    
+    return render(request, 'blog/moderation_queue.html', {
+        'comments': comments,
+        'auto_hide_count': Comment.AUTO_HIDE_REPORT_COUNT,
+    })
+
+
+def archive_year(request, year):
+    """연도별 보관함"""
+    return _archive_page(request, year)
+
+
+def archive_month(request, year, month):
+    """월별 보관함"""
+    if not 1 <= month <= 12:
+        raise Http404('잘못된 월입니다.')
+    return _archive_page(request, year, month)
+
+
+def _archive_page(request, year, month=None):
+    """보관함 목록 - 글 수는 월별 요약 테이블에서, 목록은 작성일 범위 인덱스 스캔으로"""
+    year_entry = next((entry for entry in archive.get_archive_years() if entry['year'] == year), None)
+    if year_entry is None:
+        raise Http404('보관된 게시글이 없습니다.')
+    if month is None:
+        count = year_entry['post_count']
+        start, end = archive.year_range(year)
+    else:
+        count = next((entry['post_count'] for entry in year_entry['months'] if entry['month'] == month), 0)
+        if not count:
+            raise Http404('보관된 게시글이 없습니다.')
+        start, end = archive.month_range(year, month)
+    
+    posts = get_published_posts().filter(
+        created_at__gte=start, created_at__lt=end
+    ).select_related('author', 'category').prefetch_related('tags').order_by('-created_at')
+    
+    paginator = KnownCountPaginator(posts, 10, count=count)
+    page = request.GET.get('page')
+    posts = paginator.get_page(page)
+    
+    surrogate.add_keys(request, surrogate.POST_LIST)
+    surrogate.add_posts(request, posts)
+    
+    return render(request, 'blog/archive.html', {
+        'posts': posts,
+        'year': year,
+        'month': month,
+        'year_entry': year_entry,
+    })
+
+
+def search_suggest(request):
+    """검색어 자동완성 JSON (프로세스 안 접두어 색인, DB 조회 없음)"""
+    query = request.GET.get('q', '').strip()[:suggest.MAX_KEY_LENGTH]
+    response = JsonResponse(
+        {'query': query, 'results': suggest.suggest(query) if query else []},
+        json_dumps_params={'ensure_ascii': False},
+    )
+    patch_cache_control(response, public=True, max_age=30)
+    return response
+
+
+@etag(lambda request: get_taxonomy()['etag'])
+def taxonomy_json(request):
+    """카테고리/태그 트리 JSON (ETag 로 브라우저 캐시 재검증)"""
+    response = HttpResponse(get_taxonomy()['json'], content_type='application/json')
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
 @login_required
-@ratelimit(key='user', rate='20/h', method='POST', block=True)
+@rate_limit(key='user', rate='20/h', json_response=True)
 def image_upload(request):
     """AJAX 이미지 업로드"""
     if request.method == 'POST' and request.FILES.get('image'):
@@ -473,11 +696,16 @@ def image_upload(request):
             }, status=400)
         
         # 이미지 저장
+        start = time.perf_counter()
         post_image = PostImage.objects.create(
             image=image_file,
             uploaded_by=request.user,
             alt_text=request.POST.get('alt_text', '')
         )
+        metrics.upload_duration.observe(time.perf_counter() - start)
+        
+        # 회전/메타데이터 제거/축소는 워커에서 (업로드 응답을 기다리게 하지 않음)
+        enqueue(process_post_image, args=[post_image.pk], idempotency_key=f'post-image:{post_image.pk}')
         
         return JsonResponse({
             'success': True,
@@ -491,20 +719,20 @@ def image_upload(request):
 
 def user_profile(request, username):
     """사용자 프로필 보기"""
-    profile_user = get_object_or_404(User, username=username)
+    profile_user = get_object_or_404(User.objects.select_related('profile'), username=username)
     
-    # 프로필이 없으면 생성
-    profile, created = UserProfile.objects.get_or_create(user=profile_user)
+    # 프로필이 아직 없으면 저장하지 않은 빈 프로필로 표시 (생성은 편집 시)
+    profile = getattr(profile_user, 'profile', None) or UserProfile(user=profile_user)
     
     # 사용자의 발행된 글
     user_posts = get_published_posts().filter(author=profile_user).order_by('-created_at')[:5]
     
     # 통계
-    stats = {
-        'total_posts': Post.objects.filter(author=profile_user, status='published').count(),
-        'total_views': sum(post.views for post in Post.objects.filter(author=profile_user)),
-        'total_comments': Comment.objects.filter(author=profile_user).count(),
-    }
+    stats = Post.objects.filter(author=profile_user).aggregate(
+        total_posts=Count('pk', filter=Q(status='published')),
+        total_views=Coalesce(Sum('views'), 0),
+    )
+    stats['total_comments'] = Comment.objects.filter(author=profile_user).count()
     
     return render(request, 'blog/profile.html', {
         'profile_user': profile_user,
@@ -517,7 +745,8 @@ def user_profile(request, username):
 @login_required
 def profile_edit(request):
     """내 프로필 편집"""
-    profile, created = UserProfile.objects.get_or_create(user=request.user)
+    # 프로필은 처음 저장할 때 생성
+    profile = UserProfile.objects.filter(user=request.user).first() or UserProfile(user=request.user)
     
     if request.method == 'POST':
         form = UserProfileForm(request.POST, request.FILES, instance=profile)
@@ -557,6 +786,42 @@ def backup_dashboard(request):
     })
 
 
+@login_required
+def db_status(request):
+    """DB 커넥션/풀 상태 (관리자 전용)"""
+    if not request.user.is_staff:
+        return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+    
+    pools = {}
+    if any(conn.settings_dict['ENGINE'] == 'blog.db.postgresql_pool' for conn in connections.all()):
+        from .db.postgresql_pool.base import pool_stats
+        pools = pool_stats()
+    
+    databases = {
+        conn.alias: {
+            'engine': conn.settings_dict['ENGINE'],
+            'conn_max_age': conn.settings_dict['CONN_MAX_AGE'],
+            'conn_health_checks': conn.settings_dict['CONN_HEALTH_CHECKS'],
+            'pool': pools.get(conn.alias),
+        }
+        for conn in connections.all()
+    }
+    
+    return JsonResponse({'databases': databases})
+
+
+@login_required
+def cache_status(request):
+    """2단계 캐시 적중률 (관리자 전용, 현재 워커 기준)"""
+    if not request.user.is_staff:
+        return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+    
+    return JsonResponse({
+        'backend': blog_cache.l2.__class__.__name__,
+        'stats': blog_cache.stats(),
+    })
+
+
 @login_required
 def export_data(request, data_type):
     """데이터 내보내기 (JSON)"""
@@ -591,3 +856,17 @@ def export_data(request, data_type):
     response = HttpResponse(data, content_type='application/json')
     response['Content-Disposition'] = f'attachment; filename="blog_backup_{data_type}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.json"'
     return response
+
+
+def metrics_view(request):
+    """Prometheus 메트릭 (토큰 또는 관리자 전용)"""
+    token = settings.BLOG_METRICS['TOKEN']
+    authorization = request.headers.get('Authorization', '')
+    authorized = (
+        token and constant_time_compare(authorization, f'Bearer {token}')
+    ) or request.user.is_staff
+    if not authorized:
+        return HttpResponse('권한이 없습니다.', status=403, content_type='text/plain; charset=utf-8')
+    return HttpResponse(
+        metrics.registry.exposition(), content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
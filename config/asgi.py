@@ -0,0 +1,14 @@
+"""
+ASGI config for blog project.
+
+실행 예:
+    BLOG_ASYNC_VIEWS=True uvicorn config.asgi:application --workers 4
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+application = get_asgi_application()
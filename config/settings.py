@@ -35,6 +35,8 @@ INSTALLED_APPS = [
 SITE_ID = 1
 
 MIDDLEWARE = [
+    'blog.middleware.PerformanceMiddleware',
+    'blog.surrogate.SurrogateKeyMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -42,13 +44,16 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'blog.middleware.ReplicaRoutingMiddleware',
+    'blog.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # 렌더링 시간을 요청 계측(blog.middleware.PerformanceMiddleware)에 기록
+        'BACKEND': 'blog.instrumentation.TimedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -63,19 +68,93 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
+
+# ASGI 로 서비스할 때 게시글 목록/상세를 비동기 뷰로 연결 (쿼리 동시 실행)
+BLOG_ASYNC_VIEWS = os.environ.get('BLOG_ASYNC_VIEWS', 'False') == 'True'
 
 # Database - PostgreSQL
+# DB_POOL=True 이면 프로세스 공용 커넥션 풀(blog.db.postgresql_pool) 사용
+DB_POOL = os.environ.get('DB_POOL', 'False') == 'True'
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'blog_db',
-        'USER': 'blog_user',
-        'PASSWORD': 'blog_password',
-        'HOST': 'db',
-        'PORT': '5432',
+        'ENGINE': 'blog.db.postgresql_pool' if DB_POOL else 'django.db.backends.postgresql',
+        'NAME': os.environ.get('DB_NAME', 'blog_db'),
+        'USER': os.environ.get('DB_USER', 'blog_user'),
+        'PASSWORD': os.environ.get('DB_PASSWORD', 'blog_password'),
+        'HOST': os.environ.get('DB_HOST', 'db'),
+        'PORT': os.environ.get('DB_PORT', '5432'),
+        # 영속 커넥션 유지 시간(초) - 풀 사용 시에는 요청마다 풀에 반납하도록 0
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 0 if DB_POOL else 60)),
+        # 영속 커넥션 재사용 전 상태 확인
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
+        'OPTIONS': {
+            'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', 5)),
+        },
     }
 }
 
+if DB_POOL:
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+        'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 5)),
+        'check_interval': float(os.environ.get('DB_POOL_CHECK_INTERVAL', 30)),
+        'max_lifetime': float(os.environ.get('DB_POOL_MAX_LIFETIME', 3600)),
+    }
+
+# 읽기 전용 복제본 - DB_REPLICA_HOSTS="replica1:5432,replica2:5432"
+# GET/HEAD 요청의 읽기 쿼리를 복제본으로 분산 (blog.middleware.ReplicaRoutingMiddleware)
+DATABASE_REPLICAS = []
+for index, replica in enumerate(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    replica_host, _, replica_port = replica.strip().partition(':')
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'PORT': replica_port or DATABASES['default']['PORT'],
+        # 복제본이 응답하지 않을 때 요청이 오래 막히지 않도록 연결 시간 제한을 짧게
+        'OPTIONS': {
+            **DATABASES['default']['OPTIONS'],
+            'connect_timeout': int(os.environ.get('DB_REPLICA_CONNECT_TIMEOUT', 2)),
+        },
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica_{index}')
+
+DATABASE_ROUTERS = ['blog.db.routers.ReplicaRouter']
+REPLICA_MAX_LAG = float(os.environ.get('DB_REPLICA_MAX_LAG', 5))  # 허용 복제 지연(초)
+REPLICA_HEALTH_CHECK_INTERVAL = 5  # 복제본 상태 확인 주기(초)
+REPLICA_PIN_COOKIE_NAME = 'db_pin_primary'
+REPLICA_PIN_SECONDS = 10  # 쓰기 후 primary 에 고정할 시간(초)
+
+# Cache - REDIS_URL 이 있으면 Redis, 없으면 파일 기반 캐시 (워커 간 공유)
+# 요청 제한(blog.ratelimit) 카운터는 Redis 일 때만 워커 간에 공유됨 (아니면 워커별로 세고 경고)
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'blog',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', BASE_DIR / '.django_cache'),
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+# 프로세스 내 L1 캐시 (blog.cache.TieredCache)
+BLOG_L1_CACHE = {
+    'MAX_ENTRIES': 512,
+    'TIMEOUT': 30,  # L1 항목 최대 보관 시간(초)
+    'VERSION_CHECK_INTERVAL': 1.0,  # 무효화 버전 확인 주기(초)
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -98,6 +177,131 @@ TIME_ZONE = 'Asia/Seoul'
 USE_I18N = True
 USE_TZ = True
 
+# 요청 성능 계측 (blog.middleware.PerformanceMiddleware)
+BLOG_PERFORMANCE = {
+    'SLOW_REQUEST_MS': float(os.environ.get('BLOG_SLOW_REQUEST_MS', 500)),
+    'SLOW_QUERY_MS': float(os.environ.get('BLOG_SLOW_QUERY_MS', 100)),
+    # 한 요청에서 같은 모양의 쿼리가 이 횟수 이상이면 N+1 의심으로 기록
+    'DUPLICATE_QUERY_THRESHOLD': int(os.environ.get('BLOG_DUPLICATE_QUERY_THRESHOLD', 5)),
+}
+
+# 요청 프로파일링 (blog.middleware.ProfilingMiddleware)
+# 관리자는 X-Profile 헤더 또는 ?_profile=1 (스택 샘플링은 값 'sample') 로 요청
+BLOG_PROFILING = {
+    'SAMPLE_RATE': float(os.environ.get('BLOG_PROFILE_SAMPLE_RATE', 0)),  # 0.001 = 0.1% 요청
+    'MODE': 'cprofile',  # 관리자 요청의 기본 방식 - 'cprofile' 또는 'sample'
+    'SAMPLE_INTERVAL': 0.005,  # 스택 샘플링 간격(초)
+    'MAX_STORED': 500,  # 보관할 최근 프로파일 수
+}
+
+# 메트릭 (blog.metrics) - /metrics 는 TOKEN(Authorization: Bearer) 또는 관리자 로그인으로 접근
+# 멀티 워커(gunicorn 등)에서는 DIR 을 워커들이 함께 쓰는 디렉터리로 지정하고 배포 시 비운다
+BLOG_METRICS = {
+    'DIR': os.environ.get('BLOG_METRICS_DIR') or None,
+    'TOKEN': os.environ.get('BLOG_METRICS_TOKEN', ''),
+    'FLUSH_INTERVAL': 1.0,
+}
+
+# 트렌딩 순위 (blog.trending) - python manage.py refresh_trending 을 5분마다 실행
+BLOG_TRENDING = {
+    'HALF_LIFE_HOURS': 24,  # 조회의 영향이 절반으로 줄어드는 시간
+    'TOP_K': 20,  # 범위(전체/카테고리/태그)별로 미리 계산해 둘 순위 수
+    'BUCKET_RETENTION_DAYS': 30,  # 시간대별 조회수 보관 기간
+}
+
+# 조회 분석 파이프라인 (blog.analytics)
+# SPOOL_DIR 을 설정하면 조회 이벤트를 파일로 모으고 ingest_analytics 명령이 적재 (운영 권장)
+BLOG_ANALYTICS = {
+    'SPOOL_DIR': os.environ.get('BLOG_ANALYTICS_SPOOL_DIR') or None,
+    'BATCH_SIZE': 500,  # 프로세스 버퍼를 내보내는 이벤트 수
+    'FLUSH_INTERVAL': 2.0,  # 버퍼를 내보내는 최대 간격(초)
+    'MAX_BUFFER': 20000,  # 내보내기가 계속 실패할 때 버퍼에 쌓아 둘 최대 이벤트 수
+    'INGEST_BATCH': 5000,  # 한 트랜잭션에 적재할 최대 이벤트 수
+    'EVENT_RETENTION_DAYS': 7,  # 원본 조회 이벤트 보관 기간
+    'DAILY_RETENTION_DAYS': 730,  # 일별 조회수 보관 기간
+    'REFERRER_RETENTION_DAYS': 90,  # 유입 경로별 조회수 보관 기간
+}
+
+# 앞단 HTTP 캐시 서로게이트 키 (blog.surrogate)
+# PURGE_URL 예: Varnish(xkey) http://127.0.0.1:6081/ + PURGE_HEADER='xkey-purge'
+BLOG_SURROGATE = {
+    'HEADER': 'Surrogate-Key',  # 응답에 키를 담는 헤더
+    'MAX_AGE': int(os.environ.get('BLOG_SURROGATE_MAX_AGE', 0)),  # 브라우저 캐시 시간(초)
+    'S_MAXAGE': int(os.environ.get('BLOG_SURROGATE_S_MAXAGE', 600)),  # 앞단 캐시 시간(초) - 퍼지가 늦거나 빠져도 이 안에 갱신
+    'PURGE_URL': os.environ.get('BLOG_SURROGATE_PURGE_URL') or None,
+    'PURGE_METHOD': os.environ.get('BLOG_SURROGATE_PURGE_METHOD', 'PURGE'),
+    'PURGE_HEADER': os.environ.get('BLOG_SURROGATE_PURGE_HEADER', 'Surrogate-Key'),  # 퍼지 요청에 키를 담는 헤더
+    'PURGE_BATCH': 100,  # 퍼지 요청 하나에 담을 최대 키 수
+    'PURGE_TIMEOUT': 5,
+}
+
+# 게시글 카드/사이드바 템플릿 조각 캐시 (blog.fragments)
+BLOG_FRAGMENT_CACHE = {
+    # False 면 조각을 캐시 없이 렌더링 (비교 측정용)
+    'ENABLED': os.environ.get('BLOG_FRAGMENT_CACHE', 'True') == 'True',
+    'TIMEOUT': 60 * 60 * 24,  # 키에 updated_at 이 들어가므로 예전 조각은 만료로 정리됨
+}
+
+# 공개 페이지 정적 사전 렌더링 (blog.prerender) - python manage.py prerender_site
+BLOG_PRERENDER = {
+    'OUTPUT_DIR': os.environ.get('BLOG_PRERENDER_DIR', str(BASE_DIR / 'prerendered')),
+    'HOST': os.environ.get('BLOG_PRERENDER_HOST', 'localhost'),  # 렌더링 요청의 Host (ALLOWED_HOSTS 에 있어야 함)
+}
+
+# 백그라운드 작업 큐 (blog.tasks) - python manage.py run_tasks 로 워커 실행
+BLOG_TASKS = {
+    'THREADS': int(os.environ.get('BLOG_TASK_THREADS', 4)),  # 워커 프로세스당 스레드 수
+    'POLL_INTERVAL': 1.0,  # 대기열이 비었을 때 다시 확인하는 간격(초)
+    'LEASE_SECONDS': 600,  # 실행 중 상태가 이보다 오래되면 워커가 죽은 것으로 보고 다시 대기열로
+    'KEEP_DAYS': 7,  # 완료/실패 작업 보관 기간(일)
+    # True 면 워커 없이 등록 즉시 실행 (개발용)
+    'EAGER': os.environ.get('BLOG_TASKS_EAGER', 'False') == 'True',
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {
+            'format': '[{asctime}] {levelname} {name} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'simple',
+        },
+    },
+    'loggers': {
+        'blog.performance': {
+            'handlers': ['console'],
+            'level': os.environ.get('BLOG_PERFORMANCE_LOG_LEVEL', 'WARNING'),
+            'propagate': False,
+        },
+        'blog.tasks': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'blog.outbox': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'blog.analytics': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'blog.surrogate': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
@@ -117,14 +321,27 @@ LOGIN_URL = 'login'
 
 # Email settings
 # 개발환경: 콘솔로 이메일 출력
-EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
-
-# 운영환경: SMTP 설정 (환경변수 사용)
-# EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-# EMAIL_HOST = os.environ.get('EMAIL_HOST', 'smtp.gmail.com')
-# EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 587))
-# EMAIL_USE_TLS = True
-# EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
-# EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+# 메일은 아웃박스(blog.outbox)에 기록만 하고, send_outbox 명령이 BLOG_OUTBOX['BACKEND'] 로 발송
+EMAIL_BACKEND = 'blog.outbox.OutboxEmailBackend'
+
+# 운영환경: SMTP 설정 (환경변수 사용) - BLOG_OUTBOX_BACKEND=django.core.mail.backends.smtp.EmailBackend
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'False') == 'True'
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_TIMEOUT = 30
+
+BLOG_OUTBOX = {
+    # 실제 발송 백엔드 (개발: 콘솔 출력)
+    'BACKEND': os.environ.get('BLOG_OUTBOX_BACKEND', 'django.core.mail.backends.console.EmailBackend'),
+    'BATCH_SIZE': 50,  # 연결 하나로 한 번에 보낼 메일 수
+    'POLL_INTERVAL': 2.0,  # 보낼 메일이 없을 때 다시 확인하는 간격(초)
+    'MAX_ATTEMPTS': 8,  # 이만큼 실패하면 발송 포기(dead)
+    'RETRY_DELAY': 60,  # 첫 재시도 간격(초), 실패할 때마다 두 배
+    'LEASE_SECONDS': 300,  # 발송 중 상태가 이보다 오래되면 다시 대기로
+    'KEEP_DAYS': 14,  # 발송 완료 메일 보관 기간(일)
+    'DOMAIN_RATES': {'default': 60},  # 수신 도메인별 분당 최대 발송 수 (예: 'gmail.com': 30)
+}
 
 DEFAULT_FROM_EMAIL = '서로소식 블로그 <noreply@seorosik.com>'
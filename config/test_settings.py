@@ -0,0 +1,23 @@
+"""
+테스트 설정 - PostgreSQL 없이 SQLite 로 실행
+
+    python manage.py test blog --settings=config.test_settings
+
+replica_1 은 default 의 테스트 미러라 같은 데이터를 본다. 평소에는 복제본 라우팅을 끄고(DATABASE_REPLICAS = []),
+라우팅 테스트만 override_settings(DATABASE_REPLICAS=['replica_1']) 로 켠다.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import BASE_DIR
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'test.sqlite3',
+    },
+    'replica_1': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'test.sqlite3',
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+DATABASE_REPLICAS = []
@@ -8,6 +8,7 @@ from django.conf.urls.static import static
 from django.contrib.sitemaps.views import sitemap
 from blog.feeds import LatestPostsFeed, CategoryFeed
 from blog.sitemaps import PostSitemap, CategorySitemap, StaticViewSitemap
+from blog.surrogate import FEED, SITEMAP, surrogate_keys
 
 sitemaps = {
     'posts': PostSitemap,
@@ -20,11 +21,12 @@ urlpatterns = [
     path('', include('blog.urls')),
     
     # RSS Feeds
-    path('feed/', LatestPostsFeed(), name='rss_feed'),
-    path('feed/category/<slug:slug>/', CategoryFeed(), name='category_feed'),
+    path('feed/', surrogate_keys(FEED)(LatestPostsFeed()), name='rss_feed'),
+    path('feed/category/<slug:slug>/', surrogate_keys(FEED)(CategoryFeed()), name='category_feed'),
     
     # Sitemap
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
+    path('sitemap.xml', surrogate_keys(SITEMAP)(sitemap), {'sitemaps': sitemaps},
+         name='django.contrib.sitemaps.views.sitemap'),
 ]
 
 if settings.DEBUG: